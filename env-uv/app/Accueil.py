@@ -5,7 +5,9 @@ import utils
 ##################################################################
 #                          DONNEES                               #
 ##################################################################
-TABLE_INTERCLUB = utils.load_table(utils.env, "TABLE_INTERCLUB")
+# Saison affichée et instantané de ses tables, lu par tout le rendu de la page
+SAISON = utils.current_season()
+utils.pin_snapshot(season=SAISON)
 
 ##################################################################
 #                         FONCTIONS                              #
@@ -21,8 +23,8 @@ def match_output(division: str):
     Returns:
         (v,e,d,pts) : (Nombre de victoires, égalités, défaites, somme des points remportés)
     """
-    df = TABLE_INTERCLUB[(TABLE_INTERCLUB["division"] == division)].reset_index(
-        drop=True
+    df = utils.load_table(
+        utils.env, "TABLE_INTERCLUB", columns=["aob_score", "opponent_score"], division=division
     )
     v = (df["aob_score"] > df["opponent_score"]).sum()
     d = (df["aob_score"] < df["opponent_score"]).sum()
@@ -39,6 +41,12 @@ def match_output(division: str):
 
 st.set_page_config(page_title="Accueil", layout="wide")
 
+# Bandeau "données en cache" si la source ne répond pas
+utils.cache_banner()
+
+# Mise à jour automatique quand une rencontre est enregistrée
+utils.live_refresh(("TABLE_INTERCLUB",))
+
 # -- Image du club de badminton d'Orgères (35230)
 html = f"""
 <div style="display:flex; justify-content:center; padding:8px; border-radius:12px">
@@ -47,7 +55,7 @@ html = f"""
 """
 st.markdown(html, unsafe_allow_html=True)
 st.markdown(
-    f"<div style='font-size:1rem; text-align:center; margin-bottom: 40px'>SAISON 2025/26</div>",
+    f"<div style='font-size:1rem; text-align:center; margin-bottom: 40px'>SAISON {SAISON}</div>",
     unsafe_allow_html=True,
 )
 
@@ -0,0 +1,141 @@
+"""Partitions par saison et archives des saisons terminées.
+
+La saison ("2025/26", de septembre à août) d'une rencontre est celle de sa
+date ; les matchs suivent leur rencontre (même id). Une saison terminée est
+écrite une seule fois dans `<archive_dir>/<2024-25>/` :
+
+- les trois tables réduites à la saison, en Parquet compressé (zstd) ;
+- un résumé précalculé (bilan par division, voir `queries.season_summary`),
+  qui sert les agrégats multi-saisons sans relire les tables.
+
+Les fichiers sont passés en lecture seule et une saison déjà archivée n'est
+jamais réécrite. Avec `--purge`, les rencontres et matchs archivés sont
+ensuite retirés de la source : le Google Sheet ne garde que la saison en cours.
+
+    python app/archive.py 2024/25 [--purge] [--club=aob]
+"""
+
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+import queries
+import sampling
+
+SUMMARY = "summary.parquet"
+
+
+def season_dir(archive_dir: Path, season: str) -> Path:
+    """Dossier d'une saison archivée ("2024/25" -> "2024-25")."""
+    return Path(archive_dir) / season.replace("/", "-")
+
+
+def seasons_of(interclub: pd.DataFrame) -> list[str]:
+    """Saisons présentes dans TABLE_INTERCLUB, de la plus récente à la plus ancienne."""
+    found = sampling.season(interclub["date"])
+    return sorted({s for s in found if s}, reverse=True)
+
+
+def split_season(tables, season: str) -> dict[str, pd.DataFrame]:
+    """Tables réduites à une saison (TABLE_PLAYERS est gardée en entier).
+
+    Args:
+        tables (Mapping[str, pd.DataFrame]): TABLE_INTERCLUB, TABLE_MATCHS et
+            TABLE_PLAYERS typées.
+        season (str): Saison ("2024/25").
+
+    Returns:
+        dict[str, pd.DataFrame]: Les mêmes tables, lignes de la saison seulement.
+    """
+    interclub = tables["TABLE_INTERCLUB"]
+    in_season = (sampling.season(interclub["date"]) == season).to_numpy(dtype=bool)
+    interclub = interclub[in_season].reset_index(drop=True)
+    matchs = tables["TABLE_MATCHS"]
+    matchs = matchs[matchs["id"].isin(interclub["id"]).to_numpy(dtype=bool)].reset_index(drop=True)
+    return {**tables, "TABLE_INTERCLUB": interclub, "TABLE_MATCHS": matchs}
+
+
+def summarize(tables, season: str) -> pd.DataFrame:
+    """Bilan par division d'une saison (une ligne par division)."""
+    summary = queries.run(
+        "season_summary",
+        {"interclub": tables["TABLE_INTERCLUB"], "matchs": tables["TABLE_MATCHS"]},
+    )
+    summary.insert(0, "season", season)
+    return summary
+
+
+def archived_seasons(archive_dir: Path) -> list[str]:
+    """Saisons archivées, de la plus récente à la plus ancienne."""
+    if not Path(archive_dir).is_dir():
+        return []
+    return sorted(
+        (d.name.replace("-", "/") for d in Path(archive_dir).iterdir() if (d / SUMMARY).exists()),
+        reverse=True,
+    )
+
+
+def load_season(archive_dir: Path, season: str, tables: tuple) -> dict[str, pd.DataFrame]:
+    """Relit les tables d'une saison archivée."""
+    path = season_dir(archive_dir, season)
+    return {table: pd.read_parquet(path / f"{table}.parquet") for table in tables}
+
+
+def load_summaries(archive_dir: Path) -> pd.DataFrame:
+    """Résumés de toutes les saisons archivées (vide si aucune)."""
+    frames = [
+        pd.read_parquet(season_dir(archive_dir, season) / SUMMARY)
+        for season in archived_seasons(archive_dir)
+    ]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def write_season(archive_dir: Path, season: str, tables) -> Path:
+    """Écrit l'archive d'une saison (tables réduites à la saison + résumé).
+
+    L'archive est écrite à côté puis renommée : une archive interrompue n'est
+    jamais visible. Ses fichiers sont ensuite en lecture seule.
+
+    Args:
+        archive_dir (Path): Dossier des archives.
+        season (str): Saison ("2024/25").
+        tables (Mapping[str, pd.DataFrame]): Tables typées (toutes saisons).
+
+    Returns:
+        Path: Dossier de la saison archivée.
+
+    Raises:
+        FileExistsError: La saison est déjà archivée.
+        ValueError: Aucune rencontre pour cette saison.
+    """
+    target = season_dir(archive_dir, season)
+    if target.exists():
+        raise FileExistsError(f"Saison {season} déjà archivée : {target}")
+    partition = split_season(tables, season)
+    if partition["TABLE_INTERCLUB"].empty:
+        raise ValueError(f"Aucune rencontre pour la saison {season}")
+
+    tmp = target.with_name(target.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    for table, df in partition.items():
+        df.to_parquet(tmp / f"{table}.parquet", index=False, compression="zstd")
+    summarize(partition, season).to_parquet(tmp / SUMMARY, index=False, compression="zstd")
+    for path in tmp.iterdir():
+        os.chmod(path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    os.replace(tmp, target)
+    return target
+
+
+if __name__ == "__main__":
+    # python app/archive.py <saison> [--purge] [--club=<club>]
+    import utils
+
+    season, purge = sys.argv[1], "--purge" in sys.argv[2:]
+    club = next((arg.split("=", 1)[1] for arg in sys.argv[2:] if arg.startswith("--club=")), utils.DEFAULT_CLUB)
+    path = utils.archive_season(season, purge=purge, club=club)
+    print(f"Saison {season} archivée : {path}" + (" (retirée de la source)" if purge else ""))
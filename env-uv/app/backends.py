@@ -0,0 +1,948 @@
+"""Sources de données des tables : Google Sheets, CSV ou SQLite.
+
+Chaque backend charge les tables brutes et y ajoute des lignes. Il est choisi
+par `env` dans config.yaml ("prod" -> Google Sheets, "dev" -> CSV,
+"sqlite" -> fichier SQLite local). Le typage (`schema.py`) et le cache en
+mémoire (`store.py`) sont communs à tous les backends.
+
+Import d'un jeu de CSV (séparateur ";") dans une base SQLite :
+
+    python app/backends.py data/interclub.sqlite interclub.csv matchs.csv players.csv
+"""
+
+import csv
+import datetime as dt
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import quota
+import resilience
+import sampling
+import schema
+import sharedcache
+import sheets
+import snapshot
+
+
+def to_native(v):
+    # NaN/NaT -> ""
+    if (
+        v is None
+        or (isinstance(v, float) and pd.isna(v))
+        or (isinstance(v, str) and v == "nan")
+    ):
+        return ""
+    if isinstance(v, (pd.Timestamp, dt.datetime, dt.date)):
+        return v.isoformat()
+    if isinstance(v, np.generic):  # numpy.int64, float64, bool_...
+        return v.item()
+    return v
+
+
+# Texte d'un nombre ("1000", "-12", "3.5") : converti en nombre par USER_ENTERED
+_NUMBER = re.compile(r"-?\d+(\.\d+)?")
+
+
+def to_raw_cell(v):
+    """Valeur d'une cellule écrite en RAW (voir `SheetsBackend.append_rows`).
+
+    RAW écrit le texte tel quel : un nombre passé en texte ("1000") resterait
+    du texte dans le Sheet. Il est écrit en nombre, comme le ferait
+    USER_ENTERED ; les autres textes ("21/15", "1/2") restent du texte.
+    """
+    v = to_native(v)
+    if isinstance(v, str) and _NUMBER.fullmatch(v):
+        return float(v) if "." in v else int(v)
+    return v
+
+
+def values_to_df(values: list[list], table: str | None = None) -> pd.DataFrame:
+    """Construit un DataFrame à partir d'une plage brute (1re ligne = en-têtes).
+
+    Les colonnes sont construites directement depuis la matrice (sans passer
+    par un dict par ligne), dans le type déclaré par le schéma de la table.
+    Les plages sont lues en UNFORMATTED_VALUE : les nombres arrivent déjà en
+    nombres, il n'y a rien à deviner cellule par cellule.
+
+    Args:
+        values (list[list]): Plage brute (lignes, éventuellement incomplètes).
+        table (str, optional): Nom de la table (schéma des colonnes).
+
+    Returns:
+        pd.DataFrame: Table typée (colonnes hors schéma : valeurs telles quelles).
+    """
+    if not values:
+        return pd.DataFrame()
+    headers, rows = values[0], values[1:]
+    width = len(headers)
+    columns = zip(*[(list(row) + [""] * width)[:width] for row in rows]) if rows else [()] * width
+    df = pd.DataFrame(
+        {header: pd.Series(col, dtype=object) for header, col in zip(headers, columns)},
+        columns=headers,
+    )
+    return schema.apply_schema(table, df) if table else df
+
+
+def filter_bounds(
+    division=None, season: str | None = None, date_from=None, date_to=None
+) -> tuple[list | None, pd.Timestamp | None, pd.Timestamp | None]:
+    """Normalise les filtres simples d'une lecture.
+
+    Args:
+        division (str | list, optional): Division(s) gardée(s).
+        season (str, optional): Saison gardée ("2025/26").
+        date_from (optional): Première date gardée (incluse).
+        date_to (optional): Dernière date gardée (incluse).
+
+    Returns:
+        tuple: (divisions, première date, dernière date), None si non filtré.
+    """
+    divisions = None
+    if division is not None:
+        divisions = [division] if isinstance(division, str) else list(division)
+    start = pd.Timestamp(date_from) if date_from is not None else None
+    end = pd.Timestamp(date_to) if date_to is not None else None
+    if season is not None:
+        first, last = sampling.season_bounds(season)
+        start = first if start is None else max(start, first)
+        end = last if end is None else min(end, last)
+    return divisions, start, end
+
+
+def filter_frame(df: pd.DataFrame, columns: list | None = None, **filters) -> pd.DataFrame:
+    """Filtre (division, saison, dates) puis projection d'une table typée.
+
+    Args:
+        df (pd.DataFrame): Table typée (voir `schema.apply_schema`).
+        columns (list, optional): Colonnes gardées (toutes par défaut).
+        **filters: Voir `filter_bounds`.
+
+    Returns:
+        pd.DataFrame: Lignes et colonnes demandées (index renuméroté).
+    """
+    divisions, start, end = filter_bounds(**filters)
+    mask = pd.Series(True, index=df.index)
+    if divisions is not None:
+        mask &= df[_filter_column(df, "division")].astype(str).isin(divisions)
+    if start is not None:
+        mask &= df[_filter_column(df, "date")] >= start
+    if end is not None:
+        mask &= df[_filter_column(df, "date")] < end + pd.Timedelta(days=1)
+    if not mask.all():
+        df = df[mask].reset_index(drop=True)
+    return df if columns is None else df[list(columns)]
+
+
+def _filter_column(df: pd.DataFrame, col: str) -> str:
+    if col not in df.columns:
+        raise ValueError(f"Filtre impossible : pas de colonne '{col}' dans cette table")
+    return col
+
+
+def _read_columns(table: str, columns: list | None, filters: dict) -> list | None:
+    """Colonnes à lire à la source : celles demandées et celles des filtres."""
+    if columns is None:
+        return None
+    divisions, start, end = filter_bounds(**filters)
+    extra = (["division"] if divisions is not None else []) + (
+        ["date"] if start is not None or end is not None else []
+    )
+    return list(dict.fromkeys([*columns, *extra]))
+
+
+def to_sql(v):
+    """Valeur d'une cellule pour SQLite (cellule vide, <NA> ou NaT -> NULL)."""
+    # Avant to_native : `pd.NA == ""` lève TypeError et NaT deviendrait "NaT"
+    if pd.api.types.is_scalar(v) and pd.isna(v):
+        return None
+    v = to_native(v)
+    return None if v == "" else v
+
+
+def _fit(row: list, width: int) -> list[str]:
+    """Ligne ramenée à `width` cellules texte (les plages lues omettent les
+    cellules vides en fin de ligne, le snapshot les complète)."""
+    return [str(v) for v in (list(row) + [""] * width)[:width]]
+
+
+def read_csv(path: str, table: str, columns: list | None = None) -> pd.DataFrame:
+    """Lit un CSV (séparateur ";") avec le moteur pyarrow.
+
+    Les colonnes entières du schéma sont lues en entiers nullables, les autres
+    en texte Arrow (le typage complet est fait ensuite par `schema.apply_schema`).
+    Avec `columns`, seules ces colonnes sont décodées.
+    """
+    with open(path, "r", newline="") as f:
+        headers = next(csv.reader(f, delimiter=";"), [])
+    declared = schema.SCHEMAS.get(table, {})
+    dtypes = {
+        col: declared[col] if declared[col].startswith("Int") else schema.TEXT
+        for col in headers
+        if col in declared and (columns is None or col in columns)
+    }
+    try:
+        return pd.read_csv(path, sep=";", engine="pyarrow", dtype=dtypes, usecols=columns)
+    except (ImportError, ValueError):
+        # CSV que pyarrow ne sait pas lire (ou pyarrow absent) : moteur par défaut
+        return pd.read_csv(path, sep=";", usecols=columns)
+
+
+class Backend:
+    """Interface commune des backends de données."""
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        """Charge les tables, brutes ou déjà typées (le schéma est réappliqué ensuite).
+
+        Args:
+            tables (tuple): Noms des tables à charger.
+
+        Returns:
+            dict[str, pd.DataFrame]: Un DataFrame par nom de table.
+        """
+        raise NotImplementedError
+
+    def revision(self) -> str | None:
+        """Révision courante de la source (None si inconnue : toujours relire)."""
+        return None
+
+    def last_good(self, tables: tuple) -> dict[str, pd.DataFrame] | None:
+        """Dernières tables lues avec succès, gardées localement (sans appeler la
+        source) : servies quand la source est injoignable. None si aucune."""
+        return None
+
+    def read(self, table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+        """Lit une partie d'une table : colonnes et filtres simples appliqués au
+        plus près de la source (voir les backends), sans charger le reste.
+
+        Args:
+            table (str): Nom de la table.
+            columns (list, optional): Colonnes lues (toutes par défaut).
+            **filters: `division`, `season`, `date_from`, `date_to` (voir `filter_bounds`).
+
+        Returns:
+            pd.DataFrame: Table typée, réduite aux lignes et colonnes demandées.
+        """
+        # Par défaut : lecture complète, filtrée en mémoire
+        df = schema.apply_schema(table, self.load_tables((table,))[table])
+        return filter_frame(df, columns, **filters)
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        """Ajoute des lignes à une table, en une seule écriture.
+
+        Args:
+            table (str): Nom de la table.
+            rows (list[dict]): Lignes à ajouter (clés = noms de colonnes).
+            raw (bool, optional): Valeurs écrites telles quelles, sans être
+                interprétées par la source (formules, dates : "12/11" reste du
+                texte). Google Sheets : RAW au lieu de USER_ENTERED.
+
+        Returns:
+            pd.DataFrame: Les lignes écrites, dans l'ordre des colonnes de la table.
+        """
+        raise NotImplementedError
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        """Supprime les lignes dont `column` vaut une des `values` (ex: saison archivée).
+
+        Args:
+            table (str): Nom de la table.
+            column (str): Colonne comparée (ex: "id").
+            values (Iterable): Valeurs des lignes à supprimer.
+
+        Returns:
+            int: Nombre de lignes supprimées.
+        """
+        raise NotImplementedError
+
+
+class SheetsBackend(Backend):
+    """Google Sheet : un onglet par table (prod).
+
+    Les tables ne font que grandir (chaque rencontre ajoute quelques lignes) :
+    une fois lues, seules les lignes ajoutées depuis sont relues. Les dernières
+    lignes déjà connues (`tail_rows`) et la ligne d'en-têtes sont relues avec
+    elles pour vérifier qu'elles n'ont pas changé ; sinon l'onglet est relu en
+    entier. Un document modifié (révision Drive) sans aucune ligne ajoutée a
+    été modifié en place : ses onglets sont relus en entier. Une modification
+    plus ancienne faite avec un ajout n'est pas détectée : les onglets sont
+    relus en entier toutes les `full_every` lectures incrémentales.
+
+    Avec un `limiter` (quota du club, voir `quota.py`), chaque requête à l'API
+    prend un jeton : sonde de révision, lectures (complètes ou incrémentales)
+    et écritures, y compris les nouveaux essais de `ResilientBackend`.
+
+    La révision lue est gardée `revision_ttl` secondes : un rechargement la
+    sonde plusieurs fois à la suite (Refresher, SharedCacheBackend, puis
+    `load_tables`) pour une seule requête à l'API Drive. Une écriture de l'app
+    l'invalide.
+    """
+
+    def __init__(
+        self,
+        conn: sheets.SheetConnection,
+        snapshot_dir: Path,
+        tail_rows: int = 5,
+        full_every: int = 12,
+        limiter: quota.RateLimiter | None = None,
+        revision_ttl: float = 2,
+    ):
+        self._conn = conn
+        self._limiter = limiter
+        self._revision_ttl = revision_ttl
+        self._probed = None  # (horodatage, révision) de la dernière sonde
+        self._snapshot_dir = snapshot_dir
+        self._tail_rows = tail_rows
+        self._full_every = full_every
+        self._deltas = 0  # lectures incrémentales depuis la dernière lecture complète
+        self._lock = threading.Lock()
+        self._values = {}  # {table: plage brute} du dernier chargement
+        self._revision = None
+
+    def _request(self, fn, *args, **kwargs):
+        # Une requête à l'API = un jeton du quota du club
+        if self._limiter is not None:
+            self._limiter.acquire()
+        return fn(*args, **kwargs)
+
+    def revision(self) -> str | None:
+        probed = self._probed
+        if probed is not None and time.monotonic() - probed[0] < self._revision_ttl:
+            return probed[1]
+        revision = self._request(self._conn.revision)
+        self._probed = (time.monotonic(), revision)
+        return revision
+
+    def last_good(self, tables: tuple) -> dict[str, pd.DataFrame] | None:
+        # Snapshot local du dernier chargement réussi, quelle que soit sa révision
+        values = snapshot.load_stale_snapshot(self._snapshot_dir, tables)
+        if values is None:
+            return None
+        return {table: values_to_df(values[table], table) for table in tables}
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        """Tous les onglets sont lus en une seule requête `values.batchGet`
+        (au lieu de open_by_key + worksheet + get_all_records pour chaque table).
+        Les plages lues sont gardées dans un snapshot local : au redémarrage, elles
+        sont restaurées depuis le disque si le document n'a pas été modifié depuis,
+        et servent sinon de base à une lecture incrémentale.
+        """
+        with self._lock:
+            # Document modifié depuis ? (une seule requête légère à l'API Drive)
+            revision = self.revision()
+            values = None
+            known = {t: self._values[t] for t in tables if t in self._values}
+
+            if len(known) < len(tables):
+                # Premier chargement : snapshot local, à jour ou non
+                values = snapshot.load_snapshot(self._snapshot_dir, tables, revision)
+                if values is None:
+                    known = snapshot.load_stale_snapshot(self._snapshot_dir, tables) or {}
+            elif revision is not None and revision == self._revision:
+                values = known
+
+            if values is None:
+                if known:
+                    self._deltas += 1
+                    if self._deltas > self._full_every:
+                        known = {}
+                if not known:
+                    self._deltas = 0  # lecture complète
+                values = self._fetch(tables, known, changed=revision is not None)
+                snapshot.save_snapshot(self._snapshot_dir, values, revision)
+
+            # Les en-têtes connus servent aux écritures suivantes (pas de row_values)
+            for table in tables:
+                if values[table]:
+                    self._conn.set_headers(table, values[table][0])
+
+            self._values.update(values)
+            self._revision = revision
+            return {table: values_to_df(values[table], table) for table in tables}
+
+    def read(self, table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+        """Seules les colonnes demandées (et celles des filtres) sont lues : une
+        plage par colonne, renvoyée en colonne (majorDimension=COLUMNS). Les
+        filtres sont appliqués ensuite (l'API ne filtre pas les lignes)."""
+        from gspread.utils import rowcol_to_a1
+
+        needed = _read_columns(table, columns, filters)
+        if needed is None:
+            return super().read(table, columns, **filters)
+
+        headers = self._conn.headers(table)
+        # La 1re colonne (id, toujours remplie) donne le nombre de lignes : une
+        # colonne lue omet ses cellules vides finales
+        fetched = list(dict.fromkeys([headers[0], *(c for c in needed if c in headers)]))
+        letters = [rowcol_to_a1(1, headers.index(col) + 1)[:-1] for col in fetched]
+        ranges = [f"'{table}'!{letter}2:{letter}" for letter in letters]
+        values = [r[0] if r else [] for r in self._request(self._conn.batch_get_ranges, ranges, "COLUMNS")]
+
+        height = max(len(v) for v in values)
+        df = pd.DataFrame(
+            {col: pd.Series(v + [""] * (height - len(v)), dtype=object) for col, v in zip(fetched, values)}
+        )
+        return filter_frame(schema.apply_schema(table, df), columns, **filters)
+
+    def _fetch(
+        self, tables: tuple, known: dict[str, list[list]], changed: bool = False
+    ) -> dict[str, list[list]]:
+        """Lit les tables : seulement les nouvelles lignes de celles déjà connues.
+
+        Une seule requête `values.batchGet` pour toutes les tables (plus une
+        seconde pour relire en entier celles dont les lignes connues ont changé).
+
+        Args:
+            tables (tuple): Tables à lire.
+            known (dict): Plages déjà lues, base de la lecture incrémentale.
+            changed (bool, optional): Révision du document changée depuis ces
+                plages : sans ligne ajoutée, toutes les tables sont relues en entier.
+        """
+        from gspread.utils import rowcol_to_a1
+
+        ranges, plan = [], {}
+        for table in tables:
+            rows = known.get(table)
+            if not rows or len(rows) < 2:
+                continue
+            width = len(rows[0])
+            last_col = rowcol_to_a1(1, width)[:-1]  # 14 -> "N"
+            # Ligne de la 1re ligne de contrôle (numérotation du Sheet, en-têtes = 1)
+            start = max(2, len(rows) - self._tail_rows + 1)
+            plan[table] = (len(ranges), start)
+            ranges += [f"'{table}'!A1:{last_col}1", f"'{table}'!A{start}:{last_col}"]
+
+        fetched = self._request(self._conn.batch_get_ranges, ranges) if ranges else []
+
+        values, full = {}, []
+        for table in tables:
+            if table not in plan:
+                full.append(table)
+                continue
+            pos, start = plan[table]
+            rows = known[table]
+            width = len(rows[0])
+            header, tail = fetched[pos], fetched[pos + 1]
+            known_tail = rows[start - 1 :]
+            unchanged = [_fit(r, width) for r in header] == [_fit(rows[0], width)] and [
+                _fit(r, width) for r in tail[: len(known_tail)]
+            ] == [_fit(r, width) for r in known_tail]
+            if unchanged:
+                values[table] = rows + tail[len(known_tail) :]
+            else:
+                # Lignes modifiées/supprimées : relecture complète de l'onglet
+                full.append(table)
+
+        if changed and not full and all(len(values[t]) == len(known[t]) for t in values):
+            # Document modifié sans ligne ajoutée : modification en place,
+            # au-dessus des lignes de contrôle
+            values, full = {}, list(tables)
+            self._deltas = 0
+
+        if full:
+            values.update(self._request(self._conn.batch_get, tuple(full)))
+        return {table: values[table] for table in tables}
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        from gspread.exceptions import APIError
+
+        ws = self._conn.worksheet(table)
+
+        # Récupérer / créer les headers (gardés en mémoire par la connexion)
+        headers = self._conn.headers(table)
+        if not headers:
+            # on prend les clés du premier dict comme référence
+            headers = list(rows[0].keys())
+            ws.update("A1", [headers])
+            self._conn.set_headers(table, headers)
+
+        # Construire la matrice de valeurs dans l'ordre des headers
+        # (RAW : ids et points en nombres, pas en texte)
+        convert = to_raw_cell if raw else to_native
+        values_matrix = []
+        for row in rows:
+            values_matrix.append([convert(row.get(h, "")) for h in headers])
+
+        # Append en une seule fois
+        try:
+            self._request(
+                ws.append_rows, values_matrix, value_input_option="RAW" if raw else "USER_ENTERED"
+            )
+        except APIError:
+            # Onglet supprimé/renommé ? Les handles seront relus au prochain essai
+            self._conn.invalidate(table)
+            raise
+        self._probed = None  # nouvelle révision du document
+
+        return values_to_df([headers] + [[str(v) for v in r] for r in values_matrix], table)
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        """Une seule requête `batchUpdate` (une suppression par bloc de lignes contiguës)."""
+        rows = self._request(self._conn.batch_get, (table,))[table]
+        if not rows or column not in rows[0]:
+            return 0
+        col = rows[0].index(column)
+        wanted = {str(v) for v in values}
+        hits = [
+            i for i, row in enumerate(rows[1:], start=1) if col < len(row) and str(row[col]) in wanted
+        ]
+
+        # Blocs [début, fin[ en index de ligne du Sheet (0 = en-têtes)
+        spans = []
+        for i in hits:
+            if spans and spans[-1][1] == i:
+                spans[-1][1] = i + 1
+            else:
+                spans.append([i, i + 1])
+        if spans:
+            sheet_id = self._conn.worksheet(table).id
+            # Du bas vers le haut : les index des blocs suivants restent valides
+            requests = [
+                {
+                    "deleteDimension": {
+                        "range": {
+                            "sheetId": sheet_id,
+                            "dimension": "ROWS",
+                            "startIndex": start,
+                            "endIndex": end,
+                        }
+                    }
+                }
+                for start, end in reversed(spans)
+            ]
+            self._request(self._conn.spreadsheet().batch_update, {"requests": requests})
+            self._probed = None
+            with self._lock:
+                # Lignes connues décalées : relecture complète au prochain chargement
+                self._values.pop(table, None)
+        return len(hits)
+
+
+class CsvBackend(Backend):
+    """Fichiers CSV (séparateur ";"), un par table (dev).
+
+    Un fichier n'est relu que s'il a changé (date de modification et taille),
+    avec le moteur pyarrow et les types déclarés dans `schema.py`. Si
+    `sidecar_dir` est renseigné, la table lue y est aussi gardée en Parquet et
+    relue de là tant que le CSV n'a pas changé (redémarrages).
+    """
+
+    def __init__(self, paths: dict[str, str], sidecar_dir: Path | None = None):
+        self._paths = dict(paths)
+        self._sidecar_dir = sidecar_dir
+        self._lock = threading.Lock()
+        self._cache = {}  # {table: (signature du fichier, DataFrame)}
+
+    def _signature(self, table: str) -> str:
+        stat = os.stat(self._paths[table])
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    def revision(self) -> str | None:
+        try:
+            return "|".join(self._signature(table) for table in sorted(self._paths))
+        except OSError:
+            return None
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        with self._lock:
+            return {table: self._load(table) for table in tables}
+
+    def _load(self, table: str) -> pd.DataFrame:
+        signature = self._signature(table)
+        cached = self._cache.get(table)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        df = self._read_sidecar(table, signature)
+        if df is None:
+            df = read_csv(self._paths[table], table)
+            self._write_sidecar(table, signature, df)
+        self._cache[table] = (signature, df)
+        return df
+
+    def read(self, table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+        """Table déjà en mémoire et à jour : filtrée telle quelle. Sinon, la copie
+        Parquet est lue avec les colonnes et le filtre de division passés à
+        pyarrow (groupes de lignes ignorés), ou le CSV avec les seules colonnes utiles."""
+        needed = _read_columns(table, columns, filters)
+        divisions = filter_bounds(**filters)[0]
+        with self._lock:
+            signature = self._signature(table)
+            cached = self._cache.get(table)
+
+        if cached is not None and cached[0] == signature:
+            df = cached[1]
+        else:
+            df = None
+            if self._sidecar_dir is not None:
+                try:
+                    df = pd.read_parquet(
+                        self._sidecar(table, signature),
+                        columns=needed,
+                        filters=[("division", "in", divisions)] if divisions is not None else None,
+                    )
+                except (OSError, ValueError):
+                    df = None
+            if df is None:
+                df = read_csv(self._paths[table], table, columns=needed)
+        return filter_frame(schema.apply_schema(table, df), columns, **filters)
+
+    def _sidecar(self, table: str, signature: str) -> Path:
+        return self._sidecar_dir / f"{table}-{signature}.parquet"
+
+    def _read_sidecar(self, table: str, signature: str) -> pd.DataFrame | None:
+        if self._sidecar_dir is None:
+            return None
+        try:
+            return pd.read_parquet(self._sidecar(table, signature))
+        except (OSError, ValueError):
+            return None
+
+    def _write_sidecar(self, table: str, signature: str, df: pd.DataFrame):
+        if self._sidecar_dir is None:
+            return
+        try:
+            self._sidecar_dir.mkdir(parents=True, exist_ok=True)
+            # Une seule copie par table : celle de la version courante du CSV
+            for old in self._sidecar_dir.glob(f"{table}-*.parquet"):
+                old.unlink(missing_ok=True)
+            path = self._sidecar(table, signature)
+            tmp = path.with_suffix(".parquet.tmp")
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+        except (OSError, ValueError):
+            # La copie Parquet n'est qu'une optimisation : on ne bloque pas l'app
+            pass
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        path = self._paths[table]
+        with open(path, "r", newline="") as f:
+            headers = next(csv.reader(f, delimiter=";"), None) or list(rows[0].keys())
+
+        values_matrix = [[to_native(row.get(h, "")) for h in headers] for row in rows]
+        with open(path, "a", newline="") as f:
+            csv.writer(f, delimiter=";").writerows(values_matrix)
+
+        return pd.DataFrame(values_matrix, columns=headers)
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        path = self._paths[table]
+        with open(path, "r", newline="") as f:
+            rows = list(csv.reader(f, delimiter=";"))
+        if not rows or column not in rows[0]:
+            return 0
+        col = rows[0].index(column)
+        wanted = {str(v) for v in values}
+        kept = [rows[0]] + [r for r in rows[1:] if not (col < len(r) and r[col] in wanted)]
+
+        # Réécriture à côté puis renommage (jamais de CSV à moitié écrit)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", newline="") as f:
+            csv.writer(f, delimiter=";").writerows(kept)
+        os.replace(tmp, path)
+        return len(rows) - len(kept)
+
+
+class SampledBackend(Backend):
+    """Échantillon stratifié des tables d'un autre backend (voir `sampling.py`).
+
+    Les écritures sont faites sur le backend d'origine.
+    """
+
+    def __init__(self, backend: Backend, fraction: float, seed: int = 0):
+        self._backend = backend
+        self._fraction = fraction
+        self._seed = seed
+
+    @property
+    def inner(self) -> Backend:
+        """Backend d'origine (tables complètes)."""
+        return self._backend
+
+    def revision(self) -> str | None:
+        return self._backend.revision()
+
+    def last_good(self, tables: tuple) -> dict[str, pd.DataFrame] | None:
+        loaded = self._backend.last_good(tuple(dict.fromkeys(tables + tuple(schema.SCHEMAS))))
+        if loaded is None:
+            return None
+        sample = sampling.sample_tables(loaded, self._fraction, self._seed)
+        return {table: sample[table] for table in tables}
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        # L'échantillon est tiré sur les trois tables (rencontres -> matchs -> joueurs)
+        loaded = self._backend.load_tables(tuple(dict.fromkeys(tables + tuple(schema.SCHEMAS))))
+        sample = sampling.sample_tables(loaded, self._fraction, self._seed)
+        return {table: sample[table] for table in tables}
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        return self._backend.append_rows(table, rows, raw=raw)
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        return self._backend.delete_rows(table, column, values)
+
+
+class ResilientBackend(Backend):
+    """Appels à un autre backend protégés contre une source lente ou en panne
+    (voir `resilience.py`).
+
+    Les lectures sont retentées sur les erreurs passagères, puis toutes les
+    lectures et écritures passent par un disjoncteur : source en panne, elles
+    échouent aussitôt au lieu de faire attendre les pages. Les écritures ne
+    sont jamais retentées (une ligne ajoutée deux fois serait dupliquée).
+    """
+
+    def __init__(self, backend: Backend, breaker: resilience.CircuitBreaker, transient, **retry):
+        """
+        Args:
+            backend (Backend): Source des tables.
+            breaker (resilience.CircuitBreaker): Disjoncteur de la source.
+            transient (callable): `(exception) -> bool`, erreurs passagères.
+            **retry: Réglages des essais (voir `resilience.retry`).
+        """
+        self._backend = backend
+        self.breaker = breaker
+        self._transient = transient
+        self._retry = retry
+
+    def _read(self, fn):
+        return self.breaker.call(
+            lambda: resilience.retry(fn, self._transient, **self._retry), self._transient
+        )
+
+    def revision(self) -> str | None:
+        return self._read(self._backend.revision)
+
+    def last_good(self, tables: tuple) -> dict[str, pd.DataFrame] | None:
+        return self._backend.last_good(tables)
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        return self._read(lambda: self._backend.load_tables(tables))
+
+    def read(self, table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+        return self._read(lambda: self._backend.read(table, columns, **filters))
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        return self.breaker.call(lambda: self._backend.append_rows(table, rows, raw=raw), self._transient)
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        return self.breaker.call(lambda: self._backend.delete_rows(table, column, values), self._transient)
+
+
+class QuotaBackend(Backend):
+    """Appels à un autre backend limités par le quota d'un club (voir `quota.py`).
+
+    Chaque appel (révision, lecture, écriture) prend un jeton du quota avant
+    d'atteindre la source : plusieurs clubs servis par la même app se
+    partagent le quota de l'API sans que l'un épuise celui des autres.
+    """
+
+    def __init__(self, backend: Backend, limiter: quota.RateLimiter):
+        self._backend = backend
+        self._limiter = limiter
+
+    def revision(self) -> str | None:
+        self._limiter.acquire()
+        return self._backend.revision()
+
+    def last_good(self, tables: tuple) -> dict[str, pd.DataFrame] | None:
+        return self._backend.last_good(tables)
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        self._limiter.acquire()
+        return self._backend.load_tables(tables)
+
+    def read(self, table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+        self._limiter.acquire()
+        return self._backend.read(table, columns, **filters)
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        self._limiter.acquire()
+        return self._backend.append_rows(table, rows, raw=raw)
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        self._limiter.acquire()
+        return self._backend.delete_rows(table, column, values)
+
+
+class SharedCacheBackend(Backend):
+    """Tables d'un autre backend partagées entre replicas (voir `sharedcache.py`).
+
+    Les tables brutes sont mises en cache par révision de la source : un seul
+    replica relit la source après une modification, les autres reprennent ses
+    tables. Sans révision connue (ex: SQLite), les tables sont lues directement.
+    """
+
+    def __init__(self, backend: Backend, cache: sharedcache.SharedCache, namespace: str):
+        """
+        Args:
+            backend (Backend): Source des tables.
+            cache (sharedcache.SharedCache): Cache partagé.
+            namespace (str): Préfixe des clés (source et échantillon : deux
+                configurations différentes ne partagent pas leurs tables).
+        """
+        self._backend = backend
+        self._cache = cache
+        self._namespace = namespace
+
+    @property
+    def inner(self) -> Backend:
+        """Backend dont les tables sont partagées."""
+        return self._backend
+
+    def revision(self) -> str | None:
+        return self._backend.revision()
+
+    def last_good(self, tables: tuple) -> dict[str, pd.DataFrame] | None:
+        return self._backend.last_good(tables)
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        revision = self._backend.revision()
+        if revision is None:
+            return self._backend.load_tables(tables)
+        key = f"{self._namespace}:tables:{revision}:{','.join(tables)}"
+        return self._cache.get_or_compute(key, lambda: self._backend.load_tables(tables))
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        # La révision de la source change : les replicas reliront les tables
+        return self._backend.append_rows(table, rows, raw=raw)
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        return self._backend.delete_rows(table, column, values)
+
+
+class SqliteBackend(Backend):
+    """Base SQLite locale : une table SQL par table, indexée (ids, division, date).
+
+    Chaque ajout est fait dans une transaction (tout ou rien).
+    """
+
+    # Index secondaires (les ids de rencontre / joueur sont des clés primaires)
+    INDEXES = {
+        "TABLE_MATCHS": ("id",),
+        "TABLE_INTERCLUB": ("division", "date"),
+        "TABLE_PLAYERS": ("division",),
+    }
+    PRIMARY_KEYS = {"TABLE_INTERCLUB": "id", "TABLE_PLAYERS": "id_player"}
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as db, db:
+            for table in schema.SCHEMAS:
+                self._create_table(db, table)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Une connexion par opération : l'app sert plusieurs sessions (threads).
+        # `closing(...)` ferme la connexion, `with db` ne gère que la transaction.
+        return sqlite3.connect(self._path)
+
+    def _create_table(self, db: sqlite3.Connection, table: str):
+        columns = []
+        for col, dtype in schema.SCHEMAS[table].items():
+            sql_type = "INTEGER" if dtype.startswith("Int") else "TEXT"
+            pk = " PRIMARY KEY" if self.PRIMARY_KEYS.get(table) == col else ""
+            columns.append(f'"{col}" {sql_type}{pk}')
+        db.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({", ".join(columns)})')
+        for col in self.INDEXES.get(table, ()):
+            db.execute(
+                f'CREATE INDEX IF NOT EXISTS "idx_{table}_{col}" ON "{table}" ("{col}")'
+            )
+
+    def _columns(self, db: sqlite3.Connection, table: str) -> list[str]:
+        return [r[1] for r in db.execute(f'PRAGMA table_info("{table}")')]
+
+    def load_tables(self, tables: tuple) -> dict[str, pd.DataFrame]:
+        with closing(self._connect()) as db:
+            return {
+                table: pd.read_sql_query(f'SELECT * FROM "{table}" ORDER BY rowid', db)
+                for table in tables
+            }
+
+    def read(self, table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+        """Colonnes et filtres traduits en SELECT ... WHERE (index sur division et date)."""
+        divisions, start, end = filter_bounds(**filters)
+        needed = _read_columns(table, columns, filters)
+        where, params = [], []
+        if divisions is not None:
+            where.append(f'"division" IN ({", ".join("?" * len(divisions))})')
+            params += divisions
+        # Dates stockées en texte ISO (import des CSV, saisie) : comparaison de chaînes
+        if start is not None:
+            where.append('"date" >= ?')
+            params.append(start.strftime("%Y-%m-%d"))
+        if end is not None:
+            where.append('"date" < ?')
+            params.append((end + pd.Timedelta(days=1)).strftime("%Y-%m-%d"))
+
+        with closing(self._connect()) as db:
+            known = self._columns(db, table)
+            filtered = (["division"] if divisions is not None else []) + (
+                ["date"] if start is not None or end is not None else []
+            )
+            unknown = [col for col in [*(needed or ()), *filtered] if col not in known]
+            if unknown:
+                raise ValueError(f"Colonnes inconnues dans {table} : {unknown}")
+            select = "*" if needed is None else ", ".join(f'"{col}"' for col in needed)
+            sql = f'SELECT {select} FROM "{table}"'
+            if where:
+                sql += " WHERE " + " AND ".join(where)
+            df = pd.read_sql_query(sql + " ORDER BY rowid", db, params=params)
+        return filter_frame(schema.apply_schema(table, df), columns, **filters)
+
+    def append_rows(self, table: str, rows: list[dict], raw: bool = False) -> pd.DataFrame:
+        with closing(self._connect()) as db:
+            headers = self._columns(db, table)
+            values_matrix = [[to_sql(row.get(h)) for h in headers] for row in rows]
+            # Toutes les lignes ou aucune (rollback si une insertion échoue)
+            with db:
+                db.executemany(
+                    f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(headers))})',
+                    values_matrix,
+                )
+        return pd.DataFrame(values_matrix, columns=headers)
+
+    def delete_rows(self, table: str, column: str, values) -> int:
+        values = [to_sql(v) for v in values]
+        with closing(self._connect()) as db:
+            if column not in self._columns(db, table):
+                return 0
+            with db:
+                cursor = db.execute(
+                    f'DELETE FROM "{table}" WHERE "{column}" IN ({", ".join("?" * len(values))})',
+                    values,
+                )
+            return cursor.rowcount
+
+    def import_tables(self, frames: dict[str, pd.DataFrame]):
+        """Remplace le contenu des tables (ex: import depuis le Google Sheet ou des CSV),
+        dans une seule transaction."""
+        with closing(self._connect()) as db:
+            with db:
+                for table, df in frames.items():
+                    headers = self._columns(db, table)
+                    db.execute(f'DELETE FROM "{table}"')
+                    db.executemany(
+                        f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(headers))})',
+                        [
+                            [to_sql(v) for v in row]
+                            for row in df.reindex(columns=headers).itertuples(index=False)
+                        ],
+                    )
+
+
+if __name__ == "__main__":
+    # python app/backends.py <base.sqlite> <interclub.csv> <matchs.csv> <players.csv>
+    db_path, *csv_paths = sys.argv[1:]
+    tables = tuple(schema.SCHEMAS)
+    frames = CsvBackend(dict(zip(tables, csv_paths))).load_tables(tables)
+    SqliteBackend(Path(db_path)).import_tables(frames)
+    print(f"{db_path} : " + ", ".join(f"{t} ({len(df)} lignes)" for t, df in frames.items()))
@@ -0,0 +1,120 @@
+"""Temps d'import au démarrage des pages (`python -X importtime`).
+
+Chaque mesure est faite dans un interpréteur neuf, streamlit et pandas déjà
+importés (incontournables, communs à toutes les pages) : seuls les modules
+ajoutés par la page sont comptés. Les imports faits dans les fonctions (gspread,
+duckdb, plotly...) ne sont pas comptés, ils n'ont lieu qu'à la première
+utilisation.
+
+    python app/diagnostics.py [budget_ms]
+"""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+DEFAULT_BUDGET_MS = 250
+# Modules communs à toutes les pages (non comptés). Seuls les paquets eux-mêmes
+# sont exclus : un sous-module (streamlit.components.v1) reste mesuré.
+BASELINE = ("streamlit", "pandas")
+
+
+def page_imports(path: Path) -> list[str]:
+    """Modules importés au niveau du module par un script (hors imports locaux).
+
+    Args:
+        path (Path): Script de la page.
+
+    Returns:
+        list[str]: Noms des modules, dans l'ordre d'import.
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def import_times(modules: list[str], repeat: int = 3) -> dict[str, float]:
+    """Temps d'import cumulé (ms) de chaque module, après `BASELINE`.
+
+    Args:
+        modules (list[str]): Modules à importer, dans l'ordre.
+        repeat (int, optional): Nombre de mesures (on garde la plus rapide).
+
+    Returns:
+        dict[str, float]: Temps par module (0 si déjà importé par un précédent).
+    """
+    code = "; ".join(f"import {module}" for module in (*BASELINE, *modules))
+    best = {}
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=APP_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times = _parse(result.stderr)
+        for module in modules:
+            ms = times.get(module, 0.0)
+            best[module] = min(best.get(module, ms), ms)
+    return best
+
+
+def _parse(stderr: str) -> dict[str, float]:
+    """Temps cumulés (ms) des imports de premier niveau dans la sortie de -X importtime."""
+    times = {}
+    for line in stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Les imports imbriqués sont indentés sous leur parent
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def measure_pages(budget_ms: float = DEFAULT_BUDGET_MS) -> list[dict]:
+    """Mesure le temps d'import de chaque page de l'app.
+
+    Args:
+        budget_ms (float, optional): Budget (ms) d'import par page.
+
+    Returns:
+        list[dict]: Par page : `page`, `total_ms`, `ok` (total dans le budget)
+            et `modules` (temps par module, du plus lent au plus rapide).
+    """
+    pages = [APP_DIR / "Accueil.py", *sorted((APP_DIR / "pages").glob("*.py"))]
+    report = []
+    for page in pages:
+        modules = [m for m in page_imports(page) if m not in BASELINE]
+        times = import_times(modules) if modules else {}
+        total = round(sum(times.values()), 1)
+        report.append(
+            {
+                "page": page.stem,
+                "total_ms": total,
+                "ok": total <= budget_ms,
+                "modules": dict(sorted(times.items(), key=lambda item: -item[1])),
+            }
+        )
+    return report
+
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    report = measure_pages(budget)
+    for row in report:
+        status = "ok" if row["ok"] else "HORS BUDGET"
+        print(f"{row['page']:<20} {row['total_ms']:>8.1f} ms  {status}")
+        for module, ms in row["modules"].items():
+            print(f"    {module:<32} {ms:>8.1f} ms")
+    sys.exit(0 if all(row["ok"] for row in report) else 1)
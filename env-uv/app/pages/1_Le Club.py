@@ -2,16 +2,21 @@ import streamlit as st
 import base64
 from pathlib import Path
 import utils
-import plotly.graph_objects as go
 import pandas as pd
-import streamlit.components.v1 as components
-from streamlit_extras.stylable_container import stylable_container
 import numpy as np
 
 ##################################################################
 #                          DONNEES                               #
 ##################################################################
-TABLE_INTERCLUB = utils.load_table(utils.env, "TABLE_INTERCLUB")
+# Saison affichée (sidebar) et instantané de ses tables, lu par tout le rendu
+# de la page
+SAISONS = utils.seasons()
+SAISON = st.sidebar.selectbox(
+    "Saison",
+    SAISONS,
+    index=SAISONS.index(utils.current_season()) if utils.current_season() in SAISONS else 0,
+)
+utils.pin_snapshot(season=SAISON)
 
 # Chemin relatif vers les fichiers
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -35,6 +40,9 @@ def winrate_piechart(value1:float, value2:float, value3:float, legend:list, unit
         colors (list[str]): couleurs des sections (default: None = vert/rouge/bleu)
         pct_list (list[float]): valuers en pourcentage pour l'affichage (default: None)
     """
+    # Import au premier graphique (plotly n'est utile qu'à la vue générale)
+    import plotly.graph_objects as go
+
     values = [value1, value2, value3]
     
     # Gestion des couleurs
@@ -103,20 +111,16 @@ def actual_rank(df:pd.DataFrame, joueur:str, type:str="DD|DH"):
     """Récupération du classement actuel d'un joueur.
     
     Args:
-        df (pd.DataFrame): jeu de données des matchs.
+        df (pd.DataFrame): table longue des matchs (une ligne par joueur et par match).
         joueur (str): nom du joueur ciblé.
         type (str): type de match ciblé (default: 'DD|DH').
     """
-    apply_df = df[(df["type_match"].str.contains(type, na=False)) & (df["player"].str.contains(joueur, na=False))].reset_index(drop=True)
+    apply_df = df[(df["type_match"].str.contains(type, na=False)) & (df["name"] == joueur)]
     if not apply_df.empty:
         if type in ["DD|DH", "MX"]:
-            line_double = apply_df.loc[len(apply_df)-1]
-            name_double = [p.strip() for p in line_double["player"].split("/")]
-            rank_double = [p.strip() for p in line_double["rank"].split("/")]
-            p_double = dict(zip(name_double, rank_double))
-            return p_double[joueur]
+            return apply_df["rank"].iloc[-1]
         else:
-            return apply_df.loc[0]["rank"]
+            return apply_df["rank"].iloc[0]
     else:
         return "..."
 
@@ -137,6 +141,8 @@ def box_team(
         opponent_score (int): score final de l'adversaire.
         box_style (str): style CSS ajoutés à la balise html.
     """
+    from streamlit_extras.stylable_container import stylable_container
+
     with stylable_container(key=f"box-vert-{key_id}", css_styles=box_style):
         # Ligne principale
         c1, c2 = st.columns([1, 9], gap="small")
@@ -279,6 +285,12 @@ st.markdown(
 ##################################################################
 st.set_page_config(page_title="Statistiques", layout="wide")
 
+# Bandeau "données en cache" si la source ne répond pas
+utils.cache_banner()
+
+# Mise à jour automatique quand une rencontre est enregistrée
+utils.live_refresh(utils.TABLES)
+
 # Navbar horizontale
 onglet = st.segmented_control(
     label="Navigation",
@@ -294,314 +306,111 @@ st.divider()
 #                            GENERAL                             #
 ##################################################################
 
-# Récupération des données et assemblage des tables
-m_ic = utils.TABLE_MATCHS.merge(
-    TABLE_INTERCLUB[["id", "date", "division", "aob_team", "opponent_team"]],
-    left_on="id",
-    right_on="id",
-    how="left",
-)
-
-# 2) Découper les champs potentiellement composés
-m_ic["aob_p1_id"], m_ic["aob_p2_id"] = utils.split2_col(m_ic, "aob_player_id")
-m_ic["aob_rank_p1"], m_ic["aob_rank_p2"] = utils.split2_col(m_ic, "aob_rank")
-m_ic["aob_pts_p1"], m_ic["aob_pts_p2"] = utils.split2_col(m_ic, "aob_pts")
-
-# (optionnel) caster les points en numériques
-for col in ["aob_pts_p1", "aob_pts_p2"]:
-    m_ic[col] = pd.to_numeric(m_ic[col], errors="coerce")
-
-# 3) Résoudre noms via mapping id → name
-players = utils.TABLE_PLAYERS.copy()
-players["id_norm"] = players["id_player"].astype(str).str.strip()
-id_to_name = players.set_index("id_norm")["name"].to_dict()
-
-m_ic["aob_p1_name"] = (
-    m_ic["aob_p1_id"].astype(str).str.strip().map(id_to_name).fillna("")
-)
-m_ic["aob_p2_name"] = (
-    m_ic["aob_p2_id"].astype(str).str.strip().map(id_to_name).fillna("")
-)
-
-# 4) Colonnes combinées (si 2 joueurs)
-m_ic["player"] = utils.join_if_two(m_ic["aob_p1_name"], m_ic["aob_p2_name"])
-m_ic["rank"] = utils.join_if_two(m_ic["aob_rank_p1"], m_ic["aob_rank_p2"])
-
-# pts en texte lisible ("12 / 8"), sans 'None'
-p1_txt = m_ic["aob_pts_p1"].astype("Int64").astype(str).replace("<NA>", "", regex=False)
-p2_txt = m_ic["aob_pts_p2"].astype("Int64").astype(str).replace("<NA>", "", regex=False)
-m_ic["pts"] = utils.join_if_two(p1_txt, p2_txt)
-
-# 5) Sélection finale - Dataframe utilisable
-result = m_ic[
-    [
-        "id",
-        "type_match",
-        "date",
-        "division",
-        "aob_team",
-        "opponent_team",
-        "aob_player_id",
-        "player",
-        "opponent_rank",
-        "rank",
-        "pts",
-        "win",
-        "aob_grind",
-        "opponent_grind",
-    ]
-].reset_index(drop=True)
-
-# Copie du dataframe
-df = result.copy()
+# Table longue des matchs : une ligne par (match, joueur de l'AOB)
+df = utils.player_matches()
+players = utils.TABLE_PLAYERS
 
 # Navigation dans l'onglet "Vue générale"
 if onglet == "Vue générale":
-    #
-    players = df["player"].str.split("/")
-    player_rank = df["rank"].str.split("/")
-    points = df["aob_grind"].astype(str).str.split("/")
-    categorie = df["type_match"].str.replace(r"\d+", "", regex=True)
-    date = df["date"]
-    # Explode en gardant l’alignement grâce à l’index
-    df_long = pd.DataFrame(
-        {
-            "player": players.explode().str.strip(),
-            "player_rank": player_rank.explode().str.strip(),
-            "points": points.explode().str.strip().astype(int),
-            "categorie": categorie,
-            "date": date,
-        }
-    )
-    #
-    l1_c1, l1_c2, l1_c3, l1_c4, l1_c5 = st.columns([2, 2, 2, 2, 2], gap="small")
-    with l1_c1:
-        
-        # Caluler la somme de points remportés en totalité
-        df_points_tot_par_joueur = (
-            df_long.groupby("player", as_index=False)["points"]
-            .sum()
-            .sort_values("points", ascending=False)
-        ).reset_index(drop=True)
-
-        # Caluler la somme de points remportés par type de match
-        df_points_par_joueur = (
-            df_long.groupby(["player", "categorie"], as_index=False)["points"]
-            .sum()
-            .sort_values("points", ascending=False)
-        )
-
-        # Dataframe du joueur ayant remporté le plus de points (avec chaque type de match)
-        pts_eater = df_points_par_joueur[
-            (
-                df_points_par_joueur["player"]
-                == df_points_tot_par_joueur.loc[0, "player"]
-            )
-        ].reset_index(drop=True)
-
-        # Simple
-        mask_s = pts_eater["categorie"].str.contains("S", na=False)
-        pts_s = pts_eater.loc[mask_s, "points"].iloc[0] if mask_s.any() else 0
-        if pts_s == 0:
-            pts_s = 0
-        elif "-" in str(pts_s):
-            pts_s = f"{pts_s}"
-        else:
-            pts_s = f"+{pts_s}"
-        # Double
-        mask_d = pts_eater["categorie"].str.contains("D", na=False)
-        pts_d = pts_eater.loc[mask_d, "points"].iloc[0] if mask_d.any() else 0
-        if pts_d == 0:
-            pts_d = 0
-        elif "-" in str(pts_d):
-            pts_d = f"{pts_d}"
-        else:
-            pts_d = f"+{pts_d}"
-        # Mixte
-        mask_m = pts_eater["categorie"].str.contains("MX", na=False)
-        pts_m = pts_eater.loc[mask_m, "points"].iloc[0] if mask_m.any() else 0
-        if pts_m == 0:
-            pts_m = 0
-        elif "-" in str(pts_m):
-            pts_m = f"{pts_m}"
-        else:
-            pts_m = f"+{pts_m}"
-        #
-        utils.kpi_card("Point Eater", pts_eater["player"][0], f"{pts_s} / {pts_d} / {pts_m}")
-    with l1_c2:
-        # Compter les victoires dans l'ordre chronologique
-        df_long = df_long.sort_values(["player", "date"])
-
-        # Créer une colonne "is_win" sommant les victoires
-        df_long["is_win"] = df_long["points"] > 0
-
-        # Calculer le win streak pour chaque match
-        def compute_streak(s):
-            # s est une Series de booléens (is_win) pour UN joueur
-            groups = (~s).cumsum()  # chaque défaite crée un nouveau groupe
-            streak = s.groupby(groups).cumsum()
-            return streak
-
-        df_long["win_streak"] = df_long.groupby("player")["is_win"].transform(
-            compute_streak
-        )
-
-        # Win Streak max par joueur
-        df_win_streak = (
-            df_long.groupby("player", as_index=False)["win_streak"]
-            .max()
-            .rename(columns={"win_streak": "best_win_streak"})
-            .sort_values("best_win_streak", ascending=False)
-        ).reset_index(drop=True)
-
-        #
-        utils.kpi_card(
-            "Win Streaker",
-            df_win_streak["player"][0],
-            f"🔥{df_win_streak['best_win_streak'][0]}",
-        )
-    with l1_c3:
-        # Nombre de match total joués par joueur
-        df_match_count = (
-            df_long.groupby("player", as_index=False)
-            .size()  # nombre de lignes = nombre de matchs joués
-            .rename(columns={"size": "nb_matchs"})
-            .sort_values("nb_matchs", ascending=False)
-        ).reset_index(drop=True)
+    # Agrégats calculés en SQL (voir queries.py), mis en cache par version des tables
+    def signed(pts):
+        """Points affichés avec leur signe ("+12", "-3", 0)."""
+        return 0 if pts == 0 else (f"{pts}" if pts < 0 else f"+{pts}")
+
+    def winrate(rate):
+        """Winrate d'un type de match (0 si aucun match joué)."""
+        return 0 if pd.isna(rate) else rate
+
+    if df.empty:
+        # Partition de saison vide (saison qui commence, ou sans match enregistré)
+        st.info("Aucun match enregistré pour cette saison.")
+    else:
         #
-        utils.kpi_card(
-            "Match Marathoner",
-            df_match_count["player"][0],
-            df_match_count["nb_matchs"][0],
-        )
-    with l1_c4:
-        # Garder les matchs remportés
-        df_wins = df_long[df_long["points"] > 0].copy()
-
-        # Trouver la ligne avec le nombre de points maximal
-        if df_wins.empty:
-            # personne n'a de match gagné
-            best_row = None
-        else:
-            best_row = df_wins[
-                df_wins["points"] == df_wins["points"].max()
-            ].reset_index(drop=True)
-
-        utils.kpi_card("Clutch Performer", best_row["player"][0], f"+{best_row['points'][0]}")
-    with l1_c5:
-        # Winrate global par joueur
-        df_winrate_par_joueur = (
-            df_long.assign(is_win=df_long["points"] > 0)  # True si victoire
-            .groupby("player", as_index=False)
-            .agg(
-                nb_matchs=("is_win", "size"),
-                nb_wins=("is_win", "sum"),
-                winrate=(
-                    "is_win",
-                    "mean",
-                ),  # moyenne de True/False = ratio de victoires
+        l1_c1, l1_c2, l1_c3, l1_c4, l1_c5 = st.columns([2, 2, 2, 2, 2], gap="small")
+        with l1_c1:
+            # Joueur ayant remporté le plus de points (avec chaque type de match)
+            pts_eater = utils.query("point_eater").iloc[0]
+            #
+            utils.kpi_card(
+                "Point Eater",
+                pts_eater["player"],
+                f"{signed(pts_eater['simple'])} / {signed(pts_eater['double'])} / {signed(pts_eater['mixte'])}",
             )
-        )
-
-        # passer le winrate en pourcentage
-        df_winrate_par_joueur["winrate"] = (
-            df_winrate_par_joueur["winrate"] * 100
-        ).round(1)
-
-        # optionnel : trier par winrate puis nb_matchs
-        df_winrate_par_joueur = df_winrate_par_joueur.sort_values(
-            ["winrate", "nb_matchs"], ascending=[False, False]
-        ).reset_index(drop=True)
-
-        # Winrate par type de match
-        df_winrate_par_joueur_cat = (
-            df_long.assign(is_win=df_long["points"] > 0)
-            .groupby(["player", "categorie"], as_index=False)
-            .agg(
-                nb_matchs=("is_win", "size"),
-                nb_wins=("is_win", "sum"),
-                winrate=("is_win", "mean"),
+        with l1_c2:
+            # Plus longue série de victoires (ordre chronologique)
+            df_win_streak = utils.query("win_streak")
+            #
+            utils.kpi_card(
+                "Win Streaker",
+                df_win_streak["player"][0],
+                f"🔥{df_win_streak['best_win_streak'][0]}",
             )
-        )
-
-        df_winrate_par_joueur_cat["winrate"] = (
-            df_winrate_par_joueur_cat["winrate"] * 100
-        ).round(1)
-
-        df_winrate_par_joueur_cat = df_winrate_par_joueur_cat.sort_values(
-            ["player", "categorie"], ascending=[False, False]
-        ).reset_index(drop=True)
-
-        df_winrate_master = df_winrate_par_joueur_cat[
-            (df_winrate_par_joueur_cat["player"] == df_winrate_par_joueur["player"][0])
-        ].reset_index(drop=True)
-
-        # Simple
-        mask_s_cat = df_winrate_master["categorie"].str.contains("S", na=False)
-        pts_s_cat = (
-            df_winrate_master.loc[mask_s_cat, "winrate"].iloc[0]
-            if mask_s_cat.any()
-            else 0
-        )
-        nb_s_cat = (
-            df_winrate_master.loc[mask_s_cat, "nb_matchs"].iloc[0]
-            if mask_s_cat.any()
-            else 0
-        )
-        # Double
-        mask_d_cat = df_winrate_master["categorie"].str.contains("D", na=False)
-        pts_d_cat = (
-            df_winrate_master.loc[mask_d_cat, "winrate"].iloc[0]
-            if mask_d_cat.any()
-            else 0
-        )
-        nb_d_cat = (
-            df_winrate_master.loc[mask_d_cat, "nb_matchs"].iloc[0]
-            if mask_d_cat.any()
-            else 0
-        )
-        # Mixte
-        mask_m_cat = df_winrate_master["categorie"].str.contains("MX", na=False)
-        pts_m_cat = (
-            df_winrate_master.loc[mask_m_cat, "winrate"].iloc[0]
-            if mask_m_cat.any()
-            else 0
-        )
-        nb_m_cat = (
-            df_winrate_master.loc[mask_m_cat, "nb_matchs"].iloc[0]
-            if mask_m_cat.any()
-            else 0
-        )
+        with l1_c3:
+            # Nombre de match total joués par joueur
+            df_match_count = utils.query("match_marathoner")
+            #
+            utils.kpi_card(
+                "Match Marathoner",
+                df_match_count["player"][0],
+                df_match_count["nb_matchs"][0],
+            )
+        with l1_c4:
+            # Match gagné avec le nombre de points maximal
+            best_row = utils.query("clutch_performer")
 
+            if best_row.empty:
+                utils.kpi_card("Clutch Performer", "-", "aucun match gagné")
+            else:
+                utils.kpi_card("Clutch Performer", best_row["player"][0], f"+{best_row['points'][0]}")
+        with l1_c5:
+            # Meilleur winrate global, détaillé par type de match
+            master = utils.query("winrate_master").iloc[0]
+
+            #
+            utils.kpi_card(
+                "Winrate Master",
+                master["player"],
+                f"{winrate(master['winrate_simple'])}%({master['nb_simple']}) / "
+                f"{winrate(master['winrate_double'])}%({master['nb_double']}) / "
+                f"{winrate(master['winrate_mixte'])}%({master['nb_mixte']})",
+            )
         #
-        utils.kpi_card(
-            "Winrate Master",
-            df_winrate_master["player"][0],
-            f"{pts_s_cat}%({nb_s_cat}) / {pts_d_cat}%({nb_d_cat}) / {pts_m_cat}%({nb_m_cat})",
+        l2_c1, l2_c2, l2_c3 = st.columns([3, 3, 3], gap="small")
+        with l2_c1:
+            results = utils.query("club_results").iloc[0]
+            winrate_piechart(value1=results["wins"], value2=results["losses"], value3=results["draws"], unit="pct", legend=["Victoire", "Défaite", "Egalité"], key="1")
+        with l2_c2:
+            df_players = utils.TABLE_PLAYERS
+            tot_H = (df_players["gender"] == "H").sum()
+            tot_F = (df_players["gender"] == "F").sum()
+            tot_NG = (df_players["gender"] == "NG").sum()
+            winrate_piechart(value1=tot_H, value2=tot_F, value3=tot_NG, unit="tot", legend=["Hommes", "Femmes", "Non-Genré"], key="2", colors=["#4C9DFF", "#FF9DF8", "#878787"])
+        with l2_c3:
+            by_type = utils.query("club_wins_by_type").set_index("type").reindex(["S", "D", "M"], fill_value=0)
+            tot_simple, tot_double, tot_mixte = by_type["wins"].tolist()
+            #
+            pct_simple, pct_doule, pct_mixte = [
+                round(wins / played * 100, 1) if played else 0
+                for wins, played in zip(by_type["wins"], by_type["played"])
+            ]
+            winrate_piechart(value1=tot_simple, value2=tot_double, value3=tot_mixte, unit="ratio", legend=["Simple", "Double", "Mixte"], key="3", colors=["#EC3232", "#2BEAC7", "#DEF41E"], pct_list=[pct_simple,pct_doule,pct_mixte])
+
+    # Bilan de toutes les saisons (résumés précalculés des saisons archivées)
+    with st.expander("Bilan par saison"):
+        st.dataframe(
+            utils.season_summaries(),
+            hide_index=True,
+            column_config={
+                "season": "Saison",
+                "division": "Division",
+                "nb_rencontres": "Rencontres",
+                "wins": "Victoires",
+                "draws": "Egalités",
+                "losses": "Défaites",
+                "nb_matchs": "Matchs",
+                "matchs_won": "Matchs gagnés",
+            },
         )
-    #
-    l2_c1, l2_c2, l2_c3 = st.columns([3, 3, 3], gap="small")
-    with l2_c1:
-        tot_W = (TABLE_INTERCLUB["aob_score"] > TABLE_INTERCLUB["opponent_score"]).sum()
-        tot_L = (TABLE_INTERCLUB["aob_score"] < TABLE_INTERCLUB["opponent_score"]).sum()
-        tot_D = (TABLE_INTERCLUB["aob_score"] == TABLE_INTERCLUB["opponent_score"]).sum()
-        winrate_piechart(value1=tot_W, value2=tot_L, value3=tot_D, unit="pct", legend=["Victoire", "Défaite", "Egalité"], key="1")
-    with l2_c2:
-        df_players = utils.TABLE_PLAYERS
-        tot_H = (df_players["gender"] == "H").sum()
-        tot_F = (df_players["gender"] == "F").sum()
-        tot_NG = (df_players["gender"] == "NG").sum()
-        winrate_piechart(value1=tot_H, value2=tot_F, value3=tot_NG, unit="tot", legend=["Hommes", "Femmes", "Non-Genré"], key="2", colors=["#4C9DFF", "#FF9DF8", "#878787"])
-    with l2_c3:
-        df_match = utils.TABLE_MATCHS
-        tot_simple = (df_match[df_match["type_match"].astype(str).str.startswith(("SH", "SD"))]["win"].eq("aob").sum())
-        tot_double = (df_match[df_match["type_match"].astype(str).str.startswith(("DH", "DD"))]["win"].eq("aob").sum())
-        tot_mixte = (df_match[df_match["type_match"].astype(str).str.startswith(("MX"))]["win"].eq("aob").sum())
-        #
-        pct_simple = round((tot_simple/df_match["type_match"].astype(str).str.startswith(("SH", "SD")).sum())*100,1)
-        pct_doule = round((tot_double/df_match["type_match"].astype(str).str.startswith(("DH", "DD")).sum())*100,1)
-        pct_mixte = round((tot_mixte/df_match["type_match"].astype(str).str.startswith(("MX")).sum())*100,1)
-        winrate_piechart(value1=tot_simple, value2=tot_double, value3=tot_mixte, unit="ratio", legend=["Simple", "Double", "Mixte"], key="3", colors=["#EC3232", "#2BEAC7", "#DEF41E"], pct_list=[pct_simple,pct_doule,pct_mixte])
     
 
 ##################################################################
@@ -609,7 +418,10 @@ if onglet == "Vue générale":
 ##################################################################
 
 elif onglet == "Joueurs":
-    filtered_df = df[["id", "aob_player_id", "type_match", "player", "rank", "date", "opponent_team", "aob_grind"]]
+    import streamlit.components.v1 as components
+    from streamlit_extras.stylable_container import stylable_container
+
+    filtered_df = df[["id", "type_match", "match_type", "name", "rank", "date", "opponent_team", "grind"]]
     joueurs = players["name"].unique().tolist()
 
     @st.dialog("Fiche joueur")
@@ -655,19 +467,9 @@ elif onglet == "Joueurs":
         st.divider()
 
         player_sel = player["name"]
-        target = player_sel.strip().casefold()
-        # explode pour un match vectorisé sur chaque token séparé par '/'
-        tokens = (
-            filtered_df["player"]
-            .fillna("")
-            .str.split("/")  # -> liste de noms
-            .explode()  # une ligne par nom
-            .str.strip()
-            .str.casefold()  # normalisation
-        )
 
-        #
-        df_kpi = filtered_df[filtered_df["player"].astype(str).str.contains(player["name"], na=False)].reset_index(drop=True).copy()
+        # Matchs joués par le joueur sélectionné (ses propres points)
+        df_kpi = filtered_df[filtered_df["name"] == player_sel].reset_index(drop=True).copy()
 
         # Rencontres jouées par le joueur sélectionné
         journeys = list(df_kpi.id.unique())
@@ -678,7 +480,6 @@ elif onglet == "Joueurs":
         )
         for d in journeys:
             df_popup = df_kpi[df_kpi["id"] == d].reset_index(drop=True)
-            df_popup["date"] = pd.to_datetime(df_popup["date"], errors="coerce")
             df_popup["date"] = df_popup["date"].dt.strftime("%d-%m-%Y")
 
             if df_popup.empty:
@@ -690,20 +491,11 @@ elif onglet == "Joueurs":
             df_activity.loc[row_idx, "opponent"] = df_popup.loc[0, "opponent_team"]
 
             for i in range(len(df_popup)):
-                if df_popup.loc[i, "type_match"].startswith(("SH", "SD")):
-                    df_activity.loc[row_idx, "simple"] = df_popup.loc[i, "aob_grind"]
-                if df_popup.loc[i, "type_match"].startswith(("DH", "DD")):
-                    df_activity.loc[row_idx, "double"] = (
-                        df_popup.loc[i, "aob_grind"].split("/")[0]
-                        if df_popup.loc[i, "player"].split("/")[0] == player_sel
-                        else df_popup.loc[i, "aob_grind"].split("/")[1]
-                    )
-                if df_popup.loc[i, "type_match"].startswith("MX"):
-                    df_activity.loc[row_idx, "mixte"] = (
-                        df_popup.loc[i, "aob_grind"].split("/")[0]
-                        if df_popup.loc[i, "player"].split("/")[0] == player_sel
-                        else df_popup.loc[i, "aob_grind"].split("/")[1]
-                    )
+                # "Simple" / "Double" / "Mixte" -> colonne "simple" / "double" / "mixte"
+                # (type manquant ou inconnu : match ignoré)
+                match_type = str(df_popup.loc[i, "match_type"]).lower()
+                if match_type in ("simple", "double", "mixte"):
+                    df_activity.loc[row_idx, match_type] = df_popup.loc[i, "grind"]
 
         # Entete des catégories
         row_title = f"""
@@ -952,6 +744,8 @@ elif onglet == "Joueurs":
 ##################################################################
 
 elif onglet == "Équipes":
+    from streamlit_extras.stylable_container import stylable_container
+
     c1, c2, c3 = st.columns([1, 1, 1], gap="small")
     
     def team_list(team: str):
@@ -1098,23 +892,15 @@ elif onglet == "Équipes":
                 )
 
             if show:
-                df_team_page = utils.TABLE_MATCHS.merge(
-                    utils.TABLE_INTERCLUB,
-                    how="left",
-                    on="id"
-                )
-                df_division = df_team_page[df_team_page["division"] == team].copy()
-
-                df_division["date"] = pd.to_datetime(
-                    df_division["date"],
-                    errors="coerce"
-                )
+                # Matchs de l'équipe, déjà joints à leur rencontre (index par version)
+                index = utils.table_index()
+                df_division = index.team_matchs(team)
 
                 journey_ids = list(df_division.id.unique())[
                     ::-1
                 ]  # De la date la + récente à la plus ancienne
                 for d in journey_ids:
-                    id_df = df_division[(df_division.id == d)].reset_index(drop=True)
+                    id_df = index.matchs_interclub.iloc[index.matchs_of(d)].reset_index(drop=True)
                     utils.matrix_color(df=id_df, division=team)
                     
             with _right:
@@ -1124,64 +910,35 @@ elif onglet == "Équipes":
                     value=False,
                 )
             if show:
-                df_team_page = utils.TABLE_MATCHS.merge(
-                    utils.TABLE_INTERCLUB,
-                    how="left",
-                    on="id"
-                )
-                df_team_page = df_team_page[df_team_page["division"] == team].reset_index(drop=True)
-                df_division = df_team_page[df_team_page["division"] == team].copy()
-
-                utils.kpi_card("Rencontres jouées", f'{df_team_page["id"].nunique()}', "saison 2025/26")
-                # Définir V/D/E
-                def match_output(team):
-                    df = TABLE_INTERCLUB[(TABLE_INTERCLUB["division"] == team)].reset_index(
-                        drop=True
-                    )
-                    v = (df["aob_score"] > df["opponent_score"]).sum()
-                    d = (df["aob_score"] < df["opponent_score"]).sum()
-                    e = (df["aob_score"] == df["opponent_score"]).sum()
-
-                    # Calcul du nombre de points
-                    pts = v * 3 + e * 2 + d * 1
-                    return v, e, d, pts
+                # Bilan de l'équipe (requête SQL, voir queries.py)
+                team_stats = utils.query("team_stats", team=team).iloc[0]
+
+                utils.kpi_card("Rencontres jouées", f'{team_stats["nb_rencontres"]}', f"saison {SAISON}")
+                df_match = utils.TABLE_MATCHS
 
                 utils.kpi_card(
                     "Résultats",
-                    f"{str(match_output(team)[0])} / {str(match_output(team)[1])} / {str(match_output(team)[2])}",
+                    f"{team_stats['wins']} / {team_stats['draws']} / {team_stats['losses']}",
                     "Victoire(s) / Egalité(s) / Défaite(s)",
                 )
                 utils.kpi_card(
                     "Matchs joués",
-                    f'{len(df[(df["type_match"].isin(["SH1","SH2","SH3","SH4","SD1","SD2"]))])} / {len(df[(df["type_match"].isin(["DH","DH1","DH2","DD", "DD1"]))])} / {len(df[(df["type_match"].isin(["MX","MX1","MX2"]))])}',
+                    f'{len(df_match[(df_match["type_match"].isin(["SH1","SH2","SH3","SH4","SD1","SD2"]))])} / {len(df_match[(df_match["type_match"].isin(["DH","DH1","DH2","DD", "DD1"]))])} / {len(df_match[(df_match["type_match"].isin(["MX","MX1","MX2"]))])}',
                     "Simple / Double / Mixte",
                 )
-                total_wins = len(df_division[df_division["win"] == "aob"])
-                double_wins = len(
-                    df_division[
-                        (df_division["type_match"].isin(["DH", "DH1", "DH2", "DD", "DD1", "DD2"]))
-                        & (df_division["win"] == "aob")
-                    ]
-                )
-                mixed_wins = len(
-                    df_division[
-                        (df_division["type_match"].isin(["MX", "MX1", "MX2"]))
-                        & (df_division["win"] == "aob")
-                    ]
-                )
-                stats = f"{total_wins} / {double_wins} / {mixed_wins}"
-                s_rate = utils.group_rate(df_division, utils.S_TYPES)
-                d_rate = utils.group_rate(df_division, utils.D_TYPES)
-                m_rate = utils.group_rate(df_division, utils.M_TYPES)
+                stats = f"{team_stats['matchs_won']} / {team_stats['won_double']} / {team_stats['won_mixte']}"
+                s_rate = utils.safe_rate(team_stats["won_simple"], team_stats["played_simple"], pct=True, ndigits=0)
+                d_rate = utils.safe_rate(team_stats["won_double"], team_stats["played_double"], pct=True, ndigits=0)
+                m_rate = utils.safe_rate(team_stats["won_mixte"], team_stats["played_mixte"], pct=True, ndigits=0)
 
                 utils.kpi_card(
                     "Victoires",
                     f'{stats}',
                     f"{s_rate} / {d_rate} / {m_rate}",
                 )
-                interclub_team_sel = TABLE_INTERCLUB[
-                    (TABLE_INTERCLUB["division"] == team)
-                ].reset_index(drop=True)
+                interclub_team_sel = utils.load_table(
+                    utils.env, "TABLE_INTERCLUB", columns=["aob_score", "opponent_score"], division=team
+                ).reset_index(drop=True)  # copie : une colonne y est ajoutée
 
                 # Nouvelle colonnes éphémère donnant l'issue du match
                 interclub_team_sel["result"] = np.where(
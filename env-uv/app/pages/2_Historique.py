@@ -11,12 +11,6 @@ EQUIPE = ["H2", "V3", "PR", "D2", "D3", "D5"]
 ##################################################################
 #                        FONCTIONS                               #
 ##################################################################
-@st.cache_data(ttl=30)  # Cache limitant la lecture
-def load_interclub_table():
-    """Chargement cacheté de la table 'INTERCLUB' hébergée sur un Google SHEET"""
-    return utils.TABLE_INTERCLUB
-
-
 def filter_by_result(
     df: pd.DataFrame, selected: list, home_col="aob_score", away_col="opponent_score"
 ) -> pd.DataFrame:
@@ -31,9 +25,9 @@ def filter_by_result(
     if not selected:  # si le dropdown est vide
         return df
 
-    # Convertit en numériques (au cas où ce sont des strings)
-    s_home = pd.to_numeric(df[home_col], errors="coerce")
-    s_away = pd.to_numeric(df[away_col], errors="coerce")
+    # Scores déjà numériques (schéma appliqué au chargement)
+    s_home = df[home_col]
+    s_away = df[away_col]
 
     # -- Filtrage
     mask = False
@@ -52,6 +46,22 @@ def filter_by_result(
 ##################################################################
 st.set_page_config(page_title="Historique", layout="wide")
 
+# Saison affichée (sidebar) et instantané de ses tables, lu par tout le rendu
+# de la page
+SAISONS = utils.seasons()
+SAISON = st.sidebar.selectbox(
+    "Saison",
+    SAISONS,
+    index=SAISONS.index(utils.current_season()) if utils.current_season() in SAISONS else 0,
+)
+utils.pin_snapshot(season=SAISON)
+
+# Bandeau "données en cache" si la source ne répond pas
+utils.cache_banner()
+
+# Mise à jour automatique quand une rencontre est enregistrée
+utils.live_refresh(("TABLE_INTERCLUB", "TABLE_MATCHS"))
+
 c1, c2, c3 = st.columns([3, 1, 1], gap="small")
 with c1:
     # -- Dropdown de filtrage d'équipe
@@ -72,13 +82,9 @@ with c3:
     )
 
 
-df = load_interclub_table()  # Chargement des données de la table 'INTERCLUB'
-
-# -- Filtre basé sur la division des équipes
-if categorie:  # si liste non vide
-    df = df[df["division"].isin(categorie)].reset_index(
-        drop=True
-    )  # adapte la colonne si besoin
+# Chargement des données de la table 'INTERCLUB', filtrées sur la division des
+# équipes si une est choisie (vue calculée une fois par version de la table)
+df = utils.load_table(utils.env, "TABLE_INTERCLUB", division=categorie or None)
 
 # -- Filtre basé sur la journée de rencontre des équipes
 if day:
@@ -91,11 +97,14 @@ if result:
 # -- Affichage du nombre de match trouvés en fonctions des filtres
 st.caption(f"{len(df)} matchs trouvés")
 
+# -- Dates affichées (colonne datetime typée au chargement)
+dates = df["date"].dt.strftime("%d-%m-%Y").fillna("")
+
 # -- Affichage des rencontres avec leurs détails
 for i in reversed(range(len(df))):
     if df["aob_score"].loc[i] > df["opponent_score"].loc[i]:  # Victoire de l'AOB
         utils.box_color_histo(
-            df["date"].loc[i],  # date de la recontre (format iso "DD-MM-YYYY")
+            dates.loc[i],  # date de la recontre (format iso "DD-MM-YYYY")
             df["journey"].loc[i],  # journée de la rencontre (ex: J2)
             df["id"].loc[i],  # identifiant unique de la recontre
             f'{df["aob_team"].loc[i]} ({df["division"].loc[i]})',  # nom de l'équipe de l'AOB (+ division)
@@ -108,7 +117,7 @@ for i in reversed(range(len(df))):
         df["aob_score"].loc[i] < df["opponent_score"].loc[i]
     ):  # Victoire de l'adversaire
         utils.box_color_histo(
-            df["date"].loc[i],
+            dates.loc[i],
             df["journey"].loc[i],
             df["id"].loc[i],
             f'{df["aob_team"].loc[i]} ({df["division"].loc[i]})',
@@ -119,7 +128,7 @@ for i in reversed(range(len(df))):
         )
     else:  # Match nul
         utils.box_color_histo(
-            df["date"].loc[i],
+            dates.loc[i],
             df["journey"].loc[i],
             df["id"].loc[i],
             f'{df["aob_team"].loc[i]} ({df["division"].loc[i]})',
@@ -1,17 +1,21 @@
 from datetime import date
 import streamlit as st
+import pandas as pd
 import utils
+import views
 from auth import check_record_password
 
-# 🔒 Accès administrateur
-if not check_record_password(page_key="admin", secret_path="admin.password"):
+# 🔒 Accès administrateur (mot de passe du club de la session)
+CLUB = utils.current_club()
+if not check_record_password(page_key=f"admin_{CLUB}" if CLUB else "admin", secret_path=utils.admin_secret(CLUB)):
     st.stop()
 
 ##################################################################
 #                          DONNEES                               #
 ##################################################################
 
-# --- Accès aux tables
+# --- Accès aux tables (instantané lu par tout le rendu de la page)
+utils.pin_snapshot()
 INTERCLUB_TABLE = utils.TABLE_INTERCLUB
 MATCHS_TABLE = utils.TABLE_MATCHS
 PLAYERS_TABLE = utils.TABLE_PLAYERS
@@ -24,35 +28,6 @@ EQUIPE_NOMS = ["AOB35-1", "AOB35-2", "AOB35-3", "AOB35-4"]
 ##################################################################
 #                         FONCTIONS                              #
 ##################################################################
-def winner(set1: str, set2: str, set3: str) -> None:
-    """Déterminer l'équipe victorieuse de la rencontre"""
-    winner_team = None
-    #
-    home_score = [
-        int(set1.split("/")[0]),
-        int(set2.split("/")[0]),
-        int(set3.split("/")[0]),
-    ]
-    away_score = [
-        int(set1.split("/")[1]),
-        int(set2.split("/")[1]),
-        int(set3.split("/")[1]),
-    ]
-    #
-    if set3 == "0/0":
-        if home_score[0] > away_score[0] and home_score[1] > away_score[1]:
-            winner_team = "aob"
-        else:
-            winner_team = "opponent"
-    else:
-        if home_score[2] > away_score[2]:
-            winner_team = "aob"
-        else:
-            winner_team = "opponent"
-
-    return winner_team
-
-
 def reset_sh1():
     """Reset du dropdown lors de la désélection"""
     # optionnel : oublie la sélection dépendante si la catégorie change
@@ -84,108 +59,87 @@ def afficher_popup(df_filtered, row_interclub):
             unsafe_allow_html=True,
         )
     #
+    # Scores et paires de joueurs décodés une seule fois
+    scores = views.match_scores(df_filtered)
+    index = utils.table_index()
     for k in range(len(df_filtered)):
         r1c1, r1c2, r1c3 = st.columns([4, 2, 4], gap="small")
         with r1c1:
             # Joueurs de l'AOB
-            if "/" in str(df_filtered["aob_player_id"].loc[k]):
-                p1_id = int(df_filtered["aob_player_id"].loc[k].split("/")[0])
-                p2_id = int(df_filtered["aob_player_id"].loc[k].split("/")[1])
-                #
-                p1_name = (
-                    PLAYERS_TABLE[PLAYERS_TABLE["id_player"] == int(p1_id)]
-                    .reset_index(drop=True)["name"]
-                    .loc[0]
-                )
-                p2_name = (
-                    PLAYERS_TABLE[PLAYERS_TABLE["id_player"] == int(p2_id)]
-                    .reset_index(drop=True)["name"]
-                    .loc[0]
-                )
+            if pd.notna(scores["aob_id2"].loc[k]):
+                p1_name = index.player_name(scores["aob_id1"].loc[k])
+                p2_name = index.player_name(scores["aob_id2"].loc[k])
                 utils.match_name_histo(
                     f"{p1_name}/{p2_name}",
                     df_filtered["aob_rank"].loc[k],
                     "left",
-                    utils.opacity_check(
-                        "aob",
-                        df_filtered["set1"].loc[k],
-                        df_filtered["set2"].loc[k],
-                        df_filtered["set3"].loc[k],
-                    ),
+                    utils.opacity_check("aob", scores.loc[k]),
                 )
             else:
                 utils.match_name_histo(
-                    PLAYERS_TABLE[
-                        PLAYERS_TABLE["id_player"]
-                        == int(df_filtered["aob_player_id"].loc[k])
-                    ]
-                    .reset_index(drop=True)["name"]
-                    .loc[0],
+                    index.player_name(scores["aob_id1"].loc[k]),
                     df_filtered["aob_rank"].loc[k],
                     "left",
-                    utils.opacity_check(
-                        "aob",
-                        df_filtered["set1"].loc[k],
-                        df_filtered["set2"].loc[k],
-                        df_filtered["set3"].loc[k],
-                    ),
+                    utils.opacity_check("aob", scores.loc[k]),
                 )
         with r1c2:
             # Scores des différents sets
-            utils.match_score_histo(
-                df_filtered["set1"].loc[k],
-                df_filtered["set2"].loc[k],
-                df_filtered["set3"].loc[k],
-            )
+            utils.match_score_histo(scores.loc[k])
         with r1c3:
             # Joueurs de l'extérieur
             utils.match_name_histo(
                 df_filtered["opponent_player"].loc[k],
                 df_filtered["opponent_rank"].loc[k],
                 "right",
-                utils.opacity_check(
-                    "opponent",
-                    df_filtered["set1"].loc[k],
-                    df_filtered["set2"].loc[k],
-                    df_filtered["set3"].loc[k],
-                ),
+                utils.opacity_check("opponent", scores.loc[k]),
             )
     
     if st.button("Enregistrer"):
-        # Ajouter les nouvelles lignes
-        if categorie == "H2":
-            utils.append_rows_sheet(
-                [sh1_row, sh2_row, sh3_row, sh4_row, dh1_row, dh2_row],
-                "TABLE_MATCHS",
-            )
-        elif categorie == "D5":
-            utils.append_rows_sheet(
-                [sh1_row, sh2_row, sd1_row, dh_row, dd_row, mx1_row, mx2_row],
-                "TABLE_MATCHS",
-            )
-        elif categorie == "V3":
-            utils.append_rows_sheet(
-                [sh1_row, sh2_row, dh_row, dd_row, mx1_row, mx2_row],
-                "TABLE_MATCHS",
-            )
-        else: # D2/D3/PR
-            utils.append_rows_sheet(
-                [
-                    sh1_row,
-                    sh2_row,
-                    sd1_row,
-                    sd2_row,
-                    dh_row,
-                    dd_row,
-                    mx1_row,
-                    mx2_row,
-                ],
-                "TABLE_MATCHS",
-            )
-        #
-        # Mise à jour de la table INTERCLUB
-        utils.append_row_sheet(row_interclub, "TABLE_INTERCLUB")
-        st.session_state["flash"] = ("success", "✅ Enregistrement effectué !")
+        try:
+            # Ajouter les nouvelles lignes (RAW : scores "21/15" écrits en texte, sans
+            # être interprétés comme des dates ; aucune formule dans ces lignes)
+            if categorie == "H2":
+                utils.append_rows_sheet(
+                    [sh1_row, sh2_row, sh3_row, sh4_row, dh1_row, dh2_row],
+                    "TABLE_MATCHS",
+                    raw=True,
+                )
+            elif categorie == "D5":
+                utils.append_rows_sheet(
+                    [sh1_row, sh2_row, sd1_row, dh_row, dd_row, mx1_row, mx2_row],
+                    "TABLE_MATCHS",
+                    raw=True,
+                )
+            elif categorie == "V3":
+                utils.append_rows_sheet(
+                    [sh1_row, sh2_row, dh_row, dd_row, mx1_row, mx2_row],
+                    "TABLE_MATCHS",
+                    raw=True,
+                )
+            else: # D2/D3/PR
+                utils.append_rows_sheet(
+                    [
+                        sh1_row,
+                        sh2_row,
+                        sd1_row,
+                        sd2_row,
+                        dh_row,
+                        dd_row,
+                        mx1_row,
+                        mx2_row,
+                    ],
+                    "TABLE_MATCHS",
+                    raw=True,
+                )
+            #
+            # Mise à jour de la table INTERCLUB
+            utils.append_row_sheet(row_interclub, "TABLE_INTERCLUB")
+        except Exception as e:
+            # Source injoignable (disjoncteur ouvert, quota...) : erreur affichée
+            # sur la page au lieu d'une trace dans la fenêtre
+            st.session_state["flash"] = ("error", f"❌ Enregistrement impossible : {e}")
+        else:
+            st.session_state["flash"] = ("success", "✅ Enregistrement effectué !")
         st.rerun()
 
 
@@ -200,6 +154,9 @@ if flash:
     level, text = flash
     getattr(st, level)(text)
 
+# Bandeau "données en cache" si la source ne répond pas
+utils.cache_banner()
+
 
 # -- Dropdown des différentes division de l'AOB
 categorie = st.selectbox("Catégorie", EQUIPE, key="categorie", on_change=reset_sh1)
@@ -359,11 +316,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh1_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh1_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh1_aob_set1")}/{st.session_state.get("sh1_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh1_aob_set2")}/{st.session_state.get("sh1_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
-                    ),
                 }
                 #
                 sh2_row = {
@@ -384,11 +336,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh2_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh2_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh2_aob_set1")}/{st.session_state.get("sh2_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh2_aob_set2")}/{st.session_state.get("sh2_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
-                    ),
                 }
                 #
                 sh3_row = {
@@ -409,11 +356,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh3_aob_set3")}/{st.session_state.get("sh3_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh3_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh3_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh3_aob_set1")}/{st.session_state.get("sh3_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh3_aob_set2")}/{st.session_state.get("sh3_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh3_aob_set3")}/{st.session_state.get("sh3_opponent_set3")}',
-                    ),
                 }
                 #
                 sh4_row = {
@@ -434,11 +376,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh4_aob_set3")}/{st.session_state.get("sh4_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh4_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh4_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh4_aob_set1")}/{st.session_state.get("sh4_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh4_aob_set2")}/{st.session_state.get("sh4_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh4_aob_set3")}/{st.session_state.get("sh4_opponent_set3")}',
-                    ),
                 }
                 #
                 dh1_row = {
@@ -455,11 +392,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dh1_aob_set3")}/{st.session_state.get("dh1_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dh1_aob1_grind"))}/{str(st.session_state.get("dh1_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dh1_opponent1_grind"))}/{str(st.session_state.get("dh1_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dh1_aob_set1")}/{st.session_state.get("dh1_opponent_set1")}',
-                        set2=f'{st.session_state.get("dh1_aob_set2")}/{st.session_state.get("dh1_opponent_set2")}',
-                        set3=f'{st.session_state.get("dh1_aob_set3")}/{st.session_state.get("dh1_opponent_set3")}',
-                    ),
                 }
                 #
                 dh2_row = {
@@ -476,11 +408,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dh2_aob_set3")}/{st.session_state.get("dh2_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dh2_aob1_grind"))}/{str(st.session_state.get("dh2_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dh2_opponent1_grind"))}/{str(st.session_state.get("dh2_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dh2_aob_set1")}/{st.session_state.get("dh2_opponent_set1")}',
-                        set2=f'{st.session_state.get("dh2_aob_set2")}/{st.session_state.get("dh2_opponent_set2")}',
-                        set3=f'{st.session_state.get("dh2_aob_set3")}/{st.session_state.get("dh2_opponent_set3")}',
-                    ),
                 }
                 #
                 match_df = utils.create_df_from_dict(
@@ -506,11 +433,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh1_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh1_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh1_aob_set1")}/{st.session_state.get("sh1_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh1_aob_set2")}/{st.session_state.get("sh1_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
-                    ),
                 }
                 #
                 sh2_row = {
@@ -531,11 +453,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh2_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh2_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh2_aob_set1")}/{st.session_state.get("sh2_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh2_aob_set2")}/{st.session_state.get("sh2_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
-                    ),
                 }
                 #
                 sd1_row = {
@@ -556,11 +473,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sd1_aob_set3")}/{st.session_state.get("sd1_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sd1_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sd1_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sd1_aob_set1")}/{st.session_state.get("sd1_opponent_set1")}',
-                        set2=f'{st.session_state.get("sd1_aob_set2")}/{st.session_state.get("sd1_opponent_set2")}',
-                        set3=f'{st.session_state.get("sd1_aob_set3")}/{st.session_state.get("sd1_opponent_set3")}',
-                    ),
                 }
                 #
                 dh_row = {
@@ -577,11 +489,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dh_aob_set3")}/{st.session_state.get("dh_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dh_aob1_grind"))}/{str(st.session_state.get("dh_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dh_opponent1_grind"))}/{str(st.session_state.get("dh_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dh_aob_set1")}/{st.session_state.get("dh_opponent_set1")}',
-                        set2=f'{st.session_state.get("dh_aob_set2")}/{st.session_state.get("dh_opponent_set2")}',
-                        set3=f'{st.session_state.get("dh_aob_set3")}/{st.session_state.get("dh_opponent_set3")}',
-                    ),
                 }
                 #
                 dd_row = {
@@ -598,11 +505,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dd_aob_set3")}/{st.session_state.get("dd_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dd_aob1_grind"))}/{str(st.session_state.get("dd_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dd_opponent1_grind"))}/{str(st.session_state.get("dd_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dd_aob_set1")}/{st.session_state.get("dd_opponent_set1")}',
-                        set2=f'{st.session_state.get("dd_aob_set2")}/{st.session_state.get("dd_opponent_set2")}',
-                        set3=f'{st.session_state.get("dd_aob_set3")}/{st.session_state.get("dd_opponent_set3")}',
-                    ),
                 }
                 #
                 mx1_row = {
@@ -619,11 +521,6 @@ if submitted:
                     "set3": f'{st.session_state.get("mx1_aob_set3")}/{st.session_state.get("mx1_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("mx1_aob1_grind"))}/{str(st.session_state.get("mx1_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("mx1_opponent1_grind"))}/{str(st.session_state.get("mx1_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("mx1_aob_set1")}/{st.session_state.get("mx1_opponent_set1")}',
-                        set2=f'{st.session_state.get("mx1_aob_set2")}/{st.session_state.get("mx1_opponent_set2")}',
-                        set3=f'{st.session_state.get("mx1_aob_set3")}/{st.session_state.get("mx1_opponent_set3")}',
-                    ),
                 }
                 #
                 mx2_row = {
@@ -640,11 +537,6 @@ if submitted:
                     "set3": f'{st.session_state.get("mx2_aob_set3")}/{st.session_state.get("mx2_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("mx2_aob1_grind"))}/{str(st.session_state.get("mx2_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("mx2_opponent1_grind"))}/{str(st.session_state.get("mx2_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("mx2_aob_set1")}/{st.session_state.get("mx2_opponent_set1")}',
-                        set2=f'{st.session_state.get("mx2_aob_set2")}/{st.session_state.get("mx2_opponent_set2")}',
-                        set3=f'{st.session_state.get("mx2_aob_set3")}/{st.session_state.get("mx2_opponent_set3")}',
-                    ),
                 }
                 #
                 match_df = utils.create_df_from_dict(
@@ -670,11 +562,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh1_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh1_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh1_aob_set1")}/{st.session_state.get("sh1_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh1_aob_set2")}/{st.session_state.get("sh1_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
-                    ),
                 }
                 #
                 sh2_row = {
@@ -695,11 +582,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh2_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh2_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh2_aob_set1")}/{st.session_state.get("sh2_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh2_aob_set2")}/{st.session_state.get("sh2_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
-                    ),
                 }
                 #
                 dh_row = {
@@ -716,11 +598,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dh_aob_set3")}/{st.session_state.get("dh_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dh_aob1_grind"))}/{str(st.session_state.get("dh_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dh_opponent1_grind"))}/{str(st.session_state.get("dh_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dh_aob_set1")}/{st.session_state.get("dh_opponent_set1")}',
-                        set2=f'{st.session_state.get("dh_aob_set2")}/{st.session_state.get("dh_opponent_set2")}',
-                        set3=f'{st.session_state.get("dh_aob_set3")}/{st.session_state.get("dh_opponent_set3")}',
-                    ),
                 }
                 #
                 dd_row = {
@@ -737,11 +614,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dd_aob_set3")}/{st.session_state.get("dd_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dd_aob1_grind"))}/{str(st.session_state.get("dd_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dd_opponent1_grind"))}/{str(st.session_state.get("dd_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dd_aob_set1")}/{st.session_state.get("dd_opponent_set1")}',
-                        set2=f'{st.session_state.get("dd_aob_set2")}/{st.session_state.get("dd_opponent_set2")}',
-                        set3=f'{st.session_state.get("dd_aob_set3")}/{st.session_state.get("dd_opponent_set3")}',
-                    ),
                 }
                 #
                 mx1_row = {
@@ -758,11 +630,6 @@ if submitted:
                     "set3": f'{st.session_state.get("mx1_aob_set3")}/{st.session_state.get("mx1_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("mx1_aob1_grind"))}/{str(st.session_state.get("mx1_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("mx1_opponent1_grind"))}/{str(st.session_state.get("mx1_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("mx1_aob_set1")}/{st.session_state.get("mx1_opponent_set1")}',
-                        set2=f'{st.session_state.get("mx1_aob_set2")}/{st.session_state.get("mx1_opponent_set2")}',
-                        set3=f'{st.session_state.get("mx1_aob_set3")}/{st.session_state.get("mx1_opponent_set3")}',
-                    ),
                 }
                 #
                 mx2_row = {
@@ -779,11 +646,6 @@ if submitted:
                     "set3": f'{st.session_state.get("mx2_aob_set3")}/{st.session_state.get("mx2_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("mx2_aob1_grind"))}/{str(st.session_state.get("mx2_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("mx2_opponent1_grind"))}/{str(st.session_state.get("mx2_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("mx2_aob_set1")}/{st.session_state.get("mx2_opponent_set1")}',
-                        set2=f'{st.session_state.get("mx2_aob_set2")}/{st.session_state.get("mx2_opponent_set2")}',
-                        set3=f'{st.session_state.get("mx2_aob_set3")}/{st.session_state.get("mx2_opponent_set3")}',
-                    ),
                 }
                 #
                 match_df = utils.create_df_from_dict(
@@ -809,11 +671,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh1_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh1_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh1_aob_set1")}/{st.session_state.get("sh1_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh1_aob_set2")}/{st.session_state.get("sh1_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh1_aob_set3")}/{st.session_state.get("sh1_opponent_set3")}',
-                    ),
                 }
                 #
                 sh2_row = {
@@ -834,11 +691,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sh2_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sh2_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sh2_aob_set1")}/{st.session_state.get("sh2_opponent_set1")}',
-                        set2=f'{st.session_state.get("sh2_aob_set2")}/{st.session_state.get("sh2_opponent_set2")}',
-                        set3=f'{st.session_state.get("sh2_aob_set3")}/{st.session_state.get("sh2_opponent_set3")}',
-                    ),
                 }
                 #
                 sd1_row = {
@@ -859,11 +711,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sd1_aob_set3")}/{st.session_state.get("sd1_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sd1_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sd1_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sd1_aob_set1")}/{st.session_state.get("sd1_opponent_set1")}',
-                        set2=f'{st.session_state.get("sd1_aob_set2")}/{st.session_state.get("sd1_opponent_set2")}',
-                        set3=f'{st.session_state.get("sd1_aob_set3")}/{st.session_state.get("sd1_opponent_set3")}',
-                    ),
                 }
                 #
                 sd2_row = {
@@ -884,11 +731,6 @@ if submitted:
                     "set3": f'{st.session_state.get("sd2_aob_set3")}/{st.session_state.get("sd2_opponent_set3")}',
                     "aob_grind": str(st.session_state.get("sd2_aob_grind")),
                     "opponent_grind": str(st.session_state.get("sd2_opponent_grind")),
-                    "win": winner(
-                        set1=f'{st.session_state.get("sd2_aob_set1")}/{st.session_state.get("sd2_opponent_set1")}',
-                        set2=f'{st.session_state.get("sd2_aob_set2")}/{st.session_state.get("sd2_opponent_set2")}',
-                        set3=f'{st.session_state.get("sd2_aob_set3")}/{st.session_state.get("sd2_opponent_set3")}',
-                    ),
                 }
                 #
                 dh_row = {
@@ -905,11 +747,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dh_aob_set3")}/{st.session_state.get("dh_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dh_aob1_grind"))}/{str(st.session_state.get("dh_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dh_opponent1_grind"))}/{str(st.session_state.get("dh_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dh_aob_set1")}/{st.session_state.get("dh_opponent_set1")}',
-                        set2=f'{st.session_state.get("dh_aob_set2")}/{st.session_state.get("dh_opponent_set2")}',
-                        set3=f'{st.session_state.get("dh_aob_set3")}/{st.session_state.get("dh_opponent_set3")}',
-                    ),
                 }
                 #
                 dd_row = {
@@ -926,11 +763,6 @@ if submitted:
                     "set3": f'{st.session_state.get("dd_aob_set3")}/{st.session_state.get("dd_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("dd_aob1_grind"))}/{str(st.session_state.get("dd_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("dd_opponent1_grind"))}/{str(st.session_state.get("dd_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("dd_aob_set1")}/{st.session_state.get("dd_opponent_set1")}',
-                        set2=f'{st.session_state.get("dd_aob_set2")}/{st.session_state.get("dd_opponent_set2")}',
-                        set3=f'{st.session_state.get("dd_aob_set3")}/{st.session_state.get("dd_opponent_set3")}',
-                    ),
                 }
                 #
                 mx1_row = {
@@ -947,11 +779,6 @@ if submitted:
                     "set3": f'{st.session_state.get("mx1_aob_set3")}/{st.session_state.get("mx1_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("mx1_aob1_grind"))}/{str(st.session_state.get("mx1_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("mx1_opponent1_grind"))}/{str(st.session_state.get("mx1_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("mx1_aob_set1")}/{st.session_state.get("mx1_opponent_set1")}',
-                        set2=f'{st.session_state.get("mx1_aob_set2")}/{st.session_state.get("mx1_opponent_set2")}',
-                        set3=f'{st.session_state.get("mx1_aob_set3")}/{st.session_state.get("mx1_opponent_set3")}',
-                    ),
                 }
                 #
                 mx2_row = {
@@ -968,11 +795,6 @@ if submitted:
                     "set3": f'{st.session_state.get("mx2_aob_set3")}/{st.session_state.get("mx2_opponent_set3")}',
                     "aob_grind": f'{str(st.session_state.get("mx2_aob1_grind"))}/{str(st.session_state.get("mx2_aob2_grind"))}',
                     "opponent_grind": f'{str(st.session_state.get("mx2_opponent1_grind"))}/{str(st.session_state.get("mx2_opponent2_grind"))}',
-                    "win": winner(
-                        set1=f'{st.session_state.get("mx2_aob_set1")}/{st.session_state.get("mx2_opponent_set1")}',
-                        set2=f'{st.session_state.get("mx2_aob_set2")}/{st.session_state.get("mx2_opponent_set2")}',
-                        set3=f'{st.session_state.get("mx2_aob_set3")}/{st.session_state.get("mx2_opponent_set3")}',
-                    ),
                 }
                 #
                 match_df = utils.create_df_from_dict(
@@ -992,7 +814,7 @@ if submitted:
             # Mise à jour de la table INTERCLUB
             row_interclub = {
                 # id;date;journey;division;aob_team;opponent_team;aob_score;opponent_score
-                "id": len(INTERCLUB_TABLE) + 1,
+                "id": utils.next_id("TABLE_INTERCLUB"),
                 "date": str(date_match),
                 "journey": f"J{journey}",
                 "division": categorie,
@@ -0,0 +1,45 @@
+import streamlit as st
+import pandas as pd
+import utils
+import diagnostics
+from auth import check_record_password
+
+# 🔒 Accès administrateur (mot de passe du club de la session)
+CLUB = utils.current_club()
+if not check_record_password(page_key=f"admin_{CLUB}" if CLUB else "admin", secret_path=utils.admin_secret(CLUB)):
+    st.stop()
+
+##################################################################
+#                        TEMPS D'IMPORT                          #
+##################################################################
+st.title("🩺 Diagnostics")
+st.subheader("Temps d'import au démarrage des pages")
+st.caption(
+    f"Mesure `python -X importtime` dans un interpréteur neuf, hors streamlit et pandas. "
+    f"Budget : {utils.IMPORT_BUDGET_MS} ms par page."
+)
+
+# Quelques secondes (un interpréteur par page) : seulement à la demande
+if st.button("Mesurer"):
+    st.session_state["import_report"] = diagnostics.measure_pages(utils.IMPORT_BUDGET_MS)
+
+report = st.session_state.get("import_report")
+if report:
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "Page": [row["page"] for row in report],
+                "Import (ms)": [row["total_ms"] for row in report],
+                "Budget": ["✅" if row["ok"] else "❌" for row in report],
+            }
+        ),
+        hide_index=True,
+    )
+    for row in report:
+        with st.expander(row["page"]):
+            st.dataframe(
+                pd.DataFrame(
+                    {"Module": list(row["modules"]), "Import (ms)": list(row["modules"].values())}
+                ),
+                hide_index=True,
+            )
@@ -0,0 +1,172 @@
+"""Requêtes SQL nommées sur les tables, exécutées par DuckDB (en mémoire).
+
+Les DataFrames typés sont exposés tels quels au moteur (sans copie) sous les
+noms `interclub`, `matchs`, `players` et `player_matches` (table longue, voir
+`views.player_matches`). Les agrégations (groupements, fenêtres) sont faites
+en SQL vectorisé et multi-thread au lieu de chaînes pandas.
+
+Les paramètres sont passés par nom (`$team`), jamais concaténés à la requête.
+"""
+
+import pandas as pd
+
+QUERIES = {
+    # Joueur ayant cumulé le plus de points, détail Simple / Double / Mixte
+    "point_eater": """
+        SELECT
+            name AS player,
+            sum(grind)::INTEGER AS points,
+            coalesce(sum(grind) FILTER (WHERE match_type = 'Simple'), 0)::INTEGER AS simple,
+            coalesce(sum(grind) FILTER (WHERE match_type = 'Double'), 0)::INTEGER AS double,
+            coalesce(sum(grind) FILTER (WHERE match_type = 'Mixte'), 0)::INTEGER AS mixte
+        FROM player_matches
+        GROUP BY name
+        ORDER BY points DESC, player
+        LIMIT 1
+    """,
+    # Plus longue série de matchs gagnés (points > 0), dans l'ordre chronologique
+    "win_streak": """
+        WITH results AS (
+            SELECT
+                name AS player,
+                coalesce(grind > 0, false) AS is_win,
+                -- Chaque défaite ouvre une nouvelle série
+                sum(CASE WHEN coalesce(grind > 0, false) THEN 0 ELSE 1 END) OVER (
+                    PARTITION BY name ORDER BY date, match ROWS UNBOUNDED PRECEDING
+                ) AS serie
+            FROM player_matches
+        ),
+        streaks AS (
+            SELECT player, count(*) FILTER (WHERE is_win) AS streak
+            FROM results
+            GROUP BY player, serie
+        )
+        SELECT player, max(streak)::INTEGER AS best_win_streak
+        FROM streaks
+        GROUP BY player
+        ORDER BY best_win_streak DESC, player
+        LIMIT 1
+    """,
+    # Joueur ayant disputé le plus de matchs
+    "match_marathoner": """
+        SELECT name AS player, count(*)::INTEGER AS nb_matchs
+        FROM player_matches
+        GROUP BY name
+        ORDER BY nb_matchs DESC, player
+        LIMIT 1
+    """,
+    # Match gagné avec le plus de points
+    "clutch_performer": """
+        SELECT name AS player, grind AS points
+        FROM player_matches
+        WHERE grind > 0
+        ORDER BY points DESC, player, date, match
+        LIMIT 1
+    """,
+    # Meilleur winrate global, détail Simple / Double / Mixte (NULL si aucun match)
+    "winrate_master": """
+        WITH results AS (
+            SELECT name, match_type, coalesce(grind > 0, false)::INTEGER AS is_win
+            FROM player_matches
+        )
+        SELECT
+            name AS player,
+            count(*)::INTEGER AS nb_matchs,
+            round(100 * avg(is_win), 1) AS winrate,
+            count(*) FILTER (WHERE match_type = 'Simple')::INTEGER AS nb_simple,
+            round(100 * avg(is_win) FILTER (WHERE match_type = 'Simple'), 1) AS winrate_simple,
+            count(*) FILTER (WHERE match_type = 'Double')::INTEGER AS nb_double,
+            round(100 * avg(is_win) FILTER (WHERE match_type = 'Double'), 1) AS winrate_double,
+            count(*) FILTER (WHERE match_type = 'Mixte')::INTEGER AS nb_mixte,
+            round(100 * avg(is_win) FILTER (WHERE match_type = 'Mixte'), 1) AS winrate_mixte
+        FROM results
+        GROUP BY name
+        ORDER BY winrate DESC, nb_matchs DESC, player
+        LIMIT 1
+    """,
+    # Rencontres gagnées / perdues / nulles du club
+    "club_results": """
+        SELECT
+            count(*) FILTER (WHERE aob_score > opponent_score)::INTEGER AS wins,
+            count(*) FILTER (WHERE aob_score < opponent_score)::INTEGER AS losses,
+            count(*) FILTER (WHERE aob_score = opponent_score)::INTEGER AS draws
+        FROM interclub
+    """,
+    # Matchs joués et gagnés par le club, par type (S / D / M)
+    "club_wins_by_type": """
+        SELECT
+            left(type_match::VARCHAR, 1) AS type,
+            count(*)::INTEGER AS played,
+            count(*) FILTER (WHERE win = 'aob')::INTEGER AS wins
+        FROM matchs
+        GROUP BY type
+    """,
+    # Bilan d'une équipe : rencontres (V/E/D) et matchs gagnés par type
+    "team_stats": """
+        WITH team_matchs AS (
+            SELECT m.id, left(m.type_match::VARCHAR, 1) AS type, m.win = 'aob' AS won
+            FROM matchs m JOIN interclub i ON m.id = i.id
+            WHERE i.division = $team
+        ),
+        team_interclub AS (
+            SELECT aob_score, opponent_score FROM interclub WHERE division = $team
+        )
+        SELECT
+            (SELECT count(DISTINCT id) FROM team_matchs)::INTEGER AS nb_rencontres,
+            (SELECT count(*) FILTER (WHERE aob_score > opponent_score) FROM team_interclub)::INTEGER AS wins,
+            (SELECT count(*) FILTER (WHERE aob_score = opponent_score) FROM team_interclub)::INTEGER AS draws,
+            (SELECT count(*) FILTER (WHERE aob_score < opponent_score) FROM team_interclub)::INTEGER AS losses,
+            count(*) FILTER (WHERE won)::INTEGER AS matchs_won,
+            count(*) FILTER (WHERE type = 'S')::INTEGER AS played_simple,
+            count(*) FILTER (WHERE type = 'S' AND won)::INTEGER AS won_simple,
+            count(*) FILTER (WHERE type = 'D')::INTEGER AS played_double,
+            count(*) FILTER (WHERE type = 'D' AND won)::INTEGER AS won_double,
+            count(*) FILTER (WHERE type = 'M')::INTEGER AS played_mixte,
+            count(*) FILTER (WHERE type = 'M' AND won)::INTEGER AS won_mixte
+        FROM team_matchs
+    """,
+    # Bilan de la saison par division (résumé précalculé des saisons archivées)
+    "season_summary": """
+        WITH matchs_by_id AS (
+            SELECT id, count(*) AS played, count(*) FILTER (WHERE win = 'aob') AS won
+            FROM matchs
+            GROUP BY id
+        )
+        SELECT
+            i.division::VARCHAR AS division,
+            count(*)::INTEGER AS nb_rencontres,
+            count(*) FILTER (WHERE i.aob_score > i.opponent_score)::INTEGER AS wins,
+            count(*) FILTER (WHERE i.aob_score = i.opponent_score)::INTEGER AS draws,
+            count(*) FILTER (WHERE i.aob_score < i.opponent_score)::INTEGER AS losses,
+            coalesce(sum(m.played), 0)::INTEGER AS nb_matchs,
+            coalesce(sum(m.won), 0)::INTEGER AS matchs_won
+        FROM interclub i LEFT JOIN matchs_by_id m ON m.id = i.id
+        GROUP BY i.division
+        ORDER BY division
+    """,
+}
+
+
+def run(name: str, tables: dict[str, pd.DataFrame], params: dict | None = None) -> pd.DataFrame:
+    """Exécute une requête nommée sur des DataFrames.
+
+    Args:
+        name (str): Nom de la requête (clé de `QUERIES`).
+        tables (dict[str, pd.DataFrame]): Tables exposées au SQL, par nom.
+        params (dict, optional): Paramètres nommés de la requête (ex: {"team": "D2"}).
+
+    Returns:
+        pd.DataFrame: Résultat de la requête.
+    """
+    # Import au premier calcul (pas au démarrage des pages sans statistiques)
+    import duckdb
+
+    sql = QUERIES[name]
+    # Base en mémoire éphémère : une connexion par requête (sessions concurrentes)
+    con = duckdb.connect()
+    try:
+        for table, df in tables.items():
+            con.register(table, df)
+        return con.execute(sql, params or {}).df()
+    finally:
+        con.close()
@@ -0,0 +1,58 @@
+"""Quota d'appels à la source des tables, par club.
+
+Quand l'app sert plusieurs clubs, leurs Google Sheets sont lus avec le même
+compte de service : le quota de l'API (requêtes par minute) leur est commun.
+Sans limite par club, un club dont les pages relisent souvent son Sheet
+consommerait le quota des autres. Chaque club a donc son seau de jetons :
+`per_minute` appels par minute, en rafale jusqu'à `burst`. Un appel sans
+jeton attend le suivant (au plus `timeout` secondes).
+"""
+
+import threading
+import time
+
+
+class QuotaExceeded(RuntimeError):
+    """Quota du club épuisé pendant toute l'attente autorisée."""
+
+
+class RateLimiter:
+    """Seau de jetons partagé par les threads d'un club (sessions, rechargement)."""
+
+    def __init__(self, per_minute: float, burst: int | None = None, timeout: float = 60):
+        """
+        Args:
+            per_minute (float): Appels autorisés par minute.
+            burst (int, optional): Appels possibles d'affilée (par défaut, le
+                quota d'une minute).
+            timeout (float, optional): Attente maximale (s) d'un jeton.
+        """
+        self._rate = per_minute / 60
+        self._capacity = max(1, burst or int(per_minute))
+        self._timeout = timeout
+        self._tokens = float(self._capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        # Prend un jeton (0 = pris) ou renvoie l'attente (s) du prochain
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self._rate
+
+    def acquire(self):
+        """Attend un jeton du quota.
+
+        Raises:
+            QuotaExceeded: Aucun jeton libre avant `timeout`.
+        """
+        deadline = time.monotonic() + self._timeout
+        while (wait := self._take()) > 0:
+            if time.monotonic() + wait > deadline:
+                raise QuotaExceeded(f"Quota de {self._rate * 60:g} appels/min épuisé")
+            time.sleep(wait)
@@ -0,0 +1,105 @@
+"""Rafraîchissement des tables en tâche de fond ("stale-while-revalidate").
+
+Un thread relit les tables à intervalle régulier. Pendant la lecture, les
+sessions continuent d'être servies par les tables déjà en mémoire ; les
+tables modifiées sont ensuite remplacées d'un bloc dans le store (nouveau
+jeton de version). Les reruns n'attendent donc jamais le réseau, et les
+modifications faites directement dans le Google Sheet finissent par
+apparaître dans l'app sans redémarrage.
+"""
+
+import logging
+import threading
+import time
+
+import backends
+import store
+
+logger = logging.getLogger(__name__)
+
+
+class Refresher:
+    """Thread de rechargement périodique d'un `TableStore` depuis un backend."""
+
+    def __init__(
+        self,
+        table_store: store.TableStore,
+        backend: backends.Backend,
+        tables: tuple,
+        interval: float,
+        on_refresh=None,
+    ):
+        """
+        Args:
+            table_store (store.TableStore): Tables servies aux sessions.
+            backend (backends.Backend): Source des tables.
+            tables (tuple): Noms des tables à recharger.
+            interval (float): Délai (s) entre deux rechargements.
+            on_refresh (callable, optional): Appelée avec la liste des tables
+                remplacées, après chaque remplacement.
+        """
+        self._store = table_store
+        self._backend = backend
+        self._tables = tuple(tables)
+        self._interval = interval
+        self._on_refresh = on_refresh
+        self._revision = None  # révision de la source au dernier rechargement
+        self._stop = threading.Event()
+        self._thread = None
+        self.last_error = None  # dernière erreur de lecture (None si OK)
+        self.last_success = None  # heure (time.time()) du dernier rechargement réussi
+
+    def start(self) -> "Refresher":
+        """Démarre le thread (daemon : il ne bloque pas l'arrêt du serveur)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="tables-refresher", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Arrête le thread après le rechargement en cours."""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # On garde les dernières tables valides, nouvel essai au prochain tour
+                self.last_error = e
+                logger.warning("Rechargement des tables impossible : %s", e)
+
+    def refresh(self) -> list[str]:
+        """Recharge les tables si la source a changé et remplace celles modifiées.
+
+        Returns:
+            list[str]: Noms des tables remplacées.
+        """
+        # Source inchangée depuis le dernier rechargement : rien à relire
+        revision = self._backend.revision()
+        if revision is not None and revision == self._revision:
+            self.last_error, self.last_success = None, time.time()
+            return []
+
+        before = self._store.snapshot()
+        expected = {table: before.version(table) for table in self._tables}
+        tables = self._backend.load_tables(self._tables)
+        replaced = self._store.replace(tables, expected)
+        self.last_error = None
+        self.last_success = time.time()
+
+        # Une table modifiée pendant la lecture (écriture de l'app) n'a pas été
+        # remplacée : elle sera relue au prochain tour
+        after = self._store.snapshot()
+        skipped = [
+            table
+            for table in self._tables
+            if table not in replaced and after.version(table) != expected[table]
+        ]
+        self._revision = None if skipped else revision
+
+        if replaced and self._on_refresh is not None:
+            self._on_refresh(replaced)
+        return replaced
@@ -0,0 +1,132 @@
+"""Accès résilient à une source lente ou en erreur (quota, 5xx, réseau).
+
+- Les lectures (idempotentes) sont retentées sur les erreurs passagères,
+  avec un délai exponentiel et aléatoire ("full jitter") : les sessions et
+  replicas qui échouent en même temps ne réessaient pas en même temps. La
+  durée totale des essais est bornée (`deadline`).
+- Un disjoncteur s'ouvre après `failures` échecs consécutifs : pendant
+  `reset_timeout` secondes, les appels échouent aussitôt (`CircuitOpen`)
+  au lieu d'attendre une source en panne, puis un seul appel d'essai décide
+  de sa fermeture.
+
+Pendant ce temps l'app sert les dernières tables valides (en mémoire ou
+snapshot local) avec un bandeau "données en cache" (voir `utils.cache_banner`).
+"""
+
+import random
+import threading
+import time
+
+
+class CircuitOpen(RuntimeError):
+    """Source coupée par le disjoncteur (trop d'échecs récents)."""
+
+
+class CircuitBreaker:
+    """Disjoncteur fermé / ouvert / semi-ouvert, partagé par les threads d'une source."""
+
+    def __init__(self, failures: int = 5, reset_timeout: float = 60):
+        """
+        Args:
+            failures (int, optional): Échecs consécutifs qui ouvrent le disjoncteur.
+            reset_timeout (float, optional): Durée (s) d'ouverture avant un appel d'essai.
+        """
+        self._threshold = failures
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None  # heure d'ouverture (None = fermé)
+        self._trial = False  # appel d'essai en cours (semi-ouvert)
+
+    @property
+    def is_open(self) -> bool:
+        """Vrai tant que la source est considérée en panne (ouvert ou semi-ouvert)."""
+        return self._opened_at is not None
+
+    def before_call(self):
+        """Autorise un appel, ou lève `CircuitOpen`.
+
+        Raises:
+            CircuitOpen: Disjoncteur ouvert (ou appel d'essai déjà en cours).
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if not self._trial and time.monotonic() - self._opened_at >= self._reset_timeout:
+                self._trial = True  # un seul appel d'essai à la fois
+                return
+        raise CircuitOpen("Source des données indisponible (trop d'erreurs récentes)")
+
+    def success(self):
+        with self._lock:
+            self._failures, self._opened_at, self._trial = 0, None, False
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self._threshold:
+                # Ouverture, ou réouverture après un appel d'essai raté
+                self._opened_at, self._trial = time.monotonic(), False
+
+    def call(self, fn, transient=lambda e: True):
+        """Exécute `fn()` à travers le disjoncteur.
+
+        Args:
+            fn (callable): Appel à la source.
+            transient (callable, optional): `(exception) -> bool` : seules ces
+                erreurs comptent comme une panne (une autre erreur prouve que
+                la source répond).
+
+        Raises:
+            CircuitOpen: Disjoncteur ouvert.
+        """
+        self.before_call()
+        try:
+            result = fn()
+        except Exception as e:
+            if transient(e):
+                self.failure()
+            else:
+                self.success()
+            raise
+        self.success()
+        return result
+
+
+def retry(
+    fn,
+    transient,
+    attempts: int = 4,
+    base_delay: float = 0.5,
+    max_delay: float = 8,
+    deadline: float = 20,
+):
+    """Exécute `fn()` en retentant les erreurs passagères.
+
+    Args:
+        fn (callable): Appel idempotent (lecture).
+        transient (callable): `(exception) -> bool`, vrai si l'erreur mérite
+            un nouvel essai (quota, 5xx, coupure réseau).
+        attempts (int, optional): Nombre maximal d'essais.
+        base_delay (float, optional): Délai (s) avant le 2e essai, doublé ensuite.
+        max_delay (float, optional): Délai maximal (s) entre deux essais.
+        deadline (float, optional): Durée maximale (s) de tous les essais.
+
+    Returns:
+        Le résultat du premier essai réussi.
+
+    Raises:
+        Exception: L'erreur du dernier essai (ou une erreur non passagère).
+    """
+    end = time.monotonic() + deadline
+    for attempt in range(attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == attempts - 1 or not transient(e):
+                raise
+            # Full jitter : délai aléatoire entre 0 et le plafond exponentiel
+            delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+            if time.monotonic() + delay > end:
+                raise
+            time.sleep(delay)
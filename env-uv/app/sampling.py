@@ -0,0 +1,84 @@
+"""Échantillonnage stratifié des tables (jeux de données volumineux en dev).
+
+Des rencontres entières sont gardées (toutes les lignes de TABLE_MATCHS de
+même id), tirées dans chaque groupe (division, saison), ainsi que les joueurs
+qu'elles référencent. Le tirage dépend seulement de l'id de la rencontre et
+de la graine : il reste le même d'un rechargement à l'autre, et une nouvelle
+rencontre est gardée ou non sans changer le reste de l'échantillon.
+"""
+
+import math
+
+import pandas as pd
+
+import schema
+import views
+
+
+def season(dates: pd.Series) -> pd.Series:
+    """Saison sportive d'une date ("2025/26" de septembre 2025 à août 2026)."""
+    start = dates.dt.year.astype("Int64") - (dates.dt.month.astype("Int64") < 9).astype("Int64")
+    return (start.astype("string") + "/" + ((start + 1) % 100).astype("string").str.zfill(2)).fillna("")
+
+
+def season_bounds(name: str) -> tuple[pd.Timestamp, pd.Timestamp]:
+    """Premier et dernier jour d'une saison ("2025/26" -> 01/09/2025, 31/08/2026)."""
+    start = int(str(name).split("/")[0])
+    return pd.Timestamp(start, 9, 1), pd.Timestamp(start + 1, 8, 31)
+
+
+def sample_tables(
+    tables: dict[str, pd.DataFrame], fraction: float, seed: int = 0
+) -> dict[str, pd.DataFrame]:
+    """Garde une fraction des rencontres de chaque (division, saison).
+
+    Args:
+        tables (dict[str, pd.DataFrame]): TABLE_INTERCLUB, TABLE_MATCHS et
+            TABLE_PLAYERS (brutes ou typées).
+        fraction (float): Part des rencontres gardées dans chaque groupe
+            (au moins une par groupe).
+        seed (int, optional): Graine du tirage.
+
+    Returns:
+        dict[str, pd.DataFrame]: Les mêmes tables, réduites à l'échantillon.
+    """
+    if fraction >= 1:
+        return tables
+
+    interclub = schema.apply_schema("TABLE_INTERCLUB", tables["TABLE_INTERCLUB"])
+    ids = interclub["id"]
+    groups = pd.DataFrame(
+        {
+            "id": ids,
+            "division": interclub["division"].astype("string").fillna(""),
+            "season": season(interclub["date"]),
+            # Rang pseudo-aléatoire stable de chaque rencontre
+            "rank": pd.util.hash_array(
+                (ids.astype("string").fillna("") + f":{seed}").to_numpy(dtype=object)
+            ),
+        }
+    )
+    kept = set()
+    for _, group in groups.groupby(["division", "season"]):
+        n = max(1, math.ceil(fraction * len(group)))
+        kept.update(group.nsmallest(n, "rank")["id"].dropna().astype(int))
+
+    matchs_ids = pd.to_numeric(tables["TABLE_MATCHS"]["id"], errors="coerce")
+    matchs = tables["TABLE_MATCHS"][matchs_ids.isin(kept)].reset_index(drop=True)
+
+    # Joueurs de l'AOB présents dans les matchs gardés
+    first, second = views.split_pair(matchs["aob_player_id"])
+    referenced = pd.concat([first, second]).pipe(pd.to_numeric, errors="coerce").dropna()
+    players_ids = pd.to_numeric(tables["TABLE_PLAYERS"]["id_player"], errors="coerce")
+
+    return {
+        **tables,
+        "TABLE_INTERCLUB": tables["TABLE_INTERCLUB"][
+            ids.isin(kept).to_numpy(dtype=bool)
+        ].reset_index(drop=True),
+        "TABLE_MATCHS": matchs,
+        "TABLE_PLAYERS": tables["TABLE_PLAYERS"][
+            players_ids.isin(referenced.astype(int))
+        ].reset_index(drop=True),
+    }
+
@@ -0,0 +1,108 @@
+"""Schéma typé des tables, appliqué une seule fois au chargement.
+
+Les pages lisent directement des colonnes typées (dates, entiers, catégories)
+au lieu de refaire `astype(str)`, `pd.to_datetime` ou `pd.to_numeric` à chaque
+rerun. Les champs composés ("12/34", "D8/P10", "+5/-3", "21/15") restent du
+texte (Arrow) : ils sont découpés par les vues dérivées.
+"""
+
+import pandas as pd
+
+# Texte stocké en Arrow (plus compact que des objets Python)
+TEXT = "string[pyarrow]"
+DATE = "datetime"
+CATEGORY = "category"
+
+SCHEMAS = {
+    "TABLE_INTERCLUB": {
+        "id": "Int32",
+        "date": DATE,
+        "journey": CATEGORY,
+        "division": CATEGORY,
+        "aob_team": TEXT,
+        "opponent_team": TEXT,
+        "aob_score": "Int8",
+        "opponent_score": "Int8",
+    },
+    "TABLE_MATCHS": {
+        "id": "Int32",
+        "type_match": CATEGORY,
+        "aob_player_id": TEXT,
+        "opponent_player": TEXT,
+        "aob_rank": CATEGORY,
+        "opponent_rank": CATEGORY,
+        "aob_pts": TEXT,
+        "opponent_pts": TEXT,
+        "set1": TEXT,
+        "set2": TEXT,
+        "set3": TEXT,
+        "aob_grind": TEXT,
+        "opponent_grind": TEXT,
+        "win": CATEGORY,
+    },
+    "TABLE_PLAYERS": {
+        "id_player": "Int32",
+        "name": TEXT,
+        "division": CATEGORY,
+        "gender": CATEGORY,
+        "age": "Int8",
+    },
+}
+
+# Casse normalisée au chargement ("sh1" -> "SH1", "AOB" -> "aob")
+CASES = {
+    "type_match": "upper",
+    "win": "lower",
+}
+
+
+def apply_schema(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Convertit les colonnes d'une table selon son schéma.
+
+    Les colonnes absentes du schéma sont conservées telles quelles. La
+    conversion est idempotente : elle peut être réappliquée à une table
+    déjà typée (ex: après l'ajout de lignes).
+
+    Args:
+        table (str): Nom de la table.
+        df (pd.DataFrame): Table brute (sortie de `get_all_records` / `read_csv`).
+
+    Returns:
+        pd.DataFrame: Table typée.
+    """
+    schema = SCHEMAS.get(table)
+    if schema is None or df.columns.empty:
+        return df
+
+    columns = {}
+    for col in df.columns:
+        dtype = schema.get(col)
+        columns[col] = df[col] if dtype is None else _convert(df[col], dtype, CASES.get(col))
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _convert(s: pd.Series, dtype: str, case: str | None = None) -> pd.Series:
+    """Conversion d'une colonne vers son type déclaré."""
+    if dtype == DATE:
+        return pd.to_datetime(s, errors="coerce")
+    if dtype in (TEXT, CATEGORY):
+        text = _text(s)
+        if case == "upper":
+            text = text.str.upper()
+        elif case == "lower":
+            text = text.str.lower()
+        if dtype == CATEGORY:
+            # Catégories en str Python : avec des catégories Arrow, `.str.split`
+            # renverrait des listes converties en texte ("['H2']")
+            return text.astype(object).astype(CATEGORY)
+        return text
+    # Entiers nullables ("" ou valeur invalide -> <NA>)
+    return pd.to_numeric(s, errors="coerce").astype(dtype)
+
+
+def _text(s: pd.Series) -> pd.Series:
+    """Texte Arrow, cellules vides -> "" (comme dans le Google Sheet)."""
+    if pd.api.types.is_float_dtype(s) and (s.dropna() % 1 == 0).all():
+        # Colonne d'entiers lue en float à cause de cellules vides (read_csv)
+        s = s.astype("Int64")
+    return s.astype(TEXT).fillna("")
@@ -0,0 +1,229 @@
+"""Cache partagé entre plusieurs replicas de l'app (optionnel).
+
+`st.cache_resource` / `st.cache_data` sont propres à chaque processus : avec
+plusieurs replicas, chacun relirait le Google Sheet et recalculerait les
+mêmes agrégats. Ce cache les partage, par clé de version des données :
+
+- les tables brutes d'une révision de la source (voir `backends.SharedCacheBackend`) ;
+- les résultats des requêtes d'un même contenu de tables (voir `utils.query`).
+
+Deux stockages : des fichiers dans un dossier commun (par défaut) ou un
+serveur compatible Redis (Redis, Valkey, KeyDB...). Pendant qu'un replica
+calcule une entrée, les autres attendent son résultat (verrou par clé) au
+lieu de lancer le même calcul.
+
+Les entrées sont sérialisées avec pickle : ne partager le dossier / serveur
+qu'entre replicas de confiance.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+
+def fingerprint(tables) -> str:
+    """Empreinte du contenu de tables (identique d'un replica à l'autre).
+
+    Args:
+        tables (Mapping[str, pd.DataFrame]): Tables, par nom.
+
+    Returns:
+        str: Empreinte hexadécimale (noms, colonnes et valeurs des tables).
+    """
+    digest = hashlib.sha1()
+    for name in sorted(tables):
+        df = tables[name]
+        digest.update(repr((name, list(df.columns), len(df))).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class SharedCache:
+    """Interface commune des stockages du cache partagé."""
+
+    def __init__(self, ttl: float = 86400, lock_timeout: float = 60):
+        """
+        Args:
+            ttl (float, optional): Durée de vie (s) des entrées.
+            lock_timeout (float, optional): Attente maximale (s) du calcul d'une
+                entrée par un autre replica (au-delà, on calcule soi-même).
+        """
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+
+    def get_bytes(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    def set_bytes(self, key: str, value: bytes):
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self, key: str):
+        """Verrou entre replicas sur une clé (attente bornée par `lock_timeout`)."""
+        raise NotImplementedError
+        yield
+
+    def get(self, key: str):
+        """Valeur d'une entrée (None si absente, expirée ou illisible)."""
+        try:
+            data = self.get_bytes(key)
+            return None if data is None else pickle.loads(data)
+        except Exception:
+            # Le cache n'est qu'une optimisation : une erreur vaut une absence
+            return None
+
+    def set(self, key: str, value):
+        try:
+            self.set_bytes(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            pass
+
+    def get_or_compute(self, key: str, compute):
+        """Valeur partagée d'une entrée, calculée par un seul replica à la fois.
+
+        Args:
+            key (str): Clé de l'entrée (doit inclure la version des données).
+            compute (callable): Calcul de la valeur si elle est absente.
+
+        Returns:
+            La valeur en cache, ou celle calculée (puis partagée).
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self.lock(key):
+            # Calculée par un autre replica pendant l'attente du verrou ?
+            value = self.get(key)
+            if value is None:
+                value = compute()
+                self.set(key, value)
+        return value
+
+
+class FileCache(SharedCache):
+    """Cache dans un dossier partagé par les replicas (même machine ou volume).
+
+    Une entrée par fichier, écrite à côté puis renommée (jamais lue à moitié).
+    Le verrou d'une clé est un fichier créé en exclusif ; un verrou plus vieux
+    que `lock_timeout` (replica arrêté pendant un calcul) est ignoré.
+    """
+
+    def __init__(self, directory: Path, ttl: float = 86400, lock_timeout: float = 60):
+        super().__init__(ttl, lock_timeout)
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str, suffix: str = ".pkl") -> Path:
+        return self._dir / (hashlib.sha1(key.encode()).hexdigest() + suffix)
+
+    def get_bytes(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def set_bytes(self, key: str, value: bytes):
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(value)
+        os.replace(tmp, path)
+
+    @contextmanager
+    def lock(self, key: str):
+        path = self._path(key, ".lock")
+        deadline = time.monotonic() + self.lock_timeout
+        acquired = False
+        while not acquired:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                acquired = True
+            except FileExistsError:
+                try:
+                    stale = time.time() - path.stat().st_mtime > self.lock_timeout
+                except OSError:
+                    stale = False  # libéré entre-temps
+                if stale:
+                    path.unlink(missing_ok=True)
+                elif time.monotonic() > deadline:
+                    break  # calcul sans verrou plutôt qu'attendre indéfiniment
+                else:
+                    time.sleep(0.05)
+            except OSError:
+                break  # dossier en lecture seule : pas de verrou
+        try:
+            yield
+        finally:
+            if acquired:
+                path.unlink(missing_ok=True)
+
+
+class RedisCache(SharedCache):
+    """Cache sur un serveur compatible Redis (paquet `redis` requis)."""
+
+    def __init__(self, url: str, ttl: float = 86400, lock_timeout: float = 60, prefix: str = ""):
+        super().__init__(ttl, lock_timeout)
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get_bytes(self, key: str) -> bytes | None:
+        return self._client.get(self._prefix + key)
+
+    def set_bytes(self, key: str, value: bytes):
+        self._client.set(self._prefix + key, value, ex=int(self.ttl))
+
+    @contextmanager
+    def lock(self, key: str):
+        # Expire seul si le replica qui le tient s'arrête pendant le calcul
+        lock = self._client.lock(
+            f"{self._prefix}lock:{key}",
+            timeout=self.lock_timeout,
+            blocking_timeout=self.lock_timeout,
+        )
+        try:
+            acquired = lock.acquire()
+        except Exception:
+            acquired = False
+        try:
+            yield
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except Exception:
+                    pass  # verrou expiré entre-temps
+
+
+def open_cache(
+    kind: str, path: Path, url: str, ttl: float, lock_timeout: float, prefix: str = ""
+) -> SharedCache | None:
+    """Cache partagé configuré (None si désactivé).
+
+    Args:
+        kind (str): "none", "file" ou "redis".
+        path (Path): Dossier du cache "file".
+        url (str): Adresse du serveur du cache "redis".
+        ttl (float): Durée de vie (s) des entrées.
+        lock_timeout (float): Attente maximale (s) du calcul d'un autre replica.
+        prefix (str, optional): Préfixe des clés Redis (plusieurs apps par serveur).
+
+    Returns:
+        SharedCache | None: Le cache, ou None si `kind` vaut "none".
+    """
+    if not kind or kind == "none":
+        return None
+    if kind == "file":
+        return FileCache(path, ttl=ttl, lock_timeout=lock_timeout)
+    if kind == "redis":
+        return RedisCache(url, ttl=ttl, lock_timeout=lock_timeout, prefix=prefix)
+    raise ValueError(f"Cache partagé inconnu : {kind}")
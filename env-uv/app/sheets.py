@@ -0,0 +1,151 @@
+"""Connexion au Google Sheet : handles et en-têtes gardés en mémoire.
+
+Le Spreadsheet, ses onglets (Worksheet) et la ligne d'en-têtes de chaque
+onglet sont conservés pendant `ttl` secondes. Une écriture ne coûte alors
+qu'une requête (`values.append`) au lieu de open_by_key + worksheet +
+row_values + append.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # gspread n'est importé qu'avec le client (voir utils._gspread_client)
+    import gspread
+
+
+# Réponses de l'API à retenter : quota dépassé et erreurs serveur
+TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+def is_transient(error: Exception) -> bool:
+    """Vrai si une erreur d'accès au Google Sheet est passagère (quota, 5xx,
+    coupure ou lenteur réseau) : la même lecture peut réussir un peu plus tard."""
+    from gspread.exceptions import APIError
+    from requests.exceptions import ConnectionError, Timeout
+
+    if isinstance(error, APIError):
+        return getattr(error.response, "status_code", None) in TRANSIENT_STATUS
+    return isinstance(error, (ConnectionError, Timeout, TimeoutError))
+
+
+class SheetConnection:
+    """Handles et en-têtes d'un Google Sheet, avec expiration et invalidation."""
+
+    def __init__(self, gc: gspread.Client, sheet_id: str, ttl: float = 600):
+        self._gc = gc
+        self._sheet_id = sheet_id
+        self._ttl = ttl
+        self._lock = threading.RLock()
+        self._spreadsheet = None  # (horodatage, Spreadsheet)
+        self._worksheets = None  # (horodatage, {titre: Worksheet})
+        self._headers = {}  # {titre: (horodatage, [en-têtes])}
+
+    def revision(self) -> str | None:
+        """Révision du document (date de dernière modification via l'API Drive).
+
+        Retourne None si elle ne peut pas être lue : une lecture complète est alors faite.
+        """
+        from gspread.exceptions import APIError
+
+        try:
+            return self._gc.http_client.get_file_drive_metadata(self._sheet_id).get(
+                "modifiedTime"
+            )
+        except APIError:
+            return None
+
+    def batch_get(self, titles: tuple) -> dict[str, list[list]]:
+        """Lit plusieurs onglets entiers en une seule requête `values.batchGet`.
+
+        Les en-têtes lus sont gardés pour les écritures suivantes (pas de row_values).
+        """
+        # Un onglet entier par plage ("'TABLE_MATCHS'" = toutes les cellules)
+        values = dict(zip(titles, self.batch_get_ranges([f"'{t}'" for t in titles])))
+        for title, rows in values.items():
+            if rows:
+                self.set_headers(title, rows[0])
+        return values
+
+    def batch_get_ranges(self, ranges: list[str], major_dimension: str = "ROWS") -> list[list[list]]:
+        """Lit plusieurs plages A1 ("'TABLE_MATCHS'!A340:N") en une seule requête.
+
+        Les valeurs sont lues non formatées (UNFORMATTED_VALUE) : les nombres
+        arrivent en nombres JSON, sans format d'affichage à re-parser. Les dates
+        restent en texte (FORMATTED_STRING) plutôt qu'en numéros de série.
+
+        Args:
+            ranges (list[str]): Plages A1.
+            major_dimension (str, optional): "ROWS" (lignes) ou "COLUMNS" (une
+                liste de valeurs par colonne de la plage).
+
+        Returns:
+            list[list[list]]: Les lignes (ou colonnes) de chaque plage, dans l'ordre demandé.
+        """
+        params = {
+            "valueRenderOption": "UNFORMATTED_VALUE",
+            "dateTimeRenderOption": "FORMATTED_STRING",
+            "majorDimension": major_dimension,
+        }
+        resp = self._gc.http_client.values_batch_get(self._sheet_id, ranges, params=params)
+        value_ranges = resp.get("valueRanges", [])
+        return [vr.get("values", []) for vr in value_ranges]
+
+    def _fresh(self, loaded_at: float) -> bool:
+        return time.monotonic() - loaded_at < self._ttl
+
+    def spreadsheet(self) -> gspread.Spreadsheet:
+        """Handle du document (open_by_key seulement si absent ou expiré)."""
+        with self._lock:
+            if self._spreadsheet is None or not self._fresh(self._spreadsheet[0]):
+                self._spreadsheet = (time.monotonic(), self._gc.open_by_key(self._sheet_id))
+                self._worksheets = None
+            return self._spreadsheet[1]
+
+    def worksheet(self, title: str) -> gspread.Worksheet:
+        """Récupère un onglet par nom, crée si absent.
+
+        Tous les onglets sont récupérés en une requête et gardés en mémoire.
+        """
+        with self._lock:
+            sh = self.spreadsheet()
+            if self._worksheets is None or not self._fresh(self._worksheets[0]):
+                self._worksheets = (
+                    time.monotonic(),
+                    {ws.title: ws for ws in sh.worksheets()},
+                )
+            worksheets = self._worksheets[1]
+            if title not in worksheets:
+                worksheets[title] = sh.add_worksheet(title=title, rows=1000, cols=26)
+                self._headers.pop(title, None)
+            return worksheets[title]
+
+    def headers(self, title: str) -> list[str]:
+        """Ligne d'en-têtes d'un onglet (lue seulement si absente ou expirée)."""
+        with self._lock:
+            cached = self._headers.get(title)
+            if cached is not None and self._fresh(cached[0]):
+                return cached[1]
+            headers = self.worksheet(title).row_values(1)
+            self.set_headers(title, headers)
+            return headers
+
+    def set_headers(self, title: str, headers: list[str]):
+        """Renseigne les en-têtes d'un onglet déjà connus (ex: lecture groupée)."""
+        with self._lock:
+            self._headers[title] = (time.monotonic(), list(headers))
+
+    def invalidate(self, title: str | None = None):
+        """Oublie les handles/en-têtes d'un onglet (ou de tout le document)."""
+        with self._lock:
+            if title is None:
+                self._spreadsheet = None
+                self._worksheets = None
+                self._headers.clear()
+            else:
+                # La liste des onglets est relue (l'onglet a pu être renommé)
+                self._headers.pop(title, None)
+                self._worksheets = None
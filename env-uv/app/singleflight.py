@@ -0,0 +1,66 @@
+"""Chargements "single-flight" partagés par toutes les sessions du processus.
+
+Quand plusieurs sessions demandent la même donnée en même temps (démarrage à
+froid, rechargement après une écriture), seul le premier appelant lit la
+source : les autres attendent son résultat (ou son erreur) au lieu de lancer
+chacun leur propre lecture, ce qui évite les rafales de requêtes vers l'API
+Google Sheets (erreurs de quota).
+"""
+
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+
+class SingleFlight:
+    """Un seul calcul en cours par clé, partagé par les appelants concurrents."""
+
+    def __init__(self, timeout: float | None = 60):
+        """
+        Args:
+            timeout (float, optional): Attente maximale (s) du résultat d'un calcul
+                lancé par un autre appelant. None = sans limite.
+        """
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._inflight: dict = {}  # {clé: Future}
+
+    def do(self, key, fn):
+        """Calcule `fn()` ou attend le calcul déjà en cours pour la même clé.
+
+        Args:
+            key (Hashable): Clé du calcul (ex: ("prod", "TABLE_MATCHS")).
+            fn (callable): Fonction sans argument qui calcule le résultat.
+
+        Returns:
+            Le résultat de `fn()` (celui de l'appelant en tête pour les autres).
+
+        Raises:
+            TimeoutError: Le calcul en cours n'a pas abouti dans le délai.
+            Exception: L'erreur levée par `fn()`, transmise à tous les appelants.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            # Une seule lecture en vol : on attend son résultat (borné)
+            try:
+                return future.result(timeout=self._timeout)
+            except FutureTimeoutError:
+                raise TimeoutError(
+                    f"Chargement {key!r} toujours en cours après {self._timeout} s"
+                ) from None
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            # Le prochain appel relancera une lecture (pas de mise en cache ici)
+            with self._lock:
+                del self._inflight[key]
+        return future.result()
@@ -0,0 +1,116 @@
+"""Snapshot local (Parquet) des tables Google Sheets.
+
+Les plages brutes lues sur le Google Sheet sont sauvegardées sur disque avec
+la révision du document. Au redémarrage de l'app, elles sont restaurées sans
+relire les feuilles tant que le document n'a pas été modifié.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+MANIFEST = "manifest.json"
+
+
+def read_manifest(snapshot_dir: Path) -> dict | None:
+    """Lecture du manifeste du snapshot (None si absent ou illisible)."""
+    try:
+        with open(snapshot_dir / MANIFEST, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_snapshot(
+    snapshot_dir: Path, tables: tuple, revision: str | None
+) -> dict[str, list[list]] | None:
+    """Restaure les plages brutes des tables si le snapshot est à jour.
+
+    Args:
+        snapshot_dir (Path): Dossier du snapshot.
+        tables (tuple): Noms des tables attendues.
+        revision (str | None): Révision actuelle du Google Sheet (None si inconnue).
+
+    Returns:
+        dict[str, list[list]] | None: Plages brutes par table (1re ligne = en-têtes),
+        ou None si le snapshot est absent, incomplet ou périmé.
+    """
+    if revision is None:
+        return None
+
+    manifest = read_manifest(snapshot_dir)
+    if manifest is None or manifest.get("revision") != revision:
+        return None
+    return load_stale_snapshot(snapshot_dir, tables)
+
+
+def load_stale_snapshot(snapshot_dir: Path, tables: tuple) -> dict[str, list[list]] | None:
+    """Restaure les plages brutes des tables, quelle que soit leur révision.
+
+    Sert de base à une lecture incrémentale (seules les lignes ajoutées depuis
+    sont relues sur le Google Sheet).
+
+    Returns:
+        dict[str, list[list]] | None: Plages brutes par table, ou None si le
+        snapshot est absent ou incomplet.
+    """
+    manifest = read_manifest(snapshot_dir)
+    if manifest is None or not set(tables) <= set(manifest.get("tables", [])):
+        return None
+
+    try:
+        return {table: _read_values(snapshot_dir / f"{table}.parquet") for table in tables}
+    except (OSError, ValueError):
+        return None
+
+
+def save_snapshot(
+    snapshot_dir: Path, values_by_table: dict[str, list[list]], revision: str | None
+):
+    """Sauvegarde les plages brutes des tables avec la révision du document.
+
+    Le manifeste est supprimé avant l'écriture et réécrit en dernier : un
+    snapshot interrompu en cours d'écriture n'est jamais considéré valide.
+    """
+    if revision is None:
+        return
+
+    try:
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        (snapshot_dir / MANIFEST).unlink(missing_ok=True)
+
+        for table, values in values_by_table.items():
+            _write_values(snapshot_dir / f"{table}.parquet", values)
+
+        manifest = {"revision": revision, "tables": list(values_by_table)}
+        tmp = snapshot_dir / f"{MANIFEST}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, snapshot_dir / MANIFEST)
+    except OSError:
+        # Le snapshot n'est qu'une optimisation : on ne bloque pas l'app
+        pass
+
+
+def _write_values(path: Path, values: list[list]):
+    """Écrit une plage brute (toutes les cellules en texte) au format Parquet."""
+    headers, rows = (values[0], values[1:]) if values else ([], [])
+    width = len(headers)
+    df = pd.DataFrame(
+        [[str(v) for v in (row + [""] * width)[:width]] for row in rows],
+        columns=headers,
+        dtype="string",
+    )
+    tmp = path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def _read_values(path: Path) -> list[list]:
+    """Relit une plage brute écrite par `_write_values`."""
+    df = pd.read_parquet(path).fillna("")
+    if df.columns.empty:
+        return []
+    return [list(df.columns)] + df.astype(str).values.tolist()
@@ -0,0 +1,152 @@
+"""Tables chargées en mémoire, partagées par toutes les sessions de l'app.
+
+Chaque table porte un jeton de version qui change à chaque modification.
+Les caches dérivés reçoivent ce jeton en argument : seuls ceux qui dépendent
+de la table modifiée sont recalculés après une écriture.
+
+Les tables sont publiées par instantanés immuables (read-copy-update) : une
+écriture construit un nouvel instantané à côté du courant puis le publie d'un
+bloc (une affectation). Les lecteurs n'attendent jamais de verrou et un même
+instantané donne toujours les mêmes tables, même si une écriture a lieu
+pendant qu'on le parcourt. Les DataFrames d'un instantané ne doivent pas être
+modifiés en place (travailler sur une copie).
+"""
+
+import itertools
+import threading
+from types import MappingProxyType
+
+import pandas as pd
+
+# Jetons de version uniques dans le processus (même si le store est recréé)
+_VERSIONS = itertools.count(1)
+
+
+class Snapshot:
+    """Version figée de toutes les tables, et des objets qui en sont dérivés."""
+
+    def __init__(self, tables: dict[str, pd.DataFrame], versions: dict[str, int]):
+        """
+        Args:
+            tables (dict[str, pd.DataFrame]): Tables, par nom.
+            versions (dict[str, int]): Jeton de version de chaque table.
+        """
+        self.tables = MappingProxyType(dict(tables))
+        self.versions = MappingProxyType(dict(versions))
+        self._derived = {}
+        self._lock = threading.Lock()  # calcul des objets dérivés uniquement
+
+    def get(self, table: str) -> pd.DataFrame:
+        """Table de l'instantané."""
+        return self.tables[table]
+
+    def version(self, table: str) -> int:
+        """Jeton de version de la table dans l'instantané."""
+        return self.versions[table]
+
+    def derived(self, key: str, build):
+        """Objet calculé une fois à partir de cet instantané (ex: index).
+
+        Args:
+            key (str): Nom de l'objet dérivé.
+            build (callable): Fonction `(snapshot) -> objet`, appelée au premier
+                accès seulement.
+
+        Returns:
+            L'objet dérivé, partagé en lecture seule par tous les lecteurs.
+        """
+        value = self._derived.get(key)
+        if value is None:
+            with self._lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = self._derived[key] = build(self)
+        return value
+
+
+def frozen(tables: dict[str, pd.DataFrame]) -> Snapshot:
+    """Instantané hors store (ex: saison archivée), avec ses propres jetons de version."""
+    return Snapshot(tables, {name: next(_VERSIONS) for name in tables})
+
+
+class TableStore:
+    """Instantané courant des tables en mémoire."""
+
+    def __init__(self, tables: dict[str, pd.DataFrame], normalize=None):
+        """
+        Args:
+            tables (dict[str, pd.DataFrame]): Tables chargées, par nom.
+            normalize (callable, optional): Fonction `(table, df) -> df` appliquée
+                à une table après l'ajout de lignes (ex: schéma typé).
+        """
+        self._lock = threading.Lock()  # écritures uniquement
+        self._normalize = normalize
+        self._snapshot = frozen(tables)
+
+    def snapshot(self) -> Snapshot:
+        """Instantané courant (sans verrou : à garder pour toute une lecture cohérente)."""
+        return self._snapshot
+
+    def get(self, table: str) -> pd.DataFrame:
+        """Table courante."""
+        return self._snapshot.get(table)
+
+    def version(self, table: str) -> int:
+        """Jeton de version courant de la table."""
+        return self._snapshot.version(table)
+
+    def _publish(self, changed: dict[str, pd.DataFrame]):
+        # Nouvel instantané : tables inchangées partagées, nouveaux jetons pour
+        # les tables modifiées, puis publication atomique (appel sous self._lock)
+        current = self._snapshot
+        self._snapshot = Snapshot(
+            {**current.tables, **changed},
+            {**current.versions, **{table: next(_VERSIONS) for table in changed}},
+        )
+
+    def append(self, table: str, rows: pd.DataFrame) -> pd.DataFrame:
+        """Ajoute des lignes à une table et change son jeton de version.
+
+        Args:
+            table (str): Nom de la table.
+            rows (pd.DataFrame): Lignes écrites (mêmes colonnes que la table).
+
+        Returns:
+            pd.DataFrame: La nouvelle table.
+        """
+        with self._lock:
+            current = self._snapshot.get(table)
+            merged = rows if current.empty else pd.concat([current, rows], ignore_index=True)
+            if self._normalize is not None:
+                merged = self._normalize(table, merged)
+            self._publish({table: merged})
+            return merged
+
+    def replace(self, tables: dict[str, pd.DataFrame], expected: dict[str, int]) -> list[str]:
+        """Remplace des tables rechargées depuis la source, si elles ont changé.
+
+        Une table n'est remplacée que si elle n'a pas été modifiée depuis le début
+        du rechargement (jeton égal à `expected`) : des lignes ajoutées entre-temps
+        ne sont pas perdues, elles seront reprises au rechargement suivant.
+
+        Args:
+            tables (dict[str, pd.DataFrame]): Tables rechargées, par nom.
+            expected (dict[str, int]): Jetons de version lus avant le rechargement.
+
+        Returns:
+            list[str]: Noms des tables remplacées (nouveau jeton de version).
+        """
+        if self._normalize is not None:
+            tables = {table: self._normalize(table, df) for table, df in tables.items()}
+
+        with self._lock:
+            current = self._snapshot
+            changed = {
+                table: df
+                for table, df in tables.items()
+                if current.versions.get(table) == expected.get(table)
+                and not (table in current.tables and current.tables[table].equals(df))
+            }
+            if changed:
+                self._publish(changed)
+        return list(changed)
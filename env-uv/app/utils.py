@@ -1,14 +1,22 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-from streamlit_extras.stylable_container import stylable_container
-import gspread
-from google.oauth2.service_account import Credentials
-import datetime as dt
 import yaml
 from pathlib import Path
 from datetime import datetime
 import base64
+import archive
+import backends
+import queries
+import quota
+import schema
+import sharedcache
+import sheets
+import singleflight
+import refresher
+import resilience
+import sampling
+import store
+import views
 
 # -- Définition de l'environnement
 BASE_DIR = Path(__file__).resolve().parent  # /.../app
@@ -17,11 +25,91 @@ CONFIG_PATH = PROJECT_ROOT / "config.yaml"  # /.../config.yaml
 
 with open(CONFIG_PATH, "r") as f:
     config = yaml.safe_load(f)
-env = config["env"]  # "dev" ou "prod"
+env = config["env"]  # "dev", "prod" ou "sqlite"
 
 
 # --- Accès aux google sheets
-SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    # Lecture de la date de modification du document (contrôle du snapshot)
+    "https://www.googleapis.com/auth/drive.metadata.readonly",
+]
+
+# Snapshot local des tables (restauré au démarrage si le Sheet n'a pas changé)
+SNAPSHOT_DIR = PROJECT_ROOT / ((config.get("prod") or {}).get("snapshot_dir") or "data/snapshot")
+
+# Copies Parquet des CSV en dev (relues tant que le CSV n'a pas changé ; vide = désactivé)
+CSV_SIDECAR_DIR = (config.get("dev") or {}).get("csv_sidecar_dir")
+
+# Base SQLite locale (env "sqlite")
+SQLITE_PATH = PROJECT_ROOT / ((config.get("sqlite") or {}).get("path") or "data/interclub.sqlite")
+
+# Lignes déjà connues relues (contrôle) lors d'une lecture incrémentale des onglets
+DELTA_TAIL_ROWS = (config.get("prod") or {}).get("delta_tail_rows", 5)
+# ... et relecture complète toutes les N lectures incrémentales (modifications anciennes)
+DELTA_FULL_EVERY = (config.get("prod") or {}).get("delta_full_every", 12)
+
+# Durée de vie (s) des handles Spreadsheet/Worksheet et des en-têtes en mémoire
+SHEETS_CACHE_TTL = (config.get("prod") or {}).get("sheets_cache_ttl", 600)
+
+# Source lente ou en erreur : délai (s) d'une requête, essais des lectures
+# (délai exponentiel aléatoire, durée totale bornée) et disjoncteur (échecs
+# consécutifs avant ouverture, durée d'ouverture en s ; voir resilience.py)
+HTTP_TIMEOUT = (config.get("prod") or {}).get("http_timeout", 10)
+RETRY_ATTEMPTS = (config.get("prod") or {}).get("retry_attempts", 4)
+RETRY_DEADLINE = (config.get("prod") or {}).get("retry_deadline", 20)
+BREAKER_FAILURES = (config.get("prod") or {}).get("breaker_failures", 5)
+BREAKER_RESET = (config.get("prod") or {}).get("breaker_reset", 60)
+
+# Attente maximale (s) d'un chargement des tables déjà lancé par une autre session
+LOAD_TIMEOUT = (config.get("common") or {}).get("load_timeout", 60)
+
+# Versions gardées en cache par vue dérivée (tables, requêtes SQL) : quelques
+# (club, saison) à la fois, les plus anciennes sont évincées
+CACHE_MAX_ENTRIES = (config.get("common") or {}).get("cache_max_entries", 8)
+
+# Délai (s) entre deux rechargements des tables en tâche de fond (0 = désactivé)
+# (réglage de la section de l'environnement prioritaire : ex. plus court en dev)
+REFRESH_INTERVAL = (config.get(env) or {}).get(
+    "refresh_interval", (config.get("common") or {}).get("refresh_interval", 300)
+)
+
+# Intervalle (s) de vérification des changements de données par les pages ouvertes
+# (comparaison de jetons en mémoire, sans requête vers la source ; 0 = désactivé)
+LIVE_REFRESH = (config.get("common") or {}).get("live_refresh", 10)
+
+# Échantillon stratifié des rencontres (par division et saison) pour itérer sur
+# un gros jeu de données (1 = toutes les données)
+SAMPLE_FRACTION = (config.get(env) or {}).get("sample_fraction", 1)
+SAMPLE_SEED = (config.get(env) or {}).get("sample_seed", 0)
+
+# Cache partagé entre replicas de l'app ("none", "file" ou "redis", voir sharedcache.py)
+SHARED_CACHE = (config.get("shared_cache") or {}).get("backend", "none")
+SHARED_CACHE_DIR = PROJECT_ROOT / ((config.get("shared_cache") or {}).get("path") or "data/shared_cache")
+SHARED_CACHE_URL = (config.get("shared_cache") or {}).get("url", "redis://localhost:6379/0")
+SHARED_CACHE_TTL = (config.get("shared_cache") or {}).get("ttl", 86400)
+
+# Clubs servis par l'app (registre des tenants ; vide = un seul club). Chaque
+# club a sa section de secrets.toml (SHEET_ID / chemins CSV), ses tables en
+# mémoire, ses caches et son quota d'appels à la source. Le club d'une session
+# est choisi par l'URL (`?club=aob`)
+TENANTS = config.get("tenants") or {}
+DEFAULT_CLUB = (config.get("common") or {}).get("default_club") or next(iter(TENANTS), "")
+# Appels à la source par minute et par club (0 = sans limite ; `quota_per_minute` d'un club)
+QUOTA_PER_MINUTE = (config.get("common") or {}).get("quota_per_minute", 0)
+# Connexions HTTP simultanées du client Google Sheets (un seul, partagé par les clubs)
+HTTP_POOL_SIZE = (config.get("prod") or {}).get("http_pool_size", 20)
+
+# Saisons : saison affichée par défaut ("" = la plus récente des données) et
+# dossier des saisons terminées archivées (voir archive.py)
+SEASON = (config.get("common") or {}).get("season") or ""
+ARCHIVE_DIR = PROJECT_ROOT / ((config.get("common") or {}).get("archive_dir") or "data/archive")
+
+# Budget (ms) d'import des modules d'une page au démarrage (page Diagnostics)
+IMPORT_BUDGET_MS = (config.get("common") or {}).get("import_budget_ms", 250)
+
+# Tables de données (onglets du Google Sheet / fichiers CSV en dev)
+TABLES = ("TABLE_INTERCLUB", "TABLE_MATCHS", "TABLE_PLAYERS")
 
 # Types de match
 S_TYPES = {"SH1", "SH2", "SH3", "SH4", "SD1", "SD2"}
@@ -34,104 +122,567 @@ COLD_ICON = "❄️"
 
 @st.cache_resource
 def _gspread_client():
+    # Import à la première connexion (gspread + google-auth : ~0,2 s au démarrage)
+    import gspread
+    from google.auth.transport.requests import AuthorizedSession
+    from google.oauth2.service_account import Credentials
+    from requests.adapters import HTTPAdapter
+
     creds = Credentials.from_service_account_info(st.secrets["gcp"], scopes=SCOPES)
-    return gspread.authorize(creds)
+    # Un seul client autorisé pour tous les clubs : son pool de connexions
+    # (réutilisées d'une requête à l'autre) est dimensionné pour les lectures
+    # simultanées de plusieurs clubs
+    session = AuthorizedSession(creds)
+    session.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+    client = gspread.authorize(creds, session=session)
+    # Une requête bloquée ne fait pas attendre une page indéfiniment
+    client.set_timeout(HTTP_TIMEOUT)
+    return client
 
 
-def _ws(sheet_id: str, worksheet: str):
-    """Récupère une worksheet par nom, crée si absente."""
-    gc = _gspread_client()
-    sh = gc.open_by_key(sheet_id)
-    try:
-        return sh.worksheet(worksheet)
-    except gspread.WorksheetNotFound:
-        return sh.add_worksheet(title=worksheet, rows=1000, cols=26)
+@st.cache_resource
+def _sheets(sheet_id: str) -> sheets.SheetConnection:
+    """Connexion au Google Sheet (handles et en-têtes gardés en mémoire)."""
+    return sheets.SheetConnection(_gspread_client(), sheet_id, ttl=SHEETS_CACHE_TTL)
 
 
 # def read_sheet(worksheet="Feuille1") -> pd.DataFrame:
-#     ws = _ws(st.secrets["SHEET_ID"], worksheet)
+#     ws = _sheets(st.secrets["SHEET_ID"]).worksheet(worksheet)
 #     rows = ws.get_all_records()  # suppose la 1re ligne = en-têtes
 #     return pd.DataFrame(rows)
 
 
-def to_native(v):
-    # NaN/NaT -> ""
-    if (
-        v is None
-        or (isinstance(v, float) and pd.isna(v))
-        or (isinstance(v, str) and v == "nan")
-    ):
+def current_club() -> str:
+    """Club de la session ("" si l'app ne sert qu'un club).
+
+    Choisi par le paramètre d'URL `?club=`, gardé pour la session (la
+    navigation entre pages ne le perd pas), sinon `common.default_club`.
+    """
+    if not TENANTS:
         return ""
-    if isinstance(v, (pd.Timestamp, dt.datetime, dt.date)):
-        return v.isoformat()
-    if isinstance(v, np.generic):  # numpy.int64, float64, bool_...
-        return v.item()
-    return v
+    chosen = st.query_params.get("club")
+    if chosen in TENANTS:
+        st.session_state["_club"] = chosen
+    return st.session_state.get("_club") or DEFAULT_CLUB
 
 
-@st.cache_data
-def load_table(env: str, table: str) -> pd.DataFrame:
-    """Chargement des données dev/prod, mis en cache par Streamlit."""
-    if env == "prod":
-        # SHEET_ID vient de .streamlit/secrets.toml, section [prod]
-        sheet_id = st.secrets["prod"]["SHEET_ID"]
+def _tenant(club: str) -> dict:
+    # Réglages d'un club dans le registre (vide : club unique)
+    return TENANTS.get(club) or {}
+
+
+def _club_dir(path: Path, club: str) -> Path:
+    # Dossier propre à un club (snapshots, copies Parquet, archives)
+    return path / club if club else path
+
+
+def admin_secret(club: str = "") -> str:
+    """Chemin dans secrets.toml du mot de passe administrateur du club : un
+    administrateur n'enregistre des rencontres que pour son club."""
+    return _tenant(club).get("admin_secret", "admin.password")
 
-        # à adapter : ici tu utilises _ws pour récupérer la worksheet
-        ws = _ws(sheet_id, table)  # ou autre nom d’onglet
-        rows = ws.get_all_records()  # suppose 1re ligne = en-têtes
-        df = pd.DataFrame(rows)
 
+@st.cache_resource
+def _shared_cache() -> sharedcache.SharedCache | None:
+    """Cache partagé entre replicas (None si désactivé)."""
+    return sharedcache.open_cache(
+        SHARED_CACHE,
+        SHARED_CACHE_DIR,
+        SHARED_CACHE_URL,
+        ttl=SHARED_CACHE_TTL,
+        lock_timeout=LOAD_TIMEOUT,
+        prefix=f"{(config.get('common') or {}).get('project_name', 'interclub')}:",
+    )
+
+
+@st.cache_resource
+def _breaker(env: str, club: str = "") -> resilience.CircuitBreaker:
+    """Disjoncteur de la source d'un club (partagé par ses sessions et son rechargement)."""
+    return resilience.CircuitBreaker(BREAKER_FAILURES, BREAKER_RESET)
+
+
+@st.cache_resource
+def _backend(env: str, club: str = "") -> backends.Backend:
+    """Source des tables selon l'environnement (voir `backends.py`), échantillonnée
+    si `sample_fraction` < 1 dans la section de l'environnement, et partagée entre
+    replicas si le cache partagé est activé.
+
+    Avec plusieurs clubs, chacun a sa source (section `secrets` du club dans
+    secrets.toml) et son quota d'appels."""
+    # Section de secrets.toml du club (par défaut celle de l'environnement)
+    section = _tenant(club).get("secrets", env)
+    per_minute = _tenant(club).get("quota_per_minute", QUOTA_PER_MINUTE)
+    limiter = quota.RateLimiter(per_minute, timeout=LOAD_TIMEOUT) if per_minute else None
+    if env == "prod":
+        # SHEET_ID vient de .streamlit/secrets.toml, section [prod]
+        # (quota pris à chaque requête à l'API, nouveaux essais compris)
+        backend = backends.SheetsBackend(
+            _sheets(st.secrets[section]["SHEET_ID"]),
+            _club_dir(SNAPSHOT_DIR, club),
+            tail_rows=DELTA_TAIL_ROWS,
+            full_every=DELTA_FULL_EVERY,
+            limiter=limiter,
+        )
+        # Lectures retentées (quota, 5xx, réseau) et disjoncteur
+        backend = backends.ResilientBackend(
+            backend,
+            _breaker(env, club),
+            sheets.is_transient,
+            attempts=RETRY_ATTEMPTS,
+            deadline=RETRY_DEADLINE,
+        )
     elif env == "dev":
         # TABLE_INTERCLUB / TABLE_MATCHS / TABLE_PLAYERS viennent de [dev]
-        paths = st.secrets["dev"]
-        df = pd.read_csv(paths[table], sep=";")
-
+        backend = backends.CsvBackend(
+            st.secrets[section],
+            sidecar_dir=_club_dir(PROJECT_ROOT / CSV_SIDECAR_DIR, club) if CSV_SIDECAR_DIR else None,
+        )
+    elif env == "sqlite":
+        path = _tenant(club).get("sqlite_path")
+        backend = backends.SqliteBackend(PROJECT_ROOT / path if path else SQLITE_PATH)
     else:
         raise ValueError(f"Environnement inconnu : {env}")
 
-    return df
+    if limiter is not None and env != "prod":
+        backend = backends.QuotaBackend(backend, limiter)
+    if SAMPLE_FRACTION < 1:
+        backend = backends.SampledBackend(backend, SAMPLE_FRACTION, seed=SAMPLE_SEED)
+    if _shared_cache() is not None:
+        namespace = f"{env}:{club}:{SAMPLE_FRACTION}:{SAMPLE_SEED}"
+        backend = backends.SharedCacheBackend(backend, _shared_cache(), namespace)
+    return backend
 
 
-# -- Téléchargement des données
-TABLE_INTERCLUB = load_table(env, "TABLE_INTERCLUB")
-TABLE_MATCHS = load_table(env, "TABLE_MATCHS")
-TABLE_PLAYERS = load_table(env, "TABLE_PLAYERS")
+@st.cache_resource
+def _loads() -> singleflight.SingleFlight:
+    """Chargements en cours, partagés par toutes les sessions du processus."""
+    return singleflight.SingleFlight(timeout=LOAD_TIMEOUT)
 
 
-def append_row_sheet(row: dict, worksheet="Feuille1"):
-    append_rows_sheet([row], worksheet)
+def load_tables(env: str, tables: tuple = TABLES, club: str = "") -> dict[str, pd.DataFrame]:
+    """Chargement groupé des tables (lecture directe, sans cache).
 
+    Les tables sont typées selon leur schéma (voir `schema.py`). Une seule
+    lecture par (env, club, tables) est faite à la fois : les sessions qui demandent
+    les mêmes tables pendant ce temps attendent son résultat (`LOAD_TIMEOUT`).
 
-def append_rows_sheet(rows: list[dict], worksheet="Feuille1"):
-    global TABLE_INTERCLUB, TABLE_MATCHS, TABLE_PLAYERS
+    Args:
+        env (str): Environnement ("dev", "prod" ou "sqlite").
+        tables (tuple, optional): Noms des tables à charger (toutes par défaut).
+        club (str, optional): Club (voir `current_club`).
 
-    if not rows:
+    Returns:
+        dict[str, pd.DataFrame]: Un DataFrame par nom de table.
+    """
+    def fetch():
+        raw = _backend(env, club).load_tables(tables)
+        return {table: schema.apply_schema(table, df) for table, df in raw.items()}
+
+    return _loads().do((env, club, tuple(tables)), fetch)
+
+
+@st.cache_resource
+def _table_store(env: str, club: str = "") -> store.TableStore:
+    """Tables en mémoire d'un club, partagées par toutes ses sessions (un
+    chargement groupé ; les clubs n'ont jamais de tables en commun).
+
+    Source injoignable au démarrage : les dernières tables valides (snapshot
+    local) sont servies, puis remplacées par le rechargement en tâche de fond
+    dès le retour de la source."""
+    try:
+        tables = load_tables(env, club=club)
+    except Exception:
+        last_good = _backend(env, club).last_good(TABLES)
+        if last_good is None:
+            raise
+        tables = {table: schema.apply_schema(table, df) for table, df in last_good.items()}
+        _stale_starts().add((env, club))
+    return store.TableStore(tables, normalize=schema.apply_schema)
+
+
+@st.cache_resource
+def _stale_starts() -> set:
+    """(env, club) dont les tables en mémoire viennent du snapshot local (source
+    injoignable au démarrage)."""
+    return set()
+
+
+@st.cache_resource
+def _refresher(env: str, club: str = "") -> refresher.Refresher | None:
+    """Rechargement des tables en tâche de fond (les sessions restent servies
+    par les tables en mémoire pendant la lecture)."""
+    if not REFRESH_INTERVAL:
+        return None
+    return refresher.Refresher(
+        _table_store(env, club), _backend(env, club), TABLES, REFRESH_INTERVAL
+    ).start()
+
+
+@st.cache_resource
+def _archive_snapshot(season: str, club: str = "") -> store.Snapshot:
+    """Tables d'une saison archivée (lues une fois, jamais modifiées)."""
+    tables = archive.load_season(_club_dir(ARCHIVE_DIR, club), season, TABLES)
+    return store.frozen({table: schema.apply_schema(table, df) for table, df in tables.items()})
+
+
+def _season_snapshot(live: store.Snapshot, season: str, club: str = "") -> store.Snapshot:
+    # Saison archivée : lue dans l'archive ; sinon partition de l'instantané
+    # courant, calculée une fois par instantané
+    if season in archive.archived_seasons(_club_dir(ARCHIVE_DIR, club)):
+        return _archive_snapshot(season, club)
+    return live.derived(
+        f"season:{season}", lambda snap: store.frozen(archive.split_season(snap.tables, season))
+    )
+
+
+def _current_snapshot(env: str, club: str) -> store.Snapshot:
+    # Instantané courant du store du club (rechargement en tâche de fond démarré)
+    try:
+        _refresher(env, club)
+        return _table_store(env, club).snapshot()
+    except Exception as e:
+        # Source injoignable et aucune table valide connue : page arrêtée proprement
+        st.error(f"Données indisponibles pour le moment, réessayez dans quelques instants. ({e})")
+        st.stop()
+
+
+def pin_snapshot(env: str = env, season: str | None = None) -> store.Snapshot:
+    """Fixe l'instantané des tables lu par la session jusqu'au prochain rendu.
+
+    À appeler en tête de page, avant toute lecture : toutes les tables et vues
+    lues pendant le rendu (y compris par les dialogues et fragments) viennent
+    alors du même instantané, même si une écriture ou un rechargement publie
+    une nouvelle version entre-temps.
+
+    Args:
+        env (str, optional): Environnement (celui de `config.yaml` par défaut).
+        season (str, optional): Saison affichée ("2025/26") : les tables sont
+            réduites à ses rencontres et matchs (toutes les saisons par défaut).
+
+    Returns:
+        store.Snapshot: L'instantané fixé pour la session.
+    """
+    club = current_club()
+    live = _current_snapshot(env, club)
+    pinned = live if season is None else _season_snapshot(live, season, club)
+    st.session_state[f"_snapshot_{env}"] = pinned
+    # Instantané du store d'où vient ce rendu (comparé par `live_refresh`)
+    st.session_state[f"_live_snapshot_{env}"] = live
+    return pinned
+
+
+def serving_cache(env: str = env) -> bool:
+    """Vrai si la source est injoignable et que les pages affichent les
+    dernières tables valides (disjoncteur ouvert, dernier rechargement raté ou
+    démarrage sur le snapshot local)."""
+    club = current_club()
+    if _breaker(env, club).is_open:
+        return True
+    refresh = _refresher(env, club)
+    if refresh is not None and refresh.last_error is not None:
+        return True
+    return (env, club) in _stale_starts() and (refresh is None or refresh.last_success is None)
+
+
+def cache_banner(env: str = env):
+    """Bandeau "données en cache" affiché pendant une panne de la source."""
+    if serving_cache(env):
+        st.warning(
+            "📦 Données en cache : le Google Sheet ne répond pas, les derniers "
+            "résultats connus sont affichés (mise à jour automatique à son retour).",
+        )
+
+
+def snapshot(env: str = env) -> store.Snapshot:
+    """Instantané des tables du rendu en cours (voir `pin_snapshot`), ou
+    l'instantané courant du store si la page n'en a pas fixé."""
+    pinned = st.session_state.get(f"_snapshot_{env}")
+    if pinned is not None:
+        return pinned
+    return _current_snapshot(env, current_club())
+
+
+def _live_snapshot(env: str = env) -> store.Snapshot:
+    # Instantané du store (toutes saisons) d'où vient le rendu en cours
+    live = st.session_state.get(f"_live_snapshot_{env}")
+    if live is not None:
+        return live
+    return _current_snapshot(env, current_club())
+
+
+def seasons(env: str = env) -> list[str]:
+    """Saisons disponibles (source et archives), de la plus récente à la plus ancienne."""
+    live = _live_snapshot(env).derived(
+        "seasons", lambda snap: archive.seasons_of(snap.get("TABLE_INTERCLUB"))
+    )
+    archived = archive.archived_seasons(_club_dir(ARCHIVE_DIR, current_club()))
+    return sorted(set(live) | set(archived), reverse=True)
+
+
+def current_season(env: str = env) -> str:
+    """Saison affichée par défaut : `common.season`, sinon la plus récente."""
+    if SEASON:
+        return SEASON
+    available = seasons(env)
+    return available[0] if available else sampling.season(pd.Series([pd.Timestamp.today()]))[0]
+
+
+@st.cache_data  # Relu uniquement quand une saison est archivée
+def _archived_summaries(archived: tuple, club: str) -> pd.DataFrame:
+    return archive.load_summaries(_club_dir(ARCHIVE_DIR, club))
+
+
+def season_summaries(env: str = env) -> pd.DataFrame:
+    """Bilan par saison et division (rencontres et matchs gagnés, nuls, perdus).
+
+    Les saisons archivées sont servies par leur résumé précalculé ; les saisons
+    encore dans la source sont résumées une fois par instantané.
+
+    Returns:
+        pd.DataFrame: Une ligne par (saison, division), saisons récentes d'abord.
+    """
+    club = current_club()
+    archived = archive.archived_seasons(_club_dir(ARCHIVE_DIR, club))
+    live = _live_snapshot(env)
+    frames = [_archived_summaries(tuple(archived), club)] + [
+        live.derived(
+            f"summary:{season}",
+            lambda snap, season=season: archive.summarize(archive.split_season(snap.tables, season), season),
+        )
+        for season in seasons(env)
+        if season not in archived
+    ]
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+    summaries = pd.concat(frames, ignore_index=True)
+    return summaries.sort_values(["season", "division"], ascending=[False, True], ignore_index=True)
+
+
+def archive_season(season: str, purge: bool = False, club: str | None = None) -> Path:
+    """Archive une saison terminée (voir `archive.py`).
+
+    Args:
+        season (str): Saison ("2024/25").
+        purge (bool, optional): Retire ensuite ses rencontres et matchs de la
+            source (le Google Sheet ne garde que les saisons non archivées).
+        club (str, optional): Club (celui de la session par défaut).
+
+    Returns:
+        Path: Dossier de la saison archivée.
+
+    Raises:
+        ValueError: La saison n'est pas terminée.
+    """
+    if sampling.season_bounds(season)[1] >= pd.Timestamp.today().normalize():
+        raise ValueError(f"La saison {season} n'est pas terminée")
+    club = current_club() if club is None else club
+    tables = load_tables(env, club=club)
+    path = archive.write_season(_club_dir(ARCHIVE_DIR, club), season, tables)
+    if purge:
+        ids = archive.split_season(tables, season)["TABLE_INTERCLUB"]["id"].dropna().astype(int).tolist()
+        backend = _backend(env, club)
+        backend.delete_rows("TABLE_MATCHS", "id", ids)
+        backend.delete_rows("TABLE_INTERCLUB", "id", ids)
+        # Tables en mémoire rechargées sans la saison archivée
+        current = _table_store(env, club).snapshot()
+        _table_store(env, club).replace(load_tables(env, club=club), dict(current.versions))
+    return path
+
+
+def load_table(env: str, table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+    """Chargement d'une table, servie par le store en mémoire (les tables sont
+    lues au premier accès, pas à l'import du module).
+
+    Avec `columns` ou des filtres, la vue réduite est calculée une fois par
+    instantané et partagée (lecture seule) par toutes les sessions.
+
+    Args:
+        env (str): Environnement ("dev", "prod" ou "sqlite").
+        table (str): Nom de la table.
+        columns (list, optional): Colonnes gardées (toutes par défaut).
+        **filters: `division`, `season`, `date_from`, `date_to` (voir
+            `backends.filter_bounds`).
+
+    Returns:
+        pd.DataFrame: Table typée, réduite aux lignes et colonnes demandées.
+    """
+    snap = snapshot(env)
+    if columns is None and not filters:
+        return snap.get(table)
+    key = repr(("view", table, columns, sorted(filters.items())))
+    return snap.derived(key, lambda s: backends.filter_frame(s.get(table), columns, **filters))
+
+
+def read_table(table: str, columns: list | None = None, **filters) -> pd.DataFrame:
+    """Lecture directe d'une partie d'une table à la source, sans passer par les
+    tables en mémoire : colonnes et filtres sont appliqués par le backend
+    (plages de colonnes du Sheet, Parquet/CSV partiels, WHERE SQLite).
+
+    Args:
+        table (str): Nom de la table.
+        columns (list, optional): Colonnes lues (toutes par défaut).
+        **filters: Voir `load_table`.
+
+    Returns:
+        pd.DataFrame: Table typée, réduite aux lignes et colonnes demandées.
+    """
+    return _backend(env, current_club()).read(table, columns, **filters)
+
+
+def table_version(table: str) -> int:
+    """Jeton de version d'une table, à passer aux fonctions `@st.cache_data`
+    qui en dépendent pour qu'elles soient recalculées quand elle change."""
+    return snapshot().version(table)
+
+
+# -- Accès paresseux aux tables : `utils.TABLE_MATCHS` lit la table courante du
+# store au moment de l'accès (chargement au premier accès, jamais à l'import)
+def __getattr__(name: str):
+    if name in TABLES:
+        return load_table(env, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@st.fragment(run_every=LIVE_REFRESH or None)
+def _watch_versions(tables: tuple):
+    # Relance complète de la page seulement si une table affichée a changé
+    # (versions publiées, pas celles de l'instantané fixé pour la page)
+    current = _table_store(env, current_club()).snapshot()
+    if tuple(current.version(t) for t in tables) != st.session_state.get("_live_versions"):
+        st.rerun()
+
+
+def live_refresh(tables: tuple = TABLES):
+    """Met la page à jour quand une des tables qu'elle affiche change
+    (enregistrement d'une rencontre, rechargement en tâche de fond).
+
+    Les jetons de version des tables sont relus en mémoire toutes les
+    `LIVE_REFRESH` secondes : les spectateurs voient les nouveaux résultats
+    sans interagir et sans interroger eux-mêmes le Google Sheet.
+
+    Args:
+        tables (tuple, optional): Tables dont dépend l'affichage de la page.
+    """
+    if not LIVE_REFRESH:
         return
+    # Versions (dans le store) des données affichées par ce rendu complet de la page
+    live = _live_snapshot()
+    st.session_state["_live_versions"] = tuple(live.version(t) for t in tables)
+    _watch_versions(tuple(tables))
+
+
+# -- Vues dérivées : calculées depuis un seul instantané (`_snap`, exclu de la
+# clé du cache), identifié par les versions de ses tables
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)  # Recalculé uniquement quand une des tables change
+def _player_matches(versions: tuple, _snap: store.Snapshot) -> pd.DataFrame:
+    return views.player_matches(
+        _snap.get("TABLE_MATCHS"), _snap.get("TABLE_INTERCLUB"), _snap.get("TABLE_PLAYERS")
+    )
+
+
+def table_index() -> views.TableIndex:
+    """Index des tables (rencontre -> matchs, joueur -> infos, matchs joints),
+    construit une fois par instantané et partagé en lecture seule par toutes
+    les sessions. Voir `views.TableIndex`."""
+    return snapshot().derived(
+        "table_index",
+        lambda snap: views.TableIndex(
+            snap.get("TABLE_MATCHS"), snap.get("TABLE_INTERCLUB"), snap.get("TABLE_PLAYERS")
+        ),
+    )
+
 
-    ws = _ws(st.secrets["prod"]["SHEET_ID"], worksheet)
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)  # Recalculé uniquement quand TABLE_MATCHS change
+def _match_scores(version: int, _snap: store.Snapshot) -> pd.DataFrame:
+    return views.match_scores(_snap.get("TABLE_MATCHS"))
 
-    # Récupérer / créer les headers
-    headers = ws.row_values(1)
-    if not headers:
-        # on prend les clés du premier dict comme référence
-        headers = list(rows[0].keys())
-        ws.update("A1", [headers])
 
-    # Construire la matrice de valeurs dans l'ordre des headers
-    values_matrix = []
-    for row in rows:
-        values_matrix.append([to_native(row.get(h, "")) for h in headers])
+def match_scores() -> pd.DataFrame:
+    """Scores des sets et paires d'ids de TABLE_MATCHS décodés en entiers.
 
-    # Append en une seule fois
-    ws.append_rows(values_matrix, value_input_option="USER_ENTERED")
+    Même index que TABLE_MATCHS. Voir `views.match_scores` pour le détail des colonnes.
+    """
+    snap = snapshot()
+    return _match_scores(snap.version("TABLE_MATCHS"), snap)
+
+
+def player_matches() -> pd.DataFrame:
+    """Table longue des matchs : une ligne par (match, joueur de l'AOB).
+
+    Voir `views.player_matches` pour le détail des colonnes.
+    """
+    snap = snapshot()
+    return _player_matches(tuple(snap.version(t) for t in TABLES), snap)
+
+
+# Recalculé uniquement quand une des tables change (une entrée par requête et
+# paramètres, ex: team_stats de chaque équipe)
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES * 2 * len(queries.QUERIES))
+def _query(name: str, versions: tuple, params: tuple, _snap: store.Snapshot) -> pd.DataFrame:
+    def compute():
+        return queries.run(
+            name,
+            {
+                "interclub": _snap.get("TABLE_INTERCLUB"),
+                "matchs": _snap.get("TABLE_MATCHS"),
+                "players": _snap.get("TABLE_PLAYERS"),
+                "player_matches": _player_matches(versions, _snap),
+            },
+            dict(params),
+        )
+
+    cache = _shared_cache()
+    if cache is None:
+        return compute()
+    # Clé par contenu des tables (les jetons de version sont propres au processus)
+    content = _snap.derived("fingerprint", lambda snap: sharedcache.fingerprint(snap.tables))
+    return cache.get_or_compute(f"query:{name}:{params}:{content}", compute)
+
+
+def query(name: str, **params) -> pd.DataFrame:
+    """Résultat d'une requête SQL nommée sur les tables (voir `queries.QUERIES`).
+
+    Args:
+        name (str): Nom de la requête.
+        **params: Paramètres nommés de la requête (ex: team="D2").
+
+    Returns:
+        pd.DataFrame: Résultat, mis en cache par version des tables et paramètres.
+    """
+    snap = snapshot()
+    versions = tuple(snap.version(t) for t in TABLES)
+    return _query(name, versions, tuple(sorted(params.items())), snap)
 
-    # 🔁 on recharge les données après l’écriture
-    TABLE_INTERCLUB = load_table(env, "TABLE_INTERCLUB")
-    TABLE_MATCHS = load_table(env, "TABLE_MATCHS")
-    TABLE_PLAYERS = load_table(env, "TABLE_PLAYERS")
 
-    # 🧹 On invalide tous les caches de données Streamlit
-    st.cache_data.clear()
+def append_row_sheet(row: dict, worksheet="Feuille1", raw: bool = False):
+    append_rows_sheet([row], worksheet, raw=raw)
+
+
+def append_rows_sheet(rows: list[dict], worksheet="Feuille1", raw: bool = False):
+    """Ajoute des lignes à une table (source et tables en mémoire).
+
+    Args:
+        rows (list[dict]): Lignes à ajouter (clés = noms de colonnes).
+        worksheet (str, optional): Nom de la table / de l'onglet.
+        raw (bool, optional): Écriture sans interprétation par le Google Sheet
+            (RAW : ni formules ni dates, "21/15" reste du texte ; les ids et
+            nombres, même passés en texte, sont écrits en nombres). Par défaut
+            USER_ENTERED, comme une saisie (ex: dates de TABLE_INTERCLUB).
+    """
+    if not rows:
+        return
+
+    # Écriture groupée (une requête Sheets / une transaction SQLite)
+    club = current_club()
+    new_rows = _backend(env, club).append_rows(worksheet, rows, raw=raw)
+
+    # 🔁 Fusion des lignes écrites dans la table en mémoire (sans relire la source) :
+    # seule sa version change, les caches des autres tables restent valides
+    if worksheet in TABLES:
+        _table_store(env, club).append(worksheet, new_rows)
+        # La session qui écrit relit aussitôt ses propres lignes
+        pin_snapshot()
 
 
 # Données brutes
@@ -153,17 +704,49 @@ CLASSEMENTS = [
 
 
 # Créer un dataframe à partir des dictionnaires de chaque match
+def next_id(table: str) -> int:
+    """Premier id libre d'une table (id maximal + 1).
+
+    Les ids sont pris dans la table publiée la plus récente (pas l'instantané
+    de la page). En mode échantillon, elle ne contient qu'une partie des
+    lignes : les ids sont alors lus dans la table complète de la source, par
+    `Backend.read` (colonne id seule, sans toucher au cache de `load_tables`).
+
+    Args:
+        table (str): Nom de la table (ex: "TABLE_MATCHS").
+
+    Returns:
+        int: Id de la prochaine ligne.
+    """
+    club = current_club()
+    if SAMPLE_FRACTION < 1:
+        backend = _backend(env, club)
+        while not isinstance(backend, backends.SampledBackend):
+            backend = backend.inner
+        df = backend.inner.read(table, ["id"])
+    else:
+        df = _table_store(env, club).get(table)
+    ids = pd.to_numeric(df["id"], errors="coerce").dropna()
+    return (int(ids.max()) if not ids.empty else 0) + 1
+
+
 def create_df_from_dict(dicts: list):
     rows = dicts
 
     # --- 2) Assigner des IDs uniques (évite d’avoir le même id partout)
-    start_id = (int(TABLE_MATCHS["id"].max()) if not TABLE_MATCHS.empty else 0) + 1
+    start_id = next_id("TABLE_MATCHS")
     for i, r in enumerate(rows):
         r["id"] = start_id + i
 
     # --- 3) DataFrame final
     df_matches = pd.DataFrame(rows)
 
+    # --- 4) Vainqueur de chaque match, à partir des scores décodés
+    winners = views.match_scores(df_matches)["win"]
+    df_matches["win"] = winners
+    for r, w in zip(rows, winners):
+        r["win"] = w
+
     # (optionnel) ordonner les colonnes
     cols = [
         "id",
@@ -208,7 +791,6 @@ def simple_match(table, categorie, match):
     categorie_norm = categorie.strip().upper()
     mask_div = (
         table["division"]
-        .fillna("")
         .str.split("/")
         .apply(lambda xs: any(x.strip().upper() == categorie_norm for x in xs))
     )
@@ -350,7 +932,6 @@ def double_match(table, categorie, match):
     categorie_norm = categorie.strip().upper()
     mask_div = (
         table["division"]
-        .fillna("")
         .str.split("/")
         .apply(lambda xs: any(x.strip().upper() == categorie_norm for x in xs))
     )
@@ -639,78 +1220,31 @@ def match_name_histo(name, rank, side, opacity):
 
 
 # Gestionnaire de la colonne centrale d'affichage des sets du match
-def match_score_histo(set1, set2, set3=None):
-    if set3 != "0/0":
-        c1, c2, c3 = st.columns(3, gap="small")
-        with c1:
-            st.markdown(
-                f"<div style='font-size:1rem;opacity:1;text-align:center;background-color:white; color:black; margin-bottom:15px'>{set1.replace('/','-')}</div>",
-                unsafe_allow_html=True,
-            )
-        with c2:
-            st.markdown(
-                f"<div style='font-size:1rem;opacity:1;text-align:center;background-color:white; color:black; margin-bottom:15px'>{set2.replace('/','-')}</div>",
-                unsafe_allow_html=True,
-            )
-        with c3:
-            st.markdown(
-                f"<div style='font-size:1rem;opacity:1;text-align:center;background-color:white; color:black; margin-bottom:15px'>{set3.replace('/','-')}</div>",
-                unsafe_allow_html=True,
-            )
-    else:
-        c1, c2 = st.columns(2, gap="small")
-        with c1:
-            st.markdown(
-                f"<div style='font-size:1rem;opacity:1;text-align:center;background-color:white; color:black; margin-bottom:15px'>{set1.replace('/','-')}</div>",
-                unsafe_allow_html=True,
-            )
-        with c2:
+def match_score_histo(scores):
+    """Affichage des sets joués (le 3e set seulement s'il a été joué).
+
+    Args:
+        scores (pd.Series): Ligne de `match_scores()` (points de chaque set en entiers).
+    """
+    n_sets = 3 if scores["set3_aob"] or scores["set3_opp"] else 2
+    for i, col in enumerate(st.columns(n_sets, gap="small"), start=1):
+        with col:
             st.markdown(
-                f"<div style='font-size:1rem;opacity:1;text-align:center;background-color:white; color:black; margin-bottom:15px'>{set2.replace('/','-')}</div>",
+                f"<div style='font-size:1rem;opacity:1;text-align:center;background-color:white; color:black; margin-bottom:15px'>{scores[f'set{i}_aob']}-{scores[f'set{i}_opp']}</div>",
                 unsafe_allow_html=True,
             )
 
 
 # Configuration de l'opacité des noms en fonction de la victoire/défaite
-def opacity_check(side, set1, set2, set3):
-    if side == "aob":
-        if int(set1.split("/")[0]) > int(set1.split("/")[1]) and int(
-            set2.split("/")[0]
-        ) > int(set2.split("/")[1]):
-            return 1
-        elif (
-            int(set1.split("/")[0]) < int(set1.split("/")[1])
-            and int(set2.split("/")[0]) > int(set2.split("/")[1])
-            and int(set3.split("/")[0]) > int(set3.split("/")[1])
-        ):
-            return 1
-        elif (
-            int(set1.split("/")[0]) > int(set1.split("/")[1])
-            and int(set2.split("/")[0]) < int(set2.split("/")[1])
-            and int(set3.split("/")[0]) > int(set3.split("/")[1])
-        ):
-            return 1
-        else:
-            return 0.4
-    else:
-        if int(set1.split("/")[0]) < int(set1.split("/")[1]) and int(
-            set2.split("/")[0]
-        ) < int(set2.split("/")[1]):
-            return 1
-        elif (
-            int(set1.split("/")[0]) < int(set1.split("/")[1])
-            and int(set2.split("/")[0]) > int(set2.split("/")[1])
-            and int(set3.split("/")[0]) < int(set3.split("/")[1])
-        ):
-            return 1
-        elif (
-            int(set1.split("/")[0]) > int(set1.split("/")[1])
-            and int(set2.split("/")[0]) < int(set2.split("/")[1])
-            and int(set3.split("/")[0]) < int(set3.split("/")[1])
-        ):
-            return 1
-        else:
-            return 0.4
+def opacity_check(side, scores):
+    """Opacité du nom d'un camp : 1 s'il a gagné le match (2 sets), 0.4 sinon.
+
+    Args:
+        side (str): Camp ("aob" ou "opponent").
+        scores (pd.Series): Ligne de `match_scores()`.
+    """
+    sets_won = scores["sets_aob"] if side == "aob" else scores["sets_opp"]
+    return 1 if sets_won >= 2 else 0.4
 
 
 # Gestion de l'opacité des visuels des vainqueurs/perdants
@@ -727,6 +1261,8 @@ def opacity_check_interclub(aob_score, opponent_score):
 def box_color_histo(
     date, journey, key_id, aob_team, opponent_team, aob_score, opponent_score, box_style
 ):
+    from streamlit_extras.stylable_container import stylable_container
+
     with stylable_container(key=f"box-vert-{key_id}", css_styles=box_style):
         # Ligne principale
         c1, c2 = st.columns([1, 9], gap="small")
@@ -769,75 +1305,40 @@ def box_color_histo(
 
         # Détails : s'affichent seulement si activé (slide button)
         if show:
-            df_filtered = TABLE_MATCHS[(TABLE_MATCHS["id"] == key_id)].reset_index(
-                drop=True
-            )
+            index = table_index()
+            rows = index.matchs_of(key_id)
+            df_filtered = load_table(env, "TABLE_MATCHS").iloc[rows].reset_index(drop=True)
+            scores = match_scores().iloc[rows].reset_index(drop=True)
+            # Nom(s) des joueurs de l'AOB ("NOM1/NOM2" en double)
+            aob_names = [
+                "/".join(
+                    index.player_name(p)
+                    for p in (ids.aob_id1, ids.aob_id2)
+                    if pd.notna(p)
+                )
+                for ids in scores[["aob_id1", "aob_id2"]].itertuples(index=False)
+            ]
             #
             for k in range(len(df_filtered)):
                 r1c1, r1c2, r1c3 = st.columns([4, 2, 4], gap="small")
                 with r1c1:
                     # Joueurs de l'AOB
-                    if "/" in str(df_filtered["aob_player_id"].loc[k]):
-                        p1_id = df_filtered["aob_player_id"].loc[k].split("/")[0]
-                        p2_id = df_filtered["aob_player_id"].loc[k].split("/")[1]
-                        #
-                        p1_name = (
-                            TABLE_PLAYERS[TABLE_PLAYERS["id_player"] == int(p1_id)]
-                            .reset_index(drop=True)["name"]
-                            .loc[0]
-                        )
-                        p2_name = (
-                            TABLE_PLAYERS[TABLE_PLAYERS["id_player"] == int(p2_id)]
-                            .reset_index(drop=True)["name"]
-                            .loc[0]
-                        )
-                        match_name_histo(
-                            f"{p1_name}/{p2_name}",
-                            df_filtered["aob_rank"].loc[k],
-                            "left",
-                            opacity_check(
-                                "aob",
-                                df_filtered["set1"].loc[k],
-                                df_filtered["set2"].loc[k],
-                                df_filtered["set3"].loc[k],
-                            ),
-                        )
-                    else:
-                        match_name_histo(
-                            TABLE_PLAYERS[
-                                TABLE_PLAYERS["id_player"]
-                                == df_filtered["aob_player_id"].loc[k]
-                            ]
-                            .reset_index(drop=True)["name"]
-                            .loc[0],
-                            df_filtered["aob_rank"].loc[k],
-                            "left",
-                            opacity_check(
-                                "aob",
-                                df_filtered["set1"].loc[k],
-                                df_filtered["set2"].loc[k],
-                                df_filtered["set3"].loc[k],
-                            ),
-                        )
+                    match_name_histo(
+                        aob_names[k],
+                        df_filtered["aob_rank"].loc[k],
+                        "left",
+                        opacity_check("aob", scores.loc[k]),
+                    )
                 with r1c2:
                     # Scores des différents sets
-                    match_score_histo(
-                        df_filtered["set1"].loc[k],
-                        df_filtered["set2"].loc[k],
-                        df_filtered["set3"].loc[k],
-                    )
+                    match_score_histo(scores.loc[k])
                 with r1c3:
                     # Joueurs de l'extérieur
                     match_name_histo(
                         df_filtered["opponent_player"].loc[k],
                         df_filtered["opponent_rank"].loc[k],
                         "right",
-                        opacity_check(
-                            "opponent",
-                            df_filtered["set1"].loc[k],
-                            df_filtered["set2"].loc[k],
-                            df_filtered["set3"].loc[k],
-                        ),
+                        opacity_check("opponent", scores.loc[k]),
                     )
 
 def kpi_card(title: str, value: str | float, sub=None):
@@ -860,30 +1361,6 @@ def kpi_card(title: str, value: str | float, sub=None):
         unsafe_allow_html=True,
     )
 
-def split2(series: pd.Series):
-    """Retourne (p1, p2) en découpant à '/', avec strip et '' si absent."""
-    s = series.fillna("").astype(str).str.strip()
-    parts = s.str.split("/", n=1, expand=True)
-    p1 = parts[0].fillna("").str.strip()
-    p2 = (
-        (parts[1].fillna("").str.strip())
-        if parts.shape[1] > 1
-        else pd.Series([""] * len(s), index=s.index)
-    )
-    return p1, p2
-
-def split2_col(df: pd.DataFrame, col: str):
-    """Applique split2 sur df[col] si la colonne existe, sinon sur une série vide."""
-    base = df[col] if col in df.columns else pd.Series([""] * len(df), index=df.index)
-    return split2(base)
-
-
-def join_if_two(p1: pd.Series, p2: pd.Series, sep=" / "):
-    """'A' + ' / B' seulement si p2 non vide."""
-    p1 = p1.fillna("").astype(str)
-    p2 = p2.fillna("").astype(str)
-    return p1.where(p2.eq(""), p1 + sep + p2)
-
 # Upload d'image en local
 def img_to_html(
     rel_path_from_app_dir: str,
@@ -910,77 +1387,29 @@ def best_ranks_lists(df: pd.DataFrame, player_name: str):
     """Récupération des meilleurs rangs atteints dans les 3 catégories de match par un joueur.
 
     Args:
-        df (pd.DataFrame): Jeu de données.
+        df (pd.DataFrame): Table longue des matchs (voir `player_matches`).
         player_name (str): Nom du joueur ("NOM Prénom").
     """
-    # Copie du jeu de données
-    s = df.copy()
-    
     # Classement dans l'ordre inversé
     REVERS_CLASSEMENTS = CLASSEMENTS[::-1]
 
-    # Filtrage selon le type de match
-    s["type_match"] = s["type_match"].astype(str).str.upper()
-    s["match_type"] = (
-        s["type_match"].str[0].map({"S": "Simple", "D": "Double", "M": "Mixte"})
-    )
-
-    def split2(col: pd.Series):
-        col = col.fillna("").astype(str)
-        parts = col.str.split("/", n=1, expand=True)
-
-        c1 = parts[0].str.strip()
-        # get la deuxième colonne si elle existe, sinon valeurs NaN -> remplacées par ""
-        c2 = (
-            parts[1].fillna("").str.strip()
-            if parts.shape[1] > 1
-            else pd.Series("", index=col.index)
-        )
-
-        return c1, c2
-
-    # Variables
-    p1, p2 = split2(s["player"])
-    r1, r2 = split2(s["rank"])
-
-    player = pd.Series("", index=s.index)
-    rank = pd.Series("", index=s.index)
-
-    mask1 = p1.eq(player_name)
-    player[mask1] = p1[mask1]
-    rank[mask1] = r1[mask1]
-
-    mask2 = p2.eq(player_name)
-    player[mask2] = p2[mask2]
-    rank[mask2] = r2[mask2]
-
-    unit = pd.DataFrame(
-        {
-            "player": player,
-            "rank": rank,
-            "match_type": s["match_type"],
-        }
-    )
-
-    unit = unit[
-        (unit["player"] == player_name) & (unit["rank"].isin(REVERS_CLASSEMENTS))
+    # Rangs du joueur (une ligne par match joué)
+    unit = df.loc[
+        (df["name"] == player_name) & (df["rank"].isin(REVERS_CLASSEMENTS)),
+        ["match_type", "rank"],
     ].copy()
 
     unit["rank"] = unit["rank"].astype(
         pd.CategoricalDtype(REVERS_CLASSEMENTS, ordered=True)
     )
-    
-    best = unit.groupby(["player", "match_type"], as_index=False)["rank"].max()
-
-    list_simple = best.loc[best["match_type"] == "Simple", "rank"].astype(str).tolist()
-    list_double = best.loc[best["match_type"] == "Double", "rank"].astype(str).tolist()
-    list_mixte = best.loc[best["match_type"] == "Mixte", "rank"].astype(str).tolist()
-
-    # Si la liste est vide -> "..."
-    best_simple = list_simple[0] if len(list_simple) > 0 else "..."
-    best_double = list_double[0] if len(list_double) > 0 else "..."
-    best_mixte = list_mixte[0] if len(list_mixte) > 0 else "..."
-    
+
+    best = unit.groupby("match_type", observed=True)["rank"].max()
+
+    # Si aucun match dans la catégorie -> "..."
+    best_simple = str(best["Simple"]) if "Simple" in best.index else "..."
+    best_double = str(best["Double"]) if "Double" in best.index else "..."
+    best_mixte = str(best["Mixte"]) if "Mixte" in best.index else "..."
+
     return best_simple, best_double, best_mixte
 
 def rank_stylizing(rank: str):
@@ -1230,7 +1659,7 @@ def group_rate(df: pd.DataFrame, types: dict):
     """
     sub = df[df["type_match"].isin(types)]
     total = len(sub)
-    wins = (sub["win"].str.lower() == "aob").sum()
+    wins = (sub["win"] == "aob").sum()
     return safe_rate(wins, total, pct=True, ndigits=0)  # % sans décimal
 
 def current_streak(results: list):
@@ -0,0 +1,206 @@
+"""Vues dérivées des tables, recalculées uniquement quand les données changent.
+
+Les champs composés de TABLE_MATCHS ("12/34", "D8/P10", "+5/-3") sont
+découpés une seule fois ici, au lieu d'être splittés/explosés par chaque page.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Sets d'un match ("21/15" ; "0/0" si non joué)
+SETS = ("set1", "set2", "set3")
+
+# Catégorie de match selon la 1re lettre du type ("SH1" -> Simple)
+MATCH_TYPES = {"S": "Simple", "D": "Double", "M": "Mixte"}
+
+# Colonnes composées "joueur 1/joueur 2" et leur nom dans la table longue
+PAIR_COLUMNS = {
+    "aob_player_id": "id_player",
+    "aob_rank": "rank",
+    "aob_pts": "pts",
+    "aob_grind": "grind",
+}
+
+
+def split_pair(series: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """Découpe une colonne "a/b" en deux colonnes ("" si absent)."""
+    s = series.astype("string").fillna("").str.strip()
+    # Toujours deux colonnes (même sans aucun "/" ou si la table est vide)
+    parts = s.str.split("/", n=1, expand=True).reindex(columns=[0, 1])
+    first = parts[0].astype("string").fillna("").str.strip()
+    second = parts[1].astype("string").fillna("").str.strip()
+    return first, second
+
+
+def match_scores(matchs: pd.DataFrame) -> pd.DataFrame:
+    """Scores des sets et paire de joueurs décodés en entiers (une ligne par match).
+
+    Args:
+        matchs (pd.DataFrame): Lignes de TABLE_MATCHS (colonnes set1/set2/set3
+            et aob_player_id).
+
+    Returns:
+        pd.DataFrame: Même index que `matchs`, colonnes `set1_aob`, `set1_opp`,
+        ..., `set3_opp` (int8, 0 si non joué), `sets_played`, `sets_aob`,
+        `sets_opp` (int8), `win` ("aob" / "opponent"), `aob_id1` et `aob_id2`
+        (Int32, <NA> en simple).
+    """
+    columns = {}
+    sets_played = np.zeros(len(matchs), dtype="int8")
+    sets_aob = np.zeros(len(matchs), dtype="int8")
+    sets_opp = np.zeros(len(matchs), dtype="int8")
+    for col in SETS:
+        pts = matchs[col].astype("string").str.extract(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+        aob = pd.to_numeric(pts[0], errors="coerce").fillna(0).to_numpy(dtype="int8")
+        opp = pd.to_numeric(pts[1], errors="coerce").fillna(0).to_numpy(dtype="int8")
+        columns[f"{col}_aob"], columns[f"{col}_opp"] = aob, opp
+        sets_played += (aob > 0) | (opp > 0)
+        sets_aob += aob > opp
+        sets_opp += opp > aob
+
+    columns["sets_played"] = sets_played
+    columns["sets_aob"] = sets_aob
+    columns["sets_opp"] = sets_opp
+    # Vainqueur : le plus de sets gagnés (1 set partout -> adversaire)
+    columns["win"] = np.where(sets_aob > sets_opp, "aob", "opponent")
+
+    first, second = split_pair(matchs["aob_player_id"])
+    columns["aob_id1"] = pd.to_numeric(first, errors="coerce").astype("Int32").array
+    columns["aob_id2"] = pd.to_numeric(second, errors="coerce").astype("Int32").array
+
+    return pd.DataFrame(columns, index=matchs.index)
+
+
+def player_matches(
+    matchs: pd.DataFrame, interclub: pd.DataFrame, players: pd.DataFrame
+) -> pd.DataFrame:
+    """Table longue : une ligne par (match, joueur de l'AOB).
+
+    Args:
+        matchs (pd.DataFrame): TABLE_MATCHS (typée).
+        interclub (pd.DataFrame): TABLE_INTERCLUB (typée).
+        players (pd.DataFrame): TABLE_PLAYERS (typée).
+
+    Returns:
+        pd.DataFrame: Colonnes `match` (index de la ligne dans TABLE_MATCHS),
+        `slot` (0 ou 1), `id`, `type_match`, `categorie` ("SH", "DH", "MX"...),
+        `match_type` (Simple/Double/Mixte), `win`, `date`, `division`,
+        `aob_team`, `opponent_team`, `id_player`, `name`, `rank`, `pts`,
+        `grind` et `partner` (nom du partenaire, "" en simple).
+        Triée par match puis par position du joueur dans la paire.
+    """
+    halves = {0: {}, 1: {}}
+    for col, name in PAIR_COLUMNS.items():
+        first, second = split_pair(matchs[col])
+        halves[0][name], halves[1][name] = first, second
+
+    # Un id_player en double (saisie répétée) garde sa première ligne : map exige un index unique
+    names = players.drop_duplicates("id_player").set_index("id_player")["name"]
+    for half in halves.values():
+        half["id_player"] = pd.to_numeric(half["id_player"], errors="coerce").astype("Int32")
+        half["name"] = half["id_player"].map(names).astype("string").fillna("")
+        half["pts"] = pd.to_numeric(half["pts"], errors="coerce").astype("Int32")
+        half["grind"] = pd.to_numeric(half["grind"], errors="coerce").astype("Int32")
+    halves[0]["partner"], halves[1]["partner"] = halves[1]["name"], halves[0]["name"]
+
+    base = pd.DataFrame(
+        {
+            "match": matchs.index,
+            "id": matchs["id"],
+            "type_match": matchs["type_match"],
+            "win": matchs["win"],
+        },
+        index=matchs.index,
+    )
+    long = pd.concat(
+        [
+            base.assign(slot=slot, **half)[half["id_player"].notna()]
+            for slot, half in halves.items()
+        ],
+        ignore_index=True,
+    ).sort_values(["match", "slot"], ignore_index=True)
+
+    type_match = long["type_match"].astype("string")
+    long["categorie"] = type_match.str.replace(r"\d+", "", regex=True).astype("category")
+    long["match_type"] = type_match.str[0].map(MATCH_TYPES).astype("category")
+    long["rank"] = long["rank"].astype("category")
+
+    # Infos de la rencontre (date, division, équipes)
+    long = long.merge(
+        interclub[["id", "date", "division", "aob_team", "opponent_team"]],
+        on="id",
+        how="left",
+    )
+
+    return long[
+        [
+            "match",
+            "slot",
+            "id",
+            "type_match",
+            "categorie",
+            "match_type",
+            "win",
+            "date",
+            "division",
+            "aob_team",
+            "opponent_team",
+            "id_player",
+            "name",
+            "rank",
+            "pts",
+            "grind",
+            "partner",
+        ]
+    ]
+
+
+class TableIndex:
+    """Index des tables pour des recherches en O(1) (construit par version des données).
+
+    - `match_rows` : id de rencontre -> positions des lignes dans TABLE_MATCHS ;
+    - `players` : id joueur -> {"name", "gender", "division"} ;
+    - `matchs_interclub` : TABLE_MATCHS jointe à TABLE_INTERCLUB (mêmes positions
+      de lignes que TABLE_MATCHS), et `division_rows` : division -> positions.
+    """
+
+    def __init__(
+        self, matchs: pd.DataFrame, interclub: pd.DataFrame, players: pd.DataFrame
+    ):
+        self.match_rows = {
+            int(k): v for k, v in matchs.groupby("id", observed=True).indices.items()
+        }
+        self.players = {
+            int(row.id_player): {
+                "name": row.name,
+                "gender": row.gender,
+                "division": row.division,
+            }
+            for row in players[["id_player", "name", "gender", "division"]]
+            .dropna(subset=["id_player"])
+            .itertuples(index=False)
+        }
+        self.matchs_interclub = matchs.reset_index(drop=True).merge(
+            interclub, how="left", on="id"
+        )
+        self.division_rows = {
+            str(k): v
+            for k, v in self.matchs_interclub.groupby(
+                "division", observed=True
+            ).indices.items()
+        }
+
+    def matchs_of(self, interclub_id) -> np.ndarray:
+        """Positions des matchs d'une rencontre dans TABLE_MATCHS."""
+        return self.match_rows.get(int(interclub_id), np.empty(0, dtype=int))
+
+    def team_matchs(self, division: str) -> pd.DataFrame:
+        """Matchs (joints à leur rencontre) d'une équipe."""
+        rows = self.division_rows.get(division, np.empty(0, dtype=int))
+        return self.matchs_interclub.iloc[rows]
+
+    def player_name(self, id_player, default: str = "") -> str:
+        """Nom d'un joueur à partir de son id."""
+        if pd.isna(id_player):
+            return default
+        return self.players.get(int(id_player), {}).get("name", default)
@@ -0,0 +1,118 @@
+import re
+
+import pandas as pd
+import pytest
+
+import backends
+import quota
+import resilience
+
+
+class MemoryBackend(backends.Backend):
+    """Source en mémoire : tables, révision et pannes réglées par le test."""
+
+    def __init__(self, tables, revision="r1"):
+        self.tables = dict(tables)
+        self.rev = revision
+        self.loads = 0
+        self.appended = []
+        self.error = None
+        self.failures = None
+
+    def fail(self, error, times=None):
+        """Les `times` prochains appels (tous si None) lèvent `error`."""
+        self.error, self.failures = error, times
+
+    def _check(self):
+        if self.error is None:
+            return
+        if self.failures is not None:
+            if self.failures == 0:
+                return
+            self.failures -= 1
+        raise self.error
+
+    def revision(self):
+        return self.rev
+
+    def load_tables(self, tables):
+        self.loads += 1
+        self._check()
+        return {t: self.tables[t] for t in tables}
+
+    def append_rows(self, table, rows, raw=False):
+        self.appended.append((table, rows))
+        self._check()
+        return pd.DataFrame(rows)
+
+
+class FakeSheet:
+    """Connexion Sheets simulée : onglets en mémoire, requêtes à l'API enregistrées."""
+
+    def __init__(self, tabs, revision=1):
+        self.tabs = {title: [list(row) for row in rows] for title, rows in tabs.items()}
+        self.rev = revision
+        self.requests = []
+
+    def revision(self):
+        self.requests.append("revision")
+        return str(self.rev)
+
+    def batch_get(self, titles):
+        self.requests.append("batch_get")
+        return {title: [list(row) for row in self.tabs[title]] for title in titles}
+
+    def batch_get_ranges(self, ranges, major_dimension="ROWS"):
+        self.requests.append("batch_get_ranges")
+        values = []
+        for a1 in ranges:
+            # "'TABLE'!A12:N" (jusqu'à la fin), "'TABLE'!A1:N1" ou "'TABLE'!B2:B"
+            title, first, start, last, end = re.fullmatch(
+                r"'(.+)'!([A-Z])(\d+):([A-Z])(\d*)", a1
+            ).groups()
+            cols = slice(ord(first) - ord("A"), ord(last) - ord("A") + 1)
+            rows = [row[cols] for row in self.tabs[title][int(start) - 1 : int(end) if end else None]]
+            values.append([list(col) for col in zip(*rows)] if major_dimension == "COLUMNS" else rows)
+        return values
+
+    def headers(self, title):
+        return self.tabs[title][0]
+
+    def set_headers(self, title, headers):
+        pass
+
+
+@pytest.fixture
+def memory_backend():
+    """Fabrique de sources en mémoire : `memory_backend(tables, revision="r1")`."""
+    return MemoryBackend
+
+
+@pytest.fixture
+def fake_sheet():
+    """Fabrique de connexions Sheets simulées : `fake_sheet(tabs, revision=1)`."""
+    return FakeSheet
+
+
+class Clock:
+    """Horloge simulée : `sleep` avance le temps sans attendre."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Horloge simulée à la place du module `time` des modules testés."""
+    clock = Clock()
+    for module in (backends, quota, resilience):
+        monkeypatch.setattr(module, "time", clock)
+    return clock
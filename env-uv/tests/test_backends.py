@@ -0,0 +1,163 @@
+import os
+
+import pandas as pd
+import pytest
+
+import backends
+import schema
+
+INTERCLUB = """id;date;journey;division;aob_team;opponent_team;aob_score;opponent_score
+1;2024-10-15;J1;H2;AOB35-1;Club18;3;3
+2;2024-10-16;J1;V3;AOB35-1;Club17;4;2
+3;2025-10-14;J1;H2;AOB35-1;Club12;5;1
+"""
+
+
+@pytest.fixture
+def csv_paths(tmp_path):
+    path = tmp_path / "interclub.csv"
+    path.write_text(INTERCLUB)
+    return {"TABLE_INTERCLUB": str(path)}
+
+
+# -- CsvBackend
+
+
+def test_csv_load_is_cached(csv_paths):
+    backend = backends.CsvBackend(csv_paths)
+    first = backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]
+    assert first["id"].tolist() == [1, 2, 3]
+    # Fichier inchangé : même DataFrame, sans relecture
+    assert backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"] is first
+
+
+def test_csv_reload_after_change(csv_paths):
+    backend = backends.CsvBackend(csv_paths)
+    revision = backend.revision()
+    backend.append_rows("TABLE_INTERCLUB", [{"id": 4, "date": "2025-11-02", "division": "D2"}])
+    assert backend.revision() != revision
+    assert backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]["id"].tolist() == [1, 2, 3, 4]
+
+
+def test_csv_sidecar_is_reused(csv_paths, tmp_path, monkeypatch):
+    sidecar_dir = tmp_path / "cache"
+    backends.CsvBackend(csv_paths, sidecar_dir=sidecar_dir).load_tables(("TABLE_INTERCLUB",))
+    assert len(list(sidecar_dir.glob("TABLE_INTERCLUB-*.parquet"))) == 1
+
+    # Redémarrage : la copie Parquet est relue au lieu du CSV
+    def no_csv(path, table):
+        raise AssertionError("CSV relu")
+
+    monkeypatch.setattr(backends, "read_csv", no_csv)
+    restarted = backends.CsvBackend(csv_paths, sidecar_dir=sidecar_dir)
+    assert restarted.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]["id"].tolist() == [1, 2, 3]
+    # Lecture partielle : colonnes et division passées à pyarrow
+    again = backends.CsvBackend(csv_paths, sidecar_dir=sidecar_dir)
+    df = again.read("TABLE_INTERCLUB", ["id"], division="H2")
+    assert df["id"].tolist() == [1, 3]
+
+
+def test_csv_read_filters(csv_paths):
+    backend = backends.CsvBackend(csv_paths)
+    df = backend.read("TABLE_INTERCLUB", ["id", "aob_score"], season="2024/25")
+    assert list(df.columns) == ["id", "aob_score"]
+    assert df["id"].tolist() == [1, 2]
+
+
+def test_csv_delete_rows(csv_paths):
+    backend = backends.CsvBackend(csv_paths)
+    assert backend.delete_rows("TABLE_INTERCLUB", "id", [1, 3]) == 2
+    assert backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]["id"].tolist() == [2]
+    assert not os.path.exists(csv_paths["TABLE_INTERCLUB"] + ".tmp")
+    assert backend.delete_rows("TABLE_INTERCLUB", "absente", [2]) == 0
+
+
+def test_csv_delete_is_atomic(csv_paths, monkeypatch):
+    # Échec pendant le remplacement : le CSV d'origine reste entier
+    def fail(src, dst):
+        raise OSError("disque plein")
+
+    monkeypatch.setattr(backends.os, "replace", fail)
+    with pytest.raises(OSError):
+        backends.CsvBackend(csv_paths).delete_rows("TABLE_INTERCLUB", "id", [1])
+    with open(csv_paths["TABLE_INTERCLUB"]) as f:
+        assert f.read() == INTERCLUB
+
+
+# -- SqliteBackend
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path, csv_paths):
+    backend = backends.SqliteBackend(tmp_path / "interclub.sqlite")
+    backend.import_tables(backends.CsvBackend(csv_paths).load_tables(("TABLE_INTERCLUB",)))
+    return backend
+
+
+def test_sqlite_round_trip(sqlite_backend):
+    df = sqlite_backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]
+    assert df["id"].tolist() == [1, 2, 3]
+    assert df["division"].tolist() == ["H2", "V3", "H2"]
+    sqlite_backend.append_rows("TABLE_INTERCLUB", [{"id": 4, "date": "2025-11-02", "division": "D2"}])
+    assert sqlite_backend.delete_rows("TABLE_INTERCLUB", "id", [1, 2]) == 2
+    df = sqlite_backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]
+    assert df["id"].tolist() == [3, 4]
+
+
+def test_sqlite_append_is_all_or_nothing(sqlite_backend):
+    # id 1 déjà pris (clé primaire) : aucune des deux lignes n'est écrite
+    with pytest.raises(backends.sqlite3.IntegrityError):
+        sqlite_backend.append_rows("TABLE_INTERCLUB", [{"id": 5}, {"id": 1}])
+    df = sqlite_backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]
+    assert df["id"].tolist() == [1, 2, 3]
+
+
+def test_sqlite_import_empty_cells(tmp_path):
+    # Cellules vides d'une table typée : <NA> (entiers, texte Arrow) et NaT
+    players = schema.apply_schema(
+        "TABLE_PLAYERS",
+        pd.DataFrame({"id_player": [1, 2], "name": ["Ana", None], "age": [31, None]}),
+    )
+    interclub = schema.apply_schema(
+        "TABLE_INTERCLUB", pd.DataFrame({"id": [1], "date": [None], "division": ["H2"]})
+    )
+    backend = backends.SqliteBackend(tmp_path / "club.sqlite")
+    backend.import_tables({"TABLE_PLAYERS": players, "TABLE_INTERCLUB": interclub})
+
+    tables = backend.load_tables(("TABLE_PLAYERS", "TABLE_INTERCLUB"))
+    df = schema.apply_schema("TABLE_PLAYERS", tables["TABLE_PLAYERS"])
+    assert df["name"].tolist() == ["Ana", ""]
+    assert df["age"].iloc[0] == 31 and df["age"].isna().iloc[1]
+    assert tables["TABLE_INTERCLUB"]["date"].isna().all()
+
+
+def test_sqlite_read_pushes_filters_down(sqlite_backend, monkeypatch):
+    statements = []
+    read_sql_query = backends.pd.read_sql_query
+
+    def spy(sql, db, params=None):
+        statements.append((sql, params))
+        return read_sql_query(sql, db, params=params)
+
+    monkeypatch.setattr(backends.pd, "read_sql_query", spy)
+    df = sqlite_backend.read("TABLE_INTERCLUB", ["id"], division="H2", season="2025/26")
+
+    assert df["id"].tolist() == [3]
+    assert list(df.columns) == ["id"]
+    sql, params = statements[-1]
+    # Seules les colonnes utiles sont lues, les filtres sont faits par SQLite
+    assert sql.startswith('SELECT "id", "division", "date" FROM "TABLE_INTERCLUB" WHERE')
+    assert params == ["H2", "2025-09-01", "2026-09-01"]
+
+
+def test_sqlite_read_unknown_column(sqlite_backend):
+    with pytest.raises(ValueError):
+        sqlite_backend.read("TABLE_INTERCLUB", ["absente"])
+
+
+# -- Écriture RAW (Google Sheet)
+
+
+def test_raw_cells_keep_numbers_numeric():
+    cells = ["1000", "-12", "3.5", "21/15", "1/2", "SH1", "", float("nan")]
+    assert [backends.to_raw_cell(v) for v in cells] == [1000, -12, 3.5, "21/15", "1/2", "SH1", "", ""]
@@ -0,0 +1,43 @@
+import diagnostics
+
+PAGE = """import streamlit as st
+import pandas as pd
+import streamlit.components.v1 as components
+from pathlib import Path
+from . import voisin
+import utils
+
+
+def plus_tard():
+    import plotly
+"""
+
+
+def test_page_imports(tmp_path):
+    page = tmp_path / "page.py"
+    page.write_text(PAGE)
+    # Imports de premier niveau seulement (pas ceux faits dans les fonctions)
+    assert diagnostics.page_imports(page) == [
+        "streamlit",
+        "pandas",
+        "streamlit.components.v1",
+        "pathlib",
+        "utils",
+    ]
+
+
+def test_baseline_keeps_submodules(tmp_path, monkeypatch):
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "Accueil.py").write_text(PAGE)
+    measured = []
+
+    def import_times(modules):
+        measured.extend(modules)
+        return {module: 1.0 for module in modules}
+
+    monkeypatch.setattr(diagnostics, "APP_DIR", tmp_path)
+    monkeypatch.setattr(diagnostics, "import_times", import_times)
+    report = diagnostics.measure_pages()
+    # streamlit et pandas ne sont pas comptés, leurs sous-modules restent mesurés
+    assert measured == ["streamlit.components.v1", "pathlib", "utils"]
+    assert report[0]["total_ms"] == 3.0
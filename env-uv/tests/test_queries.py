@@ -0,0 +1,136 @@
+import pandas as pd
+import pytest
+
+import queries
+import views
+from schema import apply_schema
+
+
+@pytest.fixture(scope="module")
+def tables():
+    interclub = apply_schema(
+        "TABLE_INTERCLUB",
+        pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "date": ["2024-10-15", "2024-11-05", "2024-12-01"],
+                "division": ["H2", "H2", "D2"],
+                "aob_team": ["AOB35-1", "AOB35-1", "AOB35-2"],
+                "opponent_team": ["Club18", "Club12", "Club17"],
+                "aob_score": [3, 5, 2],
+                "opponent_score": [3, 1, 4],
+            }
+        ),
+    )
+    matchs = apply_schema(
+        "TABLE_MATCHS",
+        pd.DataFrame(
+            {
+                "id": [1, 1, 2, 2, 3, 3, 3],
+                "type_match": ["SH1", "DH1", "SH1", "MX1", "SH2", "DH1", "SH1"],
+                "aob_player_id": ["10", "11/12", "10", "10/12", "11", "10/11", "12"],
+                "aob_rank": ["P10", "D8/D9", "P10", "P10/D9", "D8", "P10/D8", "D9"],
+                "aob_pts": ["1", "-1/-1", "1", "1/1", "1", "-1/-1", "-1"],
+                "aob_grind": ["8", "-3/-3", "5", "4/4", "6", "-2/-2", "-7"],
+                "win": ["aob", "opponent", "aob", "aob", "aob", "opponent", "opponent"],
+            }
+        ),
+    )
+    players = apply_schema(
+        "TABLE_PLAYERS",
+        pd.DataFrame({"id_player": [10, 11, 12], "name": ["Ana", "Bob", "Cid"]}),
+    )
+    return {
+        "interclub": interclub,
+        "matchs": matchs,
+        "players": players,
+        "player_matches": views.player_matches(matchs, interclub, players),
+    }
+
+
+def long_frame(tables):
+    # Entrée des anciennes chaînes pandas de la page Le Club
+    df = tables["player_matches"]
+    return pd.DataFrame(
+        {
+            "player": df["name"],
+            "points": df["grind"],
+            "categorie": df["categorie"].astype(str),
+            "date": df["date"],
+        }
+    )
+
+
+def test_point_eater(tables):
+    df_long = long_frame(tables)
+    totals = df_long.groupby("player")["points"].sum().sort_values(ascending=False)
+    row = queries.run("point_eater", tables).iloc[0]
+    assert (row["player"], row["points"]) == (totals.index[0], totals.iloc[0]) == ("Ana", 15)
+    assert (row["simple"], row["double"], row["mixte"]) == (13, -2, 4)
+
+
+def test_win_streak(tables):
+    df_long = long_frame(tables).sort_values(["player", "date"], kind="stable")
+    is_win = df_long["points"] > 0
+    streak = is_win.groupby(df_long["player"]).transform(lambda s: s.groupby((~s).cumsum()).cumsum())
+    best = streak.groupby(df_long["player"]).max().sort_values(ascending=False)
+    row = queries.run("win_streak", tables).iloc[0]
+    assert (row["player"], row["best_win_streak"]) == (best.index[0], best.iloc[0]) == ("Ana", 3)
+
+
+def test_match_marathoner_and_clutch(tables):
+    df_long = long_frame(tables)
+    sizes = df_long.groupby("player").size().sort_values(ascending=False)
+    row = queries.run("match_marathoner", tables).iloc[0]
+    assert (row["player"], row["nb_matchs"]) == (sizes.index[0], sizes.iloc[0])
+
+    wins = df_long[df_long["points"] > 0]
+    best = wins[wins["points"] == wins["points"].max()].iloc[0]
+    row = queries.run("clutch_performer", tables).iloc[0]
+    assert (row["player"], row["points"]) == (best["player"], best["points"]) == ("Ana", 8)
+
+
+def test_winrate_master(tables):
+    df_long = long_frame(tables)
+    rates = (
+        df_long.assign(is_win=df_long["points"] > 0)
+        .groupby("player", as_index=False)
+        .agg(nb_matchs=("is_win", "size"), winrate=("is_win", "mean"))
+    )
+    rates["winrate"] = (rates["winrate"] * 100).round(1)
+    best = rates.sort_values(["winrate", "nb_matchs"], ascending=[False, False]).iloc[0]
+    row = queries.run("winrate_master", tables).iloc[0]
+    assert row["player"] == best["player"] == "Ana"
+    assert (row["nb_matchs"], row["winrate"]) == (best["nb_matchs"], best["winrate"]) == (4, 75.0)
+    assert (row["nb_simple"], row["winrate_simple"]) == (2, 100.0)
+    assert (row["nb_double"], row["winrate_double"]) == (1, 0.0)
+    assert (row["nb_mixte"], row["winrate_mixte"]) == (1, 100.0)
+
+
+def test_club_results(tables):
+    interclub = tables["interclub"]
+    row = queries.run("club_results", tables).iloc[0]
+    assert row["wins"] == (interclub["aob_score"] > interclub["opponent_score"]).sum() == 1
+    assert row["losses"] == (interclub["aob_score"] < interclub["opponent_score"]).sum() == 1
+    assert row["draws"] == (interclub["aob_score"] == interclub["opponent_score"]).sum() == 1
+
+
+def test_club_wins_by_type(tables):
+    df = queries.run("club_wins_by_type", tables).set_index("type").sort_index()
+    matchs = tables["matchs"]
+    simple = matchs["type_match"].astype(str).str.startswith(("SH", "SD"))
+    assert df.loc["S", "played"] == simple.sum() == 4
+    assert df.loc["S", "wins"] == matchs.loc[simple, "win"].eq("aob").sum() == 3
+    assert df[["played", "wins"]].values.tolist() == [[2, 0], [1, 1], [4, 3]]
+
+
+def test_team_stats_is_parameterized(tables):
+    row = queries.run("team_stats", tables, {"team": "H2"}).iloc[0]
+    assert (row["nb_rencontres"], row["wins"], row["draws"], row["losses"]) == (2, 1, 1, 0)
+    assert row["matchs_won"] == 3
+    assert (row["played_simple"], row["won_simple"]) == (2, 2)
+    assert (row["played_double"], row["won_double"]) == (1, 0)
+    assert (row["played_mixte"], row["won_mixte"]) == (1, 1)
+    # Valeur passée en paramètre, jamais interprétée comme du SQL
+    row = queries.run("team_stats", tables, {"team": "H2' OR '1'='1"}).iloc[0]
+    assert row["nb_rencontres"] == 0
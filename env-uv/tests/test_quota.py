@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+import backends
+import quota
+import resilience
+
+
+def test_burst_then_rate(clock):
+    limiter = quota.RateLimiter(per_minute=60, burst=3)
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.now == 0
+    # Seau vide : un jeton par seconde (60 / min)
+    limiter.acquire()
+    assert clock.now == pytest.approx(1)
+
+
+def test_timeout(clock):
+    limiter = quota.RateLimiter(per_minute=1, burst=1, timeout=10)
+    limiter.acquire()
+    with pytest.raises(quota.QuotaExceeded):
+        limiter.acquire()
+    assert clock.now == 0
+
+
+class Counter:
+    def __init__(self):
+        self.taken = 0
+
+    def acquire(self):
+        self.taken += 1
+
+
+def test_backend_calls_are_charged(memory_backend):
+    limiter = Counter()
+    backend = backends.QuotaBackend(memory_backend({"A": pd.DataFrame({"id": [1]})}), limiter)
+    backend.revision()
+    backend.load_tables(("A",))
+    backend.append_rows("A", [{"id": 2}])
+    assert limiter.taken == 3
+
+
+def test_sheets_requests_are_charged_with_retries(tmp_path, fake_sheet):
+    conn = fake_sheet({"TABLE_PLAYERS": [["id_player"], [1]]})
+    batch_get, failures = conn.batch_get, [TimeoutError("lent")] * 2
+
+    def flaky_batch_get(titles):
+        if failures:
+            raise failures.pop()
+        return batch_get(titles)
+
+    conn.batch_get = flaky_batch_get
+    limiter = Counter()
+    backend = backends.ResilientBackend(
+        backends.SheetsBackend(conn, tmp_path, limiter=limiter),
+        resilience.CircuitBreaker(),
+        lambda e: isinstance(e, TimeoutError),
+        base_delay=0,
+    )
+    backend.load_tables(("TABLE_PLAYERS",))
+    # Une sonde de révision (reprise par les nouveaux essais) + 3 lectures
+    assert limiter.taken == 4
@@ -0,0 +1,82 @@
+import time
+
+import pandas as pd
+import pytest
+
+from refresher import Refresher
+from store import TableStore
+
+
+def frame(*ids):
+    return pd.DataFrame({"id": list(ids)})
+
+
+@pytest.fixture
+def source(memory_backend):
+    return memory_backend({"A": frame(1), "B": frame(1)})
+
+
+def test_replaces_only_changed_tables(source):
+    table_store = TableStore({"A": frame(1), "B": frame(1)})
+    refreshed = []
+    r = Refresher(table_store, source, ("A", "B"), interval=60, on_refresh=refreshed.append)
+    version_b = table_store.version("B")
+
+    source.tables["A"] = frame(1, 2)
+    assert r.refresh() == ["A"]
+    assert refreshed == [["A"]]
+    assert table_store.get("A")["id"].tolist() == [1, 2]
+    assert table_store.version("B") == version_b
+
+
+def test_unchanged_revision_skips_load(source):
+    r = Refresher(TableStore({"A": frame(1), "B": frame(1)}), source, ("A", "B"), interval=60)
+    r.refresh()
+    loads = source.loads
+    assert r.refresh() == []
+    assert source.loads == loads
+    assert r.last_error is None and r.last_success is not None
+
+
+def test_write_during_load_is_kept(source):
+    table_store = TableStore({"A": frame(1), "B": frame(1)})
+    r = Refresher(table_store, source, ("A", "B"), interval=60)
+    load_tables = source.load_tables
+
+    def load_with_concurrent_write(tables):
+        # Écriture de l'app pendant la lecture de la source
+        table_store.append("A", frame(9))
+        return load_tables(tables)
+
+    source.load_tables = load_with_concurrent_write
+    source.tables["A"] = frame(1, 2)
+    assert r.refresh() == []
+    assert table_store.get("A")["id"].tolist() == [1, 9]
+
+    # Révision non retenue : la table est relue au tour suivant
+    source.load_tables = load_tables
+    source.tables["A"] = frame(1, 9)
+    r.refresh()
+    assert source.loads == 2
+
+
+def test_failed_refresh_keeps_tables(source):
+    table_store = TableStore({"A": frame(1), "B": frame(1)})
+    r = Refresher(table_store, source, ("A", "B"), interval=60)
+    source.fail(ConnectionError("réseau"))
+    with pytest.raises(ConnectionError):
+        r.refresh()
+    assert table_store.get("A")["id"].tolist() == [1]
+
+
+def test_background_error_is_recorded(source):
+    r = Refresher(TableStore({"A": frame(1), "B": frame(1)}), source, ("A", "B"), interval=0.01)
+    source.fail(ConnectionError("réseau"))
+    r.start()
+    try:
+        deadline = time.monotonic() + 5
+        while r.last_error is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        r.stop()
+    assert isinstance(r.last_error, ConnectionError)
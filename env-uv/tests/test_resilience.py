@@ -0,0 +1,117 @@
+import pandas as pd
+import pytest
+
+import backends
+import resilience
+
+
+def failing(times, error=TimeoutError):
+    """Appel qui échoue `times` fois puis réussit."""
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= times:
+            raise error("panne")
+        return "ok"
+
+    fn.calls = calls
+    return fn
+
+
+def transient(e):
+    return isinstance(e, TimeoutError)
+
+
+# -- retry
+
+
+def test_retry_backoff_is_capped_and_jittered(clock, monkeypatch):
+    # Délai tiré au maximum : on voit le plafond exponentiel de chaque essai
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    fn = failing(4)
+    assert resilience.retry(fn, transient, attempts=5, base_delay=1, max_delay=3, deadline=60) == "ok"
+    assert clock.sleeps == [1, 2, 3, 3]
+
+
+def test_retry_gives_up_after_attempts(clock):
+    fn = failing(10)
+    with pytest.raises(TimeoutError):
+        resilience.retry(fn, transient, attempts=3, base_delay=0.1)
+    assert len(fn.calls) == 3
+
+
+def test_retry_does_not_retry_other_errors(clock):
+    fn = failing(1, error=KeyError)
+    with pytest.raises(KeyError):
+        resilience.retry(fn, transient)
+    assert len(fn.calls) == 1
+
+
+def test_retry_respects_deadline(clock, monkeypatch):
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    fn = failing(10)
+    with pytest.raises(TimeoutError):
+        resilience.retry(fn, transient, attempts=10, base_delay=4, max_delay=8, deadline=10)
+    # 4 s puis 8 s dépasseraient les 10 s : abandon avant le 2e délai
+    assert clock.sleeps == [4]
+
+
+# -- CircuitBreaker
+
+
+def test_breaker_opens_after_failures(clock):
+    breaker = resilience.CircuitBreaker(failures=2, reset_timeout=30)
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            breaker.call(failing(1), transient)
+    assert breaker.is_open
+
+    fn = failing(0)
+    with pytest.raises(resilience.CircuitOpen):
+        breaker.call(fn, transient)
+    assert fn.calls == []
+
+
+def test_breaker_half_open_trial(clock):
+    breaker = resilience.CircuitBreaker(failures=1, reset_timeout=30)
+    with pytest.raises(TimeoutError):
+        breaker.call(failing(1), transient)
+
+    clock.now += 30
+    # Semi-ouvert : un seul appel d'essai à la fois
+    breaker.before_call()
+    with pytest.raises(resilience.CircuitOpen):
+        breaker.before_call()
+
+    # Essai raté : réouverture pour `reset_timeout`
+    breaker.failure()
+    with pytest.raises(resilience.CircuitOpen):
+        breaker.before_call()
+
+    clock.now += 30
+    assert breaker.call(failing(0), transient) == "ok"
+    assert not breaker.is_open
+
+
+def test_breaker_ignores_non_transient_errors(clock):
+    breaker = resilience.CircuitBreaker(failures=1)
+    with pytest.raises(KeyError):
+        breaker.call(failing(1, error=KeyError), transient)
+    assert not breaker.is_open
+
+
+# -- ResilientBackend
+
+
+def test_resilient_backend_retries_reads_not_writes(clock, memory_backend):
+    source = memory_backend({"A": pd.DataFrame({"id": [1]})})
+    backend = backends.ResilientBackend(source, resilience.CircuitBreaker(), transient, base_delay=0)
+    source.fail(TimeoutError("panne"), times=1)
+    assert backend.load_tables(("A",))["A"]["id"].tolist() == [1]
+    assert source.loads == 2
+    # Une ligne ajoutée deux fois serait dupliquée : pas de nouvel essai
+    source.fail(TimeoutError("panne"), times=1)
+    with pytest.raises(TimeoutError):
+        backend.append_rows("A", [{}])
+    assert len(source.appended) == 1
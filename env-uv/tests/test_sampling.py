@@ -0,0 +1,68 @@
+import pandas as pd
+
+import backends
+import sampling
+
+
+def tables(n=20):
+    # n rencontres en H2 (saison 2024/25) et une en D2 (saison 2025/26)
+    interclub = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(1, n + 2)],
+            "date": ["2024-10-15"] * n + ["2025-10-14"],
+            "division": ["H2"] * n + ["D2"],
+        }
+    )
+    matchs = pd.DataFrame(
+        {
+            "id": [str(i) for i in range(1, n + 2) for _ in range(2)],
+            "aob_player_id": [p for i in range(1, n + 2) for p in (str(i), f"{i}/{i + 100}")],
+        }
+    )
+    players = pd.DataFrame({"id_player": [str(i) for i in range(1, 202)]})
+    return {"TABLE_INTERCLUB": interclub, "TABLE_MATCHS": matchs, "TABLE_PLAYERS": players}
+
+
+def test_full_fraction_keeps_everything():
+    source = tables()
+    assert sampling.sample_tables(source, 1) is source
+
+
+def test_sample_is_stratified_and_consistent():
+    sample = sampling.sample_tables(tables(), 0.25, seed=1)
+    interclub = sample["TABLE_INTERCLUB"]
+    kept = set(interclub["id"])
+
+    # 25 % des 20 rencontres H2, et au moins une par (division, saison)
+    assert (interclub["division"] == "H2").sum() == 5
+    assert (interclub["division"] == "D2").sum() == 1
+    # Rencontres entières, et seulement les joueurs qu'elles référencent
+    assert set(sample["TABLE_MATCHS"]["id"]) == kept
+    assert len(sample["TABLE_MATCHS"]) == 2 * len(kept)
+    expected_players = {int(i) for i in kept} | {int(i) + 100 for i in kept}
+    assert set(sample["TABLE_PLAYERS"]["id_player"].astype(int)) == expected_players
+
+
+def test_sample_is_stable():
+    # Même graine : même échantillon d'un rechargement à l'autre
+    first = sampling.sample_tables(tables(20), 0.5, seed=3)["TABLE_INTERCLUB"]["id"]
+    again = sampling.sample_tables(tables(20), 0.5, seed=3)["TABLE_INTERCLUB"]["id"]
+    assert first.tolist() == again.tolist()
+    other_seed = sampling.sample_tables(tables(20), 0.5, seed=4)["TABLE_INTERCLUB"]["id"]
+    assert set(other_seed) != set(first)
+
+
+def test_season():
+    dates = pd.to_datetime(pd.Series(["2025-08-31", "2025-09-01", None]))
+    assert sampling.season(dates).tolist() == ["2024/25", "2025/26", ""]
+    assert sampling.season_bounds("2025/26") == (pd.Timestamp(2025, 9, 1), pd.Timestamp(2026, 8, 31))
+
+
+def test_sampled_backend_writes_to_full_source(memory_backend):
+    inner = memory_backend(tables())
+    backend = backends.SampledBackend(inner, 0.25)
+    assert len(backend.load_tables(("TABLE_INTERCLUB",))["TABLE_INTERCLUB"]) == 6
+    # Ids des nouvelles lignes pris dans la source complète (voir utils.next_id)
+    assert backend.inner is inner
+    backend.append_rows("TABLE_MATCHS", [{"id": "22"}])
+    assert inner.appended == [("TABLE_MATCHS", [{"id": "22"}])]
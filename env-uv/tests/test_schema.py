@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from schema import apply_schema
+
+
+def raw_matchs():
+    # Comme lu par read_csv : cellules vides -> NaN, entiers en float
+    return pd.DataFrame(
+        {
+            "id": [1.0, 2.0, np.nan],
+            "type_match": ["sh1", "DD1", np.nan],
+            "aob_player_id": [12.0, np.nan, 7.0],
+            "set1": ["21/15", "0/0", np.nan],
+            "win": ["AOB", "Opponent", np.nan],
+            "extra": ["x", "y", "z"],
+        }
+    )
+
+
+def test_types_and_missing_cells():
+    df = apply_schema("TABLE_MATCHS", raw_matchs())
+
+    assert str(df["id"].dtype) == "Int32"
+    assert df["id"].tolist()[:2] == [1, 2] and df["id"].isna().iloc[2]
+    # Texte vide comme dans le Google Sheet, ids lus en float sans ".0"
+    assert df["aob_player_id"].tolist() == ["12", "", "7"]
+    assert df["set1"].tolist() == ["21/15", "0/0", ""]
+    assert df["type_match"].tolist() == ["SH1", "DD1", ""]
+    assert df["win"].tolist() == ["aob", "opponent", ""]
+    assert df["type_match"].dtype == "category"
+    # Colonne hors schéma conservée telle quelle
+    assert df["extra"].tolist() == ["x", "y", "z"]
+
+
+def test_same_values_as_page_conversions():
+    # Anciennes conversions faites par les pages à chaque rerun
+    raw = pd.DataFrame(
+        {"id": ["1", "2", "3"], "date": ["2024-10-15", "", "pas une date"], "aob_score": ["3", "", "x"]}
+    )
+    df = apply_schema("TABLE_INTERCLUB", raw)
+
+    pd.testing.assert_series_equal(
+        df["date"], pd.to_datetime(raw["date"], errors="coerce"), check_names=False
+    )
+    pd.testing.assert_series_equal(
+        df["aob_score"].astype("Float64"),
+        pd.to_numeric(raw["aob_score"], errors="coerce").astype("Float64"),
+        check_names=False,
+    )
+    assert df["id"].astype(str).tolist() == raw["id"].astype(str).tolist()
+
+
+def test_idempotent():
+    once = apply_schema("TABLE_MATCHS", raw_matchs())
+    twice = apply_schema("TABLE_MATCHS", once)
+    pd.testing.assert_frame_equal(once, twice)
+
+
+def test_unknown_table_and_empty_frame_unchanged():
+    df = pd.DataFrame({"id": ["1"]})
+    assert apply_schema("TABLE_AUTRE", df) is df
+    empty = pd.DataFrame()
+    assert apply_schema("TABLE_MATCHS", empty) is empty
@@ -0,0 +1,74 @@
+import os
+import time
+
+import pandas as pd
+
+import backends
+import sharedcache
+
+
+def test_file_cache_shared_between_instances(tmp_path):
+    # Deux replicas sur le même dossier : le second reprend la valeur du premier
+    first, second = sharedcache.FileCache(tmp_path), sharedcache.FileCache(tmp_path)
+    computed = []
+    assert first.get_or_compute("k", lambda: computed.append(1) or {"a": 1}) == {"a": 1}
+    assert second.get_or_compute("k", lambda: computed.append(2) or {"a": 2}) == {"a": 1}
+    assert computed == [1]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_file_cache_expires(tmp_path):
+    cache = sharedcache.FileCache(tmp_path, ttl=60)
+    cache.set("k", 1)
+    path = cache._path("k")
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert cache.get("k") is None
+    assert not path.exists()
+
+
+def test_stale_lock_is_ignored(tmp_path):
+    # Verrou laissé par un replica arrêté pendant un calcul
+    cache = sharedcache.FileCache(tmp_path, lock_timeout=1)
+    lock = cache._path("k", ".lock")
+    lock.touch()
+    old = time.time() - 10
+    os.utime(lock, (old, old))
+    assert cache.get_or_compute("k", lambda: "calculé") == "calculé"
+    assert not lock.exists()
+
+
+def test_unreadable_entry_counts_as_missing(tmp_path):
+    cache = sharedcache.FileCache(tmp_path)
+    cache._path("k").write_bytes(b"pas du pickle")
+    assert cache.get("k") is None
+
+
+def test_fingerprint_depends_on_content():
+    a = {"T": pd.DataFrame({"id": [1, 2]})}
+    assert sharedcache.fingerprint(a) == sharedcache.fingerprint({"T": pd.DataFrame({"id": [1, 2]})})
+    assert sharedcache.fingerprint(a) != sharedcache.fingerprint({"T": pd.DataFrame({"id": [1, 3]})})
+
+
+def test_backend_shares_tables_per_revision(tmp_path, memory_backend):
+    cache = sharedcache.FileCache(tmp_path)
+    sources = [memory_backend({"T": pd.DataFrame({"id": [i]})}) for i in (1, 2)]
+    replicas = [backends.SharedCacheBackend(s, cache, "prod:") for s in sources]
+
+    replicas[0].load_tables(("T",))
+    # Même révision : le second replica reprend les tables lues par le premier
+    assert replicas[1].load_tables(("T",))["T"]["id"].tolist() == [1]
+    assert [s.loads for s in sources] == [1, 0]
+
+    # Nouvelle révision : un replica relit la source
+    sources[1].rev = "r2"
+    assert replicas[1].load_tables(("T",))["T"]["id"].tolist() == [2]
+    assert sources[1].loads == 1
+
+
+def test_backend_without_revision_reads_source(tmp_path, memory_backend):
+    source = memory_backend({"T": pd.DataFrame({"id": [1]})}, revision=None)
+    backend = backends.SharedCacheBackend(source, sharedcache.FileCache(tmp_path), "sqlite:")
+    backend.load_tables(("T",))
+    backend.load_tables(("T",))
+    assert source.loads == 2
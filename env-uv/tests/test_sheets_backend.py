@@ -0,0 +1,114 @@
+import pytest
+
+import backends
+from refresher import Refresher
+from store import TableStore
+
+HEADER = ["id_player", "name"]
+
+
+@pytest.fixture
+def conn(fake_sheet):
+    return fake_sheet({"TABLE_PLAYERS": [HEADER] + [[i, f"J{i}"] for i in range(1, 9)]})
+
+
+def sheets_backend(conn, tmp_path, **options):
+    # Révision sondée à chaque chargement (pas gardée `revision_ttl` secondes)
+    return backends.SheetsBackend(conn, tmp_path, revision_ttl=0, **options)
+
+
+def load(backend):
+    return backend.load_tables(("TABLE_PLAYERS",))["TABLE_PLAYERS"]
+
+
+def change(conn, rows=(), edits=()):
+    """Nouvelle révision du document : lignes ajoutées et cellules modifiées."""
+    conn.tabs["TABLE_PLAYERS"] += [list(row) for row in rows]
+    for row, name in edits:
+        conn.tabs["TABLE_PLAYERS"][row][1] = name
+    conn.rev += 1
+    conn.requests.clear()
+
+
+def test_appended_tail_is_fetched_alone(conn, tmp_path):
+    backend = sheets_backend(conn, tmp_path, tail_rows=3)
+    load(backend)
+    change(conn, rows=[[9, "J9"], [10, "J10"]])
+
+    df = load(backend)
+    assert df["id_player"].tolist() == list(range(1, 11))
+    # En-têtes + lignes de contrôle + nouvelles lignes, sans relire l'onglet
+    assert conn.requests == ["revision", "batch_get_ranges"]
+
+
+def test_unchanged_revision_reads_nothing(conn, tmp_path):
+    backend = sheets_backend(conn, tmp_path)
+    load(backend)
+    conn.requests.clear()
+    load(backend)
+    assert conn.requests == ["revision"]
+
+
+def test_edit_in_control_window_rereads_tab(conn, tmp_path):
+    backend = sheets_backend(conn, tmp_path, tail_rows=3)
+    load(backend)
+    # Ligne 7 parmi les 3 dernières lignes connues
+    change(conn, rows=[[9, "J9"]], edits=[(7, "Modifié")])
+
+    df = load(backend)
+    assert df["name"].tolist()[6] == "Modifié"
+    assert conn.requests == ["revision", "batch_get_ranges", "batch_get"]
+
+
+def test_full_reread_every_full_every_deltas(conn, tmp_path):
+    backend = sheets_backend(conn, tmp_path, full_every=2)
+    load(backend)
+    reads = []
+    for i in range(9, 12):
+        change(conn, rows=[[i, f"J{i}"]])
+        load(backend)
+        reads.append("batch_get" in conn.requests)
+    # Le chargement initial ne compte pas : deux lectures incrémentales, puis complète
+    assert reads == [False, False, True]
+
+
+def test_edit_above_control_window_rereads_tab(conn, tmp_path):
+    backend = sheets_backend(conn, tmp_path, tail_rows=3)
+    load(backend)
+    # Modification en place d'une ligne ancienne, sans ligne ajoutée
+    change(conn, edits=[(2, "Modifié")])
+
+    df = load(backend)
+    assert df["name"].tolist()[1] == "Modifié"
+    assert "batch_get" in conn.requests
+
+
+def test_read_leaves_loaded_tables_alone(fake_sheet, tmp_path):
+    # Lecture de la colonne id (utils.next_id en mode échantillon)
+    matchs = [["id", "type_match"], [1, "SH1"], [1, "DH1"], [2, "SH1"]]
+    conn = fake_sheet({"TABLE_PLAYERS": [HEADER, [1, "J1"]], "TABLE_MATCHS": matchs})
+    tables = ("TABLE_PLAYERS", "TABLE_MATCHS")
+    backend = sheets_backend(conn, tmp_path)
+    backend.load_tables(tables)
+    change(conn, rows=[[2, "J2"]])
+
+    assert backend.read("TABLE_MATCHS", ["id"])["id"].tolist() == [1, 1, 2]
+    # La révision du document n'est pas marquée comme lue : le joueur ajouté arrive
+    assert backend.load_tables(tables)["TABLE_PLAYERS"]["id_player"].tolist() == [1, 2]
+    # Snapshot complet : restauré au redémarrage sans relire le Sheet
+    conn.requests.clear()
+    restarted = sheets_backend(conn, tmp_path)
+    assert len(restarted.load_tables(tables)["TABLE_MATCHS"]) == 3
+    assert conn.requests == ["revision"]
+
+
+def test_one_revision_request_per_refresh(conn, tmp_path, clock):
+    backend = backends.SheetsBackend(conn, tmp_path)
+    tables = ("TABLE_PLAYERS",)
+    r = Refresher(TableStore(backend.load_tables(tables)), backend, tables, interval=60)
+    change(conn, rows=[[9, "J9"]])
+    clock.now += 60  # sonde du chargement initial expirée
+
+    assert r.refresh() == ["TABLE_PLAYERS"]
+    # Sonde du Refresher réutilisée par load_tables
+    assert conn.requests == ["revision", "batch_get_ranges"]
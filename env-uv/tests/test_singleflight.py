@@ -0,0 +1,90 @@
+import threading
+
+import pytest
+
+from singleflight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight(timeout=5)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "tables"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", load)))
+    leader.start()
+    started.wait(5)
+    # Les suiveurs arrivent pendant la lecture du premier appelant
+    followers = [
+        threading.Thread(target=lambda: results.append(flight.do("k", load))) for _ in range(3)
+    ]
+    for t in followers:
+        t.start()
+    release.set()
+    for t in [leader, *followers]:
+        t.join(5)
+
+    assert calls == [1]
+    assert results == ["tables"] * 4
+
+
+def test_error_is_raised_to_every_caller():
+    flight = SingleFlight(timeout=5)
+    started, release = threading.Event(), threading.Event()
+
+    def load():
+        started.set()
+        release.wait(5)
+        raise ValueError("source en panne")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("k", load)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=call)
+    follower.start()
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert errors == ["source en panne"] * 2
+
+
+def test_follower_times_out():
+    flight = SingleFlight(timeout=0.05)
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "tables"
+
+    leader = threading.Thread(target=lambda: flight.do("k", slow))
+    leader.start()
+    started.wait(5)
+    try:
+        with pytest.raises(TimeoutError):
+            flight.do("k", lambda: "jamais appelé")
+    finally:
+        release.set()
+        leader.join(5)
+
+
+def test_next_call_reloads():
+    # Pas de mise en cache : une fois le calcul terminé, l'appel suivant relit
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
@@ -0,0 +1,66 @@
+import pandas as pd
+
+from store import TableStore, frozen
+
+
+def frame(*ids):
+    return pd.DataFrame({"id": list(ids)})
+
+
+def test_append_publishes_new_snapshot():
+    table_store = TableStore({"A": frame(1), "B": frame(1)})
+    before = table_store.snapshot()
+
+    table_store.append("A", frame(2))
+
+    after = table_store.snapshot()
+    assert after.get("A")["id"].tolist() == [1, 2]
+    assert after.version("A") != before.version("A")
+    assert after.version("B") == before.version("B")
+    assert after.get("B") is before.get("B")
+    # L'ancien instantané ne change pas pendant qu'on le lit
+    assert before.get("A")["id"].tolist() == [1]
+
+
+def test_append_to_empty_table_normalizes():
+    calls = []
+
+    def normalize(table, df):
+        calls.append(table)
+        return df.astype({"id": "Int32"})
+
+    table_store = TableStore({"A": frame()}, normalize=normalize)
+    assert str(table_store.append("A", frame(1))["id"].dtype) == "Int32"
+    assert calls == ["A"]
+
+
+def test_replace_skips_equal_and_modified_tables():
+    table_store = TableStore({"A": frame(1), "B": frame(1), "C": frame(1)})
+    snap = table_store.snapshot()
+    expected = {table: snap.version(table) for table in ("A", "B", "C")}
+
+    # "C" est modifiée par une écriture pendant le rechargement
+    table_store.append("C", frame(2))
+    replaced = table_store.replace({"A": frame(1, 2), "B": frame(1), "C": frame(1, 3)}, expected)
+
+    assert replaced == ["A"]
+    assert table_store.get("B") is snap.get("B")
+    assert table_store.get("C")["id"].tolist() == [1, 2]
+
+
+def test_derived_is_built_once_per_snapshot():
+    snap = frozen({"A": frame(1)})
+    builds = []
+
+    def build(s):
+        builds.append(s)
+        return len(s.get("A"))
+
+    assert snap.derived("n", build) == 1
+    assert snap.derived("n", build) == 1
+    assert builds == [snap]
+
+
+def test_frozen_versions_are_unique():
+    first, second = frozen({"A": frame(1)}), frozen({"A": frame(1)})
+    assert first.version("A") != second.version("A")
@@ -0,0 +1,126 @@
+import pandas as pd
+
+import views
+from schema import apply_schema
+
+
+def tables():
+    matchs = apply_schema(
+        "TABLE_MATCHS",
+        pd.DataFrame(
+            {
+                "id": [1, 1, 2],
+                "type_match": ["SH1", "DD1", "MX1"],
+                "aob_player_id": ["10", "11/12", "12 / 13"],
+                "aob_rank": ["P10", "D8/D9", "D9/P11"],
+                "aob_pts": ["5", "3/-2", "-4/1"],
+                "aob_grind": ["8", "2/2", "-1/-1"],
+                "win": ["aob", "aob", "opponent"],
+            }
+        ),
+    )
+    interclub = apply_schema(
+        "TABLE_INTERCLUB",
+        pd.DataFrame(
+            {
+                "id": [1, 2],
+                "date": ["2024-10-15", "2024-11-05"],
+                "division": ["H2", "H2"],
+                "aob_team": ["AOB35-1", "AOB35-1"],
+                "opponent_team": ["Club18", "Club12"],
+            }
+        ),
+    )
+    players = apply_schema(
+        "TABLE_PLAYERS",
+        pd.DataFrame({"id_player": [10, 11, 12, 13], "name": ["Ana", "Bob", "Cid", "Dan"]}),
+    )
+    return matchs, interclub, players
+
+
+def test_split_pair():
+    first, second = views.split_pair(pd.Series(["1/2", " 3 ", "", None]))
+    assert first.tolist() == ["1", "3", "", ""]
+    assert second.tolist() == ["2", "", "", ""]
+
+
+def test_player_matches_matches_explode():
+    matchs, interclub, players = tables()
+    long = views.player_matches(matchs, interclub, players)
+
+    # Ancien calcul des pages : split("/") puis explode, index aligné
+    exploded = pd.DataFrame(
+        {
+            "player": matchs["aob_player_id"].astype(str).str.split("/").explode().str.strip(),
+            "points": matchs["aob_pts"].astype(str).str.split("/").explode().str.strip().astype(int),
+        }
+    )
+    assert long["match"].tolist() == exploded.index.tolist()
+    assert long["id_player"].astype(str).tolist() == exploded["player"].tolist()
+    assert long["pts"].tolist() == exploded["points"].tolist()
+
+
+def test_player_matches_columns():
+    long = views.player_matches(*tables())
+
+    assert long["name"].tolist() == ["Ana", "Bob", "Cid", "Cid", "Dan"]
+    assert long["partner"].tolist() == ["", "Cid", "Bob", "Dan", "Cid"]
+    assert long["categorie"].astype(str).tolist() == ["SH", "DD", "DD", "MX", "MX"]
+    assert long["match_type"].astype(str).tolist() == ["Simple", "Double", "Double", "Mixte", "Mixte"]
+    assert long["rank"].astype(str).tolist() == ["P10", "D8", "D9", "D9", "P11"]
+    assert long["opponent_team"].tolist() == ["Club18", "Club18", "Club18", "Club12", "Club12"]
+    assert long["grind"].tolist() == [8, 2, 2, -1, -1]
+
+
+def old_winner(set1, set2, set3):
+    """Ancien calcul du vainqueur (page Enregistrement) sur les sets en texte."""
+    aob = [int(s.split("/")[0]) for s in (set1, set2, set3)]
+    opp = [int(s.split("/")[1]) for s in (set1, set2, set3)]
+    if set3 == "0/0":
+        return "aob" if aob[0] > opp[0] and aob[1] > opp[1] else "opponent"
+    return "aob" if aob[2] > opp[2] else "opponent"
+
+
+def test_match_scores():
+    sets = [
+        ("21/15", "21/18", "0/0"),
+        ("15/21", "21/19", "21/12"),
+        ("21/10", "18/21", "25/27"),
+        ("12/21", "10/21", "0/0"),
+        # Match arrêté à 1 set partout : victoire adverse
+        ("21/15", "15/21", "0/0"),
+    ]
+    matchs = pd.DataFrame(
+        {
+            "set1": [s[0] for s in sets],
+            "set2": [s[1] for s in sets],
+            "set3": [s[2] for s in sets],
+            "aob_player_id": ["10", "11/12", "12/13", "", "13"],
+        }
+    )
+    scores = views.match_scores(matchs)
+
+    assert scores["win"].tolist() == [old_winner(*s) for s in sets]
+    assert scores["win"].tolist()[-1] == "opponent"
+    assert scores["set3_opp"].tolist() == [0, 12, 27, 0, 0]
+    assert scores["set1_aob"].dtype == "int8"
+    assert scores["sets_played"].tolist() == [2, 3, 3, 2, 2]
+    assert scores["sets_aob"].tolist() == [2, 2, 1, 0, 1]
+    assert scores["sets_opp"].tolist() == [0, 1, 2, 2, 1]
+    assert scores["aob_id1"].tolist()[:3] == [10, 11, 12]
+    assert scores["aob_id2"].isna().tolist() == [True, False, False, True, True]
+    assert str(scores["aob_id2"].dtype) == "Int32"
+
+
+def test_match_scores_empty():
+    scores = views.match_scores(pd.DataFrame(columns=["set1", "set2", "set3", "aob_player_id"]))
+    assert scores.empty and "sets_aob" in scores
+
+
+def test_player_matches_duplicated_player():
+    matchs, interclub, players = tables()
+    # Joueur saisi deux fois dans TABLE_PLAYERS : une seule ligne par match
+    players = pd.concat([players, players.iloc[[1]]], ignore_index=True)
+    long = views.player_matches(matchs, interclub, players)
+    assert len(long) == 5
+    assert long["name"].tolist() == ["Ana", "Bob", "Cid", "Cid", "Dan"]